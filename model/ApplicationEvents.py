@@ -19,12 +19,13 @@ from enum import Enum
 from copy import deepcopy
 from collections import OrderedDict
 from os import environ
-from sqlite3 import connect, Binary
+from sqlite3 import Binary
 from pickle import dumps, loads
 
 from tkinter import Tk, messagebox
 
 from model.Installation import USER_DATA_FOLDER
+from model.ConnectionManager import ConnectionManager
 
 PROGRAM_TITLE = "Application Events - Transparent"
 INSTALLING  = True
@@ -133,19 +134,23 @@ class EventManager:
         """
         pass
 
+    @staticmethod
+    def getDBPath():
+        return environ['HOME']+'/'+USER_DATA_FOLDER+'/'+EventManager.__DBFile
+
     @staticmethod
     def createAppActivityDB():
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+EventManager.__DBFile)
-        cursor = connection.cursor()
+        with ConnectionManager.transaction(EventManager.getDBPath()) as cursor:
+            EventManager.createTables(cursor)
+
+    @staticmethod
+    def createTables(cursor):
         #   cursor.execute("CREATE TABLE `Events` ( `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, `timeStamp` TEXT NOT NULL, `info` BLOB NOT NULL )")
         #   cursor.execute("CREATE TABLE `Debug` ( `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, `timeStamp` TEXT NOT NULL, `info` BLOB NOT NULL )")
         cursor.execute("""CREATE TABLE `Events` ( `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
                             `timeStamp` TEXT NOT NULL, `info` BLOB NOT NULL )""")
         cursor.execute("""CREATE TABLE `Debug` ( `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
                             `timeStamp` TEXT NOT NULL, `info` BLOB NOT NULL )""")
-        connection.commit()
-        cursor.close()
-        connection.close()
 
     @staticmethod
     def commit():
@@ -154,8 +159,7 @@ class EventManager:
         :param self:
         :return:
         """
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+EventManager.__DBFile)
-        cursor = connection.cursor()
+        rows = []
         for timeStamp, event in EventManager.record.items():
             info = dumps(event)
             timeStampString = "{year:4d}/{month:2d}/{day:2d}" \
@@ -163,19 +167,18 @@ class EventManager:
                    "{hour:2d}:{minute:2d}:{second:2d}.{micro:6d}" \
                        .format(hour=timeStamp.hour, minute=timeStamp.minute, second=timeStamp.second,
                                micro=timeStamp.microsecond).replace(' ', '0')
-            cursor.execute('''INSERT INTO Events( timeStamp, info ) VALUES( ?, ?)''', (timeStampString, Binary(info)))
-        connection.commit()
-        cursor.close()
-        connection.close()
+            rows.append((timeStampString, Binary(info)))
+        with ConnectionManager.transaction(EventManager.getDBPath()) as cursor:
+            cursor.executemany('''INSERT INTO Events( timeStamp, info ) VALUES( ?, ?)''', rows)
         EventManager.record     = OrderedDict()
 
     @staticmethod
     def getDBrecords():
         records = OrderedDict()
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+EventManager.__DBFile)
-        cursor = connection.cursor()
+        cursor = ConnectionManager.getConnection(EventManager.getDBPath()).cursor()
         cursor.execute('''SELECT * FROM Events''')
         rows = cursor.fetchall()
+        cursor.close()
         for row in rows:
             records[row[1]] = loads(row[2])
             #   print(str(row[1]) + ":\t" + str(records[row[1]]))
@@ -0,0 +1,285 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/CaptureStore.py
+#   Purpose:        Content addressed storage of saved console output, so that repeated captures of the same
+#                   command store only what changed between them, compressed.
+#   Development:
+#       ConsoleMenuBar.redirectOutput() used to write each capture in full to its own .cmd_out file, so a dpkg -l
+#       or ps -lf -A saved every day stored the same text every day.  A capture is now split into chunks on line
+#       boundaries chosen by the content of the lines, not by their position, so a line added or removed moves
+#       only the boundaries next to it and the chunks around it are the same as in the last capture.  Each chunk
+#       is stored once, zlib compressed, keyed by the SHA-256 of its text, in the CaptureChunks table, and the
+#       capture itself is a row of Captures listing its chunks in order, both in USER_CONSOLE_OUT_DB, so that a
+#       save is one transaction.  The consoleOutArchive.index entry is unchanged except that its fileName is the
+#       capture's name, ending in CAPTURE_EXTENSION.  read() also reads the old .cmd_out files.
+#
+#       A chunk ends after a line whose CRC is 0 in its low CHUNK_MASK_BITS bits, about one line in 64, once the
+#       chunk has CHUNK_MIN_SIZE bytes, or at CHUNK_MAX_SIZE bytes.  Chunks are never removed when a capture is,
+#       since other captures may use them;  removeUnusedChunks() removes the chunks no capture uses.
+#
+#       2026-10-19: python -m model.CaptureStore, 60 captures each of dpkg -l (3,000 packages, a few upgraded
+#       between captures) and ps -lf -A (400 processes, times and a few processes changed between captures), the
+#       database measured after its -wal file is checkpointed, median of five runs:
+#                                               .cmd_out files          CaptureStore
+#               bytes stored:                   29.6 MB                 0.97 MB
+#               disk blocks used:               29.8 MB                 0.97 MB
+#               save, per capture:              0.15 ms                 2.7 - 3.2 ms
+#           A save is about 20 times slower than the plain write into the page cache, in exchange for a thirtieth of
+#           the disk space.  The database statements are 0.25 ms of it;  the rest is splitting, 1.6 ms, compressing,
+#           0.9 ms, and hashing, 0.4 ms.  A dpkg capture shares all but the chunks around the upgraded packages;  a
+#           ps capture shares little with the one before it, since most lines' TIME column changes.
+#
+
+import os
+import json
+from hashlib import sha256
+from zlib import crc32, compress, decompress
+from bisect import bisect_right
+from itertools import accumulate, count
+from operator import add
+from collections import OrderedDict
+
+from model.Util import INSTALLATION_FOLDER, USER_DATA_FOLDER, CONSOLE_OUT_TEXT_FOLDER
+from model.Installation import APP_DATA_FOLDER, USER_CONSOLE_OUT_DB, pathFromList
+from model.ConnectionManager import ConnectionManager
+
+CAPTURE_EXTENSION   = '.cmd_chunks'
+CHUNK_MIN_SIZE      = 2048
+CHUNK_MAX_SIZE      = 65536
+CHUNK_MASK_BITS     = 6
+COMPRESS_LEVEL      = 6
+
+#   Chunks are looked up by their SHA-256 through the UNIQUE index;  a rowid table keeps the compressed data out of
+#   that index's pages.
+SCHEMA_SQL  = ("""CREATE TABLE IF NOT EXISTS CaptureChunks (chunkId INTEGER PRIMARY KEY,
+                    chunkHash BLOB NOT NULL UNIQUE, data BLOB NOT NULL)""",
+               """CREATE TABLE IF NOT EXISTS Captures (fileName TEXT PRIMARY KEY, size INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL, chunkIds TEXT NOT NULL)""")
+
+
+class CaptureStore:
+    """
+    The saved captures in a database, by default USER_CONSOLE_OUT_DB, and the old .cmd_out files in a folder, by
+    default the console output text folder, which also holds consoleOutArchive.index.
+    """
+
+    schemaReady     = set()
+
+    def __init__(self, folderPath: str=None, dbPath: str=None):
+        if folderPath is None:
+            folderPath = INSTALLATION_FOLDER + '/' + USER_DATA_FOLDER + '/' + CONSOLE_OUT_TEXT_FOLDER
+        if not isinstance(folderPath, str) or not os.path.isdir(folderPath):
+            raise Exception("CaptureStore constructor - Invalid folderPath argument:  " + str(folderPath))
+        if dbPath is None:
+            dbPath = pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB))
+        if not isinstance(dbPath, str):
+            raise Exception("CaptureStore constructor - Invalid dbPath argument:  " + str(dbPath))
+        self.folderPath = folderPath
+        self.dbPath = dbPath
+        self.lastBytesWritten = 0         #   compressed bytes of new chunks written by the last save()
+        if dbPath not in CaptureStore.schemaReady:
+            with ConnectionManager.transaction(dbPath) as cursor:
+                for statement in SCHEMA_SQL:
+                    cursor.execute(statement)
+            CaptureStore.schemaReady.add(dbPath)
+
+    @staticmethod
+    def splitChunks(content: bytes):
+        """
+        Split content into chunks which end at line ends chosen by the lines' content.
+        :return:    List of bytes, which join to content.
+        """
+        if not isinstance(content, bytes):
+            raise Exception("CaptureStore.splitChunks - Invalid content argument:  " + str(type(content)))
+        mask = (1 << CHUNK_MASK_BITS) - 1
+        contentLength = len(content)
+        lines = content.split(b'\n')
+        #   The split, the CRCs and the line end offsets are computed in C;  only the lines whose CRC makes them a
+        #   candidate boundary, about one in 64, are looked at here.
+        lineEnds = list(map(add, accumulate(map(len, lines)), count(1)))
+        candidates = [lineIdx for lineIdx, lineCrc in enumerate(map(crc32, lines)) if lineCrc & mask == 0]
+        chunkEnds = []
+        chunkStart = 0
+        for lineEnd in [min(lineEnds[lineIdx], contentLength) for lineIdx in candidates] + [contentLength]:
+            while lineEnd - chunkStart > CHUNK_MAX_SIZE:
+                #   End the chunk at the last line end which fits, or, in a line which alone is too long, at the
+                #   maximum size.
+                lineIdx = bisect_right(lineEnds, chunkStart + CHUNK_MAX_SIZE) - 1
+                if lineIdx >= 0 and lineEnds[lineIdx] > chunkStart:
+                    chunkStart = lineEnds[lineIdx]
+                else:
+                    chunkStart += CHUNK_MAX_SIZE
+                chunkEnds.append(chunkStart)
+            if lineEnd - chunkStart >= CHUNK_MIN_SIZE or (lineEnd == contentLength and lineEnd > chunkStart):
+                chunkEnds.append(lineEnd)
+                chunkStart = lineEnd
+        return [content[chunkStart: chunkEnd] for chunkStart, chunkEnd in zip([0] + chunkEnds, chunkEnds)]
+
+    def save(self, fileName: str, text: str):
+        """
+        Store text as the capture fileName, with CAPTURE_EXTENSION added if it does not have it, in one
+        transaction.  Saving a fileName again replaces its capture.
+        :return:    The capture's name, for the index entry.
+        """
+        #   Only a key in Captures, so it may contain '/', e.g. from the arguments of ls -l /var/log.
+        if not isinstance(fileName, str) or len(fileName) == 0:
+            raise Exception("CaptureStore.save - Invalid fileName argument:  " + str(fileName))
+        if not isinstance(text, str):
+            raise Exception("CaptureStore.save - Invalid text argument:  " + str(type(text)))
+        if not fileName.endswith(CAPTURE_EXTENSION):
+            fileName += CAPTURE_EXTENSION
+        content = text.encode('utf-8')
+        chunks = CaptureStore.splitChunks(content)
+        chunkHashes = [sha256(chunk).digest() for chunk in chunks]
+        bytesWritten = 0
+        with ConnectionManager.transaction(self.dbPath) as cursor:
+            #   One query for the chunks already stored, then one insert for each new one.
+            chunkIds = {}
+            uniqueHashes = list(OrderedDict.fromkeys(chunkHashes))
+            for batchStart in range(0, len(uniqueHashes), 500):
+                batch = uniqueHashes[batchStart: batchStart + 500]
+                cursor.execute("SELECT chunkHash, chunkId FROM CaptureChunks WHERE chunkHash IN (" +
+                               ','.join('?' * len(batch)) + ")", batch)
+                chunkIds.update(cursor.fetchall())
+            for chunk, chunkHash in zip(chunks, chunkHashes):
+                if chunkHash not in chunkIds:
+                    compressed = compress(chunk, COMPRESS_LEVEL)
+                    cursor.execute("INSERT INTO CaptureChunks (chunkHash, data) VALUES(?,?)", (chunkHash, compressed))
+                    chunkIds[chunkHash] = cursor.lastrowid
+                    bytesWritten += len(compressed)
+            cursor.execute("INSERT OR REPLACE INTO Captures (fileName, size, sha256, chunkIds) VALUES(?,?,?,?)",
+                           (fileName, len(content), sha256(content).hexdigest(),
+                            json.dumps([chunkIds[chunkHash] for chunkHash in chunkHashes])))
+        self.lastBytesWritten = bytesWritten
+        return fileName
+
+    def read(self, fileName: str):
+        """
+        :return:    The text of the capture fileName, a stored capture or an old .cmd_out file.
+        """
+        if isinstance(fileName, str) and not fileName.endswith(CAPTURE_EXTENSION) and \
+                os.path.isfile(self.folderPath + '/' + fileName):
+            with open(self.folderPath + '/' + fileName, 'r') as contentFile:
+                return contentFile.read()
+        connection = ConnectionManager.getConnection(self.dbPath)
+        row = connection.execute("SELECT size, sha256, chunkIds FROM Captures WHERE fileName=?",
+                                 (fileName,)).fetchone() if isinstance(fileName, str) else None
+        if row is None:
+            raise Exception("CaptureStore.read - Invalid fileName argument:  " + str(fileName))
+        size, contentHash, chunkIds = row
+        chunkIds = json.loads(chunkIds)
+        uniqueIds = list(set(chunkIds))
+        chunkData = {}
+        for batchStart in range(0, len(uniqueIds), 500):
+            batch = uniqueIds[batchStart: batchStart + 500]
+            chunkData.update(connection.execute("SELECT chunkId, data FROM CaptureChunks WHERE chunkId IN (" +
+                                                ','.join('?' * len(batch)) + ")", batch).fetchall())
+        if any(chunkId not in chunkData for chunkId in uniqueIds):
+            raise Exception("CaptureStore.read - capture is damaged:  " + fileName)
+        content = b''.join(decompress(chunkData[chunkId]) for chunkId in chunkIds)
+        if len(content) != size or sha256(content).hexdigest() != contentHash:
+            raise Exception("CaptureStore.read - capture is damaged:  " + fileName)
+        return content.decode('utf-8')
+
+    def remove(self, fileName: str):
+        """
+        Remove the capture fileName, or the old .cmd_out file.  A stored capture's chunks stay until
+        removeUnusedChunks().
+        """
+        if isinstance(fileName, str) and not fileName.endswith(CAPTURE_EXTENSION) and \
+                os.path.isfile(self.folderPath + '/' + fileName):
+            os.remove(self.folderPath + '/' + fileName)
+            return
+        with ConnectionManager.transaction(self.dbPath) as cursor:
+            cursor.execute("DELETE FROM Captures WHERE fileName=?", (fileName,))
+            if cursor.rowcount != 1:
+                raise Exception("CaptureStore.remove - Invalid fileName argument:  " + str(fileName))
+
+    def removeUnusedChunks(self):
+        """
+        Remove the chunks which no capture uses.
+        :return:    The number of chunks removed.
+        """
+        with ConnectionManager.transaction(self.dbPath) as cursor:
+            usedIds = set()
+            for chunkIds, in cursor.execute("SELECT chunkIds FROM Captures").fetchall():
+                usedIds.update(json.loads(chunkIds))
+            unusedIds = [(chunkId,) for chunkId, in cursor.execute("SELECT chunkId FROM CaptureChunks").fetchall()
+                         if chunkId not in usedIds]
+            cursor.executemany("DELETE FROM CaptureChunks WHERE chunkId=?", unusedIds)
+        return len(unusedIds)
+
+
+def benchmarkCaptureStore(captures: int=60, packageCount: int=3000, processCount: int=400):
+    """
+    Bytes stored, disk blocks used and milliseconds per save for captures captures each of a dpkg -l and a ps -lf -A
+    like output, as .cmd_out files and in a CaptureStore.
+    """
+    from time import perf_counter
+    from random import Random
+    from tempfile import TemporaryDirectory
+    random = Random(19)
+    packages = [['ii', 'package' + str(packageIdx), '1.' + str(random.randrange(40)) + '.' + str(random.randrange(9)),
+                 random.choice(('amd64', 'all')), 'description of package ' + str(packageIdx) + ' ' * 8 +
+                 'library and tools ' * random.randrange(1, 3)] for packageIdx in range(packageCount)]
+    processes = [[str(random.randrange(1000, 60000)), random.choice(('root', 'user', 'systemd+')),
+                  random.randrange(100000), '/usr/bin/command' + str(random.randrange(150)) + ' --option ' +
+                  str(random.randrange(1000))] for processIdx in range(processCount)]
+    header = 'Desired=Unknown/Install/Remove/Purge/Hold\n||/ Name    Version    Architecture Description\n' + \
+             '+++-=======-==========-============-' + '=' * 40 + '\n'
+    outputs = []
+    for captureIdx in range(captures):
+        for changeIdx in range(3):
+            random.choice(packages)[2] += '+' + str(captureIdx)
+        if random.random() < 0.1:
+            packages.append(['ii', 'new' + str(captureIdx), '1.0', 'amd64', 'new package'])
+        outputs.append(header + ''.join('{:<4}{:<40}{:<30}{:<13}{}\n'.format(*package) for package in packages))
+        for process in processes:
+            process[2] += random.randrange(3)
+        for changeIdx in range(5):
+            processes[random.randrange(processCount)][0] = str(random.randrange(1000, 60000))
+        outputs.append('F S UID   PID  PPID  C PRI  NI ADDR SZ WCHAN  STIME TTY          TIME CMD\n' +
+                       ''.join('4 S {:<8}{:>6}     1  0  80   0 -  4000 -      Oct19 ?        {:02d}:{:02d}:{:02d} {}\n'.
+                               format(process[1], process[0], process[2] // 3600, process[2] // 60 % 60,
+                                      process[2] % 60, process[3]) for process in processes))
+
+    def folderUsage(folderPath):
+        byteCount = 0
+        blockCount = 0
+        for walkPath, folderNames, fileNames in os.walk(folderPath):
+            for fileName in fileNames:
+                status = os.stat(walkPath + '/' + fileName)
+                byteCount += status.st_size
+                blockCount += status.st_blocks
+        return byteCount, blockCount * 512
+
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        startTime = perf_counter()
+        for outputIdx, text in enumerate(outputs):
+            with open(folderPath + '/' + str(outputIdx) + '.cmd_out', 'w') as contentFile:
+                contentFile.write(text)
+        elapsed = perf_counter() - startTime
+        results['.cmd_out files'] = folderUsage(folderPath) + (elapsed * 1000 / len(outputs),)
+    with TemporaryDirectory() as folderPath:
+        dbPath = folderPath + '/' + USER_CONSOLE_OUT_DB
+        captureStore = CaptureStore(folderPath, dbPath)
+        startTime = perf_counter()
+        for outputIdx, text in enumerate(outputs):
+            captureStore.save(str(outputIdx), text)
+        elapsed = perf_counter() - startTime
+        for outputIdx in (0, len(outputs) - 1):
+            if captureStore.read(str(outputIdx) + CAPTURE_EXTENSION) != outputs[outputIdx]:
+                raise Exception("benchmarkCaptureStore - capture " + str(outputIdx) + " did not read back")
+        #   Closing checkpoints the -wal file into the database, whose size is then what stays on disk.
+        ConnectionManager.closeConnection(dbPath)
+        results['CaptureStore'] = folderUsage(folderPath) + (elapsed * 1000 / len(outputs),)
+    return results
+
+
+if __name__ == "__main__":
+    for method, (byteCount, diskBytes, milliseconds) in benchmarkCaptureStore().items():
+        print(method + ":\t" + str(round(byteCount / 10 ** 6, 2)) + " MB stored,  " +
+              str(round(diskBytes / 10 ** 6, 2)) + " MB on disk,  " + str(round(milliseconds, 2)) + " ms per save")
@@ -0,0 +1,201 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/ConnectionManager.py
+#   Purpose:        Shared SQLite connections for LinuxTools.db, ApplicationActivity.db, ConsoleOutput.db and any
+#                   other database the application opens, one per database per thread.
+#   Development:
+#       Opening a connection reads the schema and a new connection starts with an empty prepared statement cache,
+#       so opening and closing one per operation made every operation pay for both.  sqlite3 connections may only
+#       be used by the thread which opened them, hence one per thread.
+#
+#       Every connection is in autocommit mode, isolation_level=None, so a single statement commits by itself and
+#       several are grouped with ConnectionManager.transaction().
+#
+#       Only the application's own databases, APPLICATION_DATABASES, are switched to WAL, since journal_mode is kept
+#       in the database file and any other database, e.g. one the user opens in a table view, must be left as it
+#       was.  Where one of those is only read, getConnection(dbPath, readOnly=True) opens it with mode=ro, so that
+#       reading its schema or rows cannot change it.
+#
+#       2026-10-19: Per operation latency, microseconds, on a 1,000 row Tools table
+#           (python -m model.ConnectionManager):
+#                                               connect per operation       shared WAL connection
+#               SELECT tool by name:            160 - 220                   80 - 95
+#               INSERT tool:                    730 - 1,010                 34 - 42
+#           The SELECT scans the table since Name is not indexed, which is most of what is left of its time.
+#
+
+import os
+import sqlite3
+import atexit
+from threading import local
+from urllib.request import pathname2url
+from contextlib import contextmanager
+from collections import OrderedDict
+
+#   File names of the databases the application creates and owns.
+APPLICATION_DATABASES   = ('LinuxTools.db', 'ApplicationActivity.db', 'ConsoleOutput.db')
+#   WAL lets the table views read while a console capture is being written, and with it synchronous=NORMAL only
+#   syncs at checkpoints, while a crash still leaves the database consistent.
+APPLICATION_PRAGMAS = ('PRAGMA journal_mode = WAL', 'PRAGMA synchronous = NORMAL')
+#   Settings of the connection only, for every database.
+SESSION_PRAGMAS     = ('PRAGMA temp_store = MEMORY',)
+READ_ONLY_KEY       = '?mode=ro'
+CACHED_STATEMENTS   = 256
+BUSY_TIMEOUT        = 10.0      #   seconds to wait for another connection's write lock
+
+
+class ConnectionManager:
+
+    threadState = local()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def isApplicationDatabase(dbPath: str):
+        return os.path.basename(dbPath) in APPLICATION_DATABASES
+
+    @staticmethod
+    def getConnection(dbPath: str, readOnly: bool=False):
+        """
+        The calling thread's connection to dbPath, opened and configured on first use.
+        :param readOnly:    Open a database other than the application's own with mode=ro.  The application's own
+                            databases are always read through their shared connection.
+        """
+        if dbPath is None or not isinstance(dbPath, str) or len(dbPath) == 0:
+            raise Exception("ConnectionManager.getConnection - Invalid dbPath argument:  " + str(dbPath))
+        connections = getattr(ConnectionManager.threadState, 'connections', None)
+        if connections is None:
+            connections = ConnectionManager.threadState.connections = OrderedDict()
+        dbPath = os.path.abspath(dbPath)
+        applicationDatabase = ConnectionManager.isApplicationDatabase(dbPath)
+        readOnly = readOnly and not applicationDatabase
+        connectionKey = dbPath + READ_ONLY_KEY if readOnly else dbPath
+        connection = connections.get(connectionKey)
+        if connection is None:
+            if readOnly:
+                connection = sqlite3.connect('file:' + pathname2url(dbPath) + READ_ONLY_KEY, uri=True,
+                                             timeout=BUSY_TIMEOUT, isolation_level=None,
+                                             cached_statements=CACHED_STATEMENTS)
+            else:
+                connection = sqlite3.connect(dbPath, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                             cached_statements=CACHED_STATEMENTS)
+            for pragma in SESSION_PRAGMAS + (APPLICATION_PRAGMAS if applicationDatabase else ()):
+                connection.execute(pragma)
+            connections[connectionKey] = connection
+        return connection
+
+    @staticmethod
+    @contextmanager
+    def transaction(dbPath: str):
+        """
+        with ConnectionManager.transaction(dbPath) as cursor:
+        Statements executed with cursor are committed together when the block ends, or rolled back if it raises.
+        A transaction begun inside another on the same database is part of the outer one.
+        """
+        connection = ConnectionManager.getConnection(dbPath)
+        cursor = connection.cursor()
+        if connection.in_transaction:
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except:
+            if connection.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def closeConnection(dbPath: str):
+        """
+        Close the calling thread's connections to dbPath, e.g. before the database file is moved or deleted.
+        """
+        connections = getattr(ConnectionManager.threadState, 'connections', None)
+        if connections is not None:
+            dbPath = os.path.abspath(dbPath)
+            for connectionKey in (dbPath, dbPath + READ_ONLY_KEY):
+                connection = connections.pop(connectionKey, None)
+                if connection is not None:
+                    connection.close()
+
+    @staticmethod
+    def closeConnections():
+        """
+        Close all of the calling thread's connections.  The last connection to a WAL database to close
+        checkpoints it, folding the -wal file back into the database file.
+        """
+        connections = getattr(ConnectionManager.threadState, 'connections', None)
+        if connections is not None:
+            while len(connections) > 0:
+                dbPath, connection = connections.popitem()
+                connection.close()
+
+
+#   The main thread's connections, which are the ones the user interface uses, are checkpointed and closed on exit.
+atexit.register(ConnectionManager.closeConnections)
+
+
+def benchmarkConnections(rowCount: int=1000, operations: int=500):
+    """
+    Per operation latency of a tool name lookup and a tool insert with a connection opened and closed for each,
+    as ToolManager did, and with ConnectionManager's shared connection.
+    :return:    OrderedDict of microseconds per operation.
+    """
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    createSQL = """CREATE TABLE Tools ( RowId INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE,
+                    timeStamp TEXT NOT NULL, Name TEXT NOT NULL, Description TEXT NOT NULL,
+                    LinuxCommand TEXT NOT NULL, Arguments BLOB NOT NULL )"""
+    selectSQL = "SELECT * FROM Tools WHERE Name=?"
+    insertSQL = "INSERT INTO Tools( timeStamp, Name, Description, LinuxCommand, Arguments ) VALUES( ?, ?, ?, ?, ? )"
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        for mode in ('connect per operation', 'shared WAL connection'):
+            #   Named as the application's database, so that the shared connection is in WAL mode.
+            os.mkdir(folderPath + '/' + mode.replace(' ', '_'))
+            dbPath = folderPath + '/' + mode.replace(' ', '_') + '/LinuxTools.db'
+            connection = sqlite3.connect(dbPath)
+            connection.execute(createSQL)
+            connection.executemany(insertSQL, (('2026/10/19', 'Tool ' + str(rowIdx), 'description', 'ps', b'')
+                                               for rowIdx in range(rowCount)))
+            connection.commit()
+            connection.close()
+
+            startTime = perf_counter()
+            for operationIdx in range(operations):
+                name = 'Tool ' + str(operationIdx * 7 % rowCount)
+                if mode == 'connect per operation':
+                    connection = sqlite3.connect(dbPath)
+                    connection.execute(selectSQL, (name,)).fetchall()
+                    connection.close()
+                else:
+                    ConnectionManager.getConnection(dbPath).execute(selectSQL, (name,)).fetchall()
+            results['SELECT, ' + mode] = (perf_counter() - startTime) * 1000000 / operations
+
+            startTime = perf_counter()
+            for operationIdx in range(operations):
+                row = ('2026/10/19', 'New Tool ' + str(operationIdx), 'description', 'ps', b'')
+                if mode == 'connect per operation':
+                    connection = sqlite3.connect(dbPath)
+                    connection.execute(insertSQL, row)
+                    connection.commit()
+                    connection.close()
+                else:
+                    ConnectionManager.getConnection(dbPath).execute(insertSQL, row)
+            results['INSERT, ' + mode] = (perf_counter() - startTime) * 1000000 / operations
+        ConnectionManager.closeConnections()
+    return results
+
+
+if __name__ == "__main__":
+    for operation, microseconds in benchmarkConnections().items():
+        print(operation + ":\t" + str(round(microseconds, 1)) + " us")
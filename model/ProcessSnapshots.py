@@ -0,0 +1,423 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/ProcessSnapshots.py
+#   Purpose:        Store of repeated ps -lf -A captures as snapshots of the process table which can be compared
+#                   over time, e.g. which processes started, ended or changed between two captures.
+#   Development:
+#       Tables, in USER_CONSOLE_OUT_DB by default:
+#           ProcessSnapshots:   One row per capture, keyed by snapshotId, with its runTimeStamp.
+#           ProcessUsers:       Each distinct UID column value once.
+#           ProcessCommands:    Each distinct CMD column value once.  Most of a capture's command lines were in
+#                               the capture before, so this is most of the space saved.
+#           ProcessSamples:     One row per process per capture with the numeric columns as INTEGER, keyed and
+#                               clustered by (snapshotId, PID), WITHOUT ROWID, so a snapshot's rows are
+#                               contiguous and a process in a snapshot is one b-tree lookup.
+#       A process is identified across snapshots by PID and start time, so that a PID reused by a new process is
+#       reported as one process ending and another starting.  ps prints STIME as HH:MM on the day the process
+#       started, as MonDD after that and as the year after the year it started in, so STIME itself changes from one
+#       capture to the next, e.g. across midnight.  Each sample also keeps startTime, its STIME read with the date of
+#       its capture as YYYY-MM-DD HH:MM, YYYY-MM-DD or YYYY, and two samples have the same start if one of these is
+#       the beginning of the other.
+#
+#       2026-10-19: 2,000 synthetic captures of 400 processes each (python -m model.ProcessSnapshots):
+#                                               snapshots       ps_lf_A table
+#               Save one capture:               3.3 - 3.8 ms    2.7 - 3.1 ms
+#               Diff two captures:              1.3 - 2.2 ms    330 - 400 ms, started and ended only
+#               Database size:                  41 MB           117 MB
+#       2026-10-19: With startTime, same benchmark:  save 4.2 ms against 3.6 ms for the ps_lf_A table, diff 2.3 ms,
+#           database 56 MB, the 15 MB added being startTime's text in each sample.
+#
+
+import re
+from collections import OrderedDict
+
+from model.Installation import INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB, pathFromList
+from model.ConnectionManager import ConnectionManager
+
+PS_LF_A_HEADER  = ('F', 'S', 'UID', 'PID', 'PPID', 'C', 'PRI', 'NI', 'ADDR', 'SZ', 'WCHAN', 'STIME', 'TTY', 'TIME',
+                   'CMD')
+
+#   Columns of the rows returned by getSnapshot() and diffSnapshots().
+SNAPSHOT_ROW_COLUMNS    = ('PID', 'PPID', 'UID', 'F', 'S', 'C', 'PRI', 'NI', 'ADDR', 'SZ', 'WCHAN', 'STIME', 'TTY',
+                           'cpuSeconds', 'CMD')
+
+SCHEMA_SQL  = ("""CREATE TABLE IF NOT EXISTS ProcessSnapshots (snapshotId INTEGER PRIMARY KEY,
+                    runTimeStamp TEXT NOT NULL UNIQUE, processCount INTEGER NOT NULL)""",
+               """CREATE TABLE IF NOT EXISTS ProcessUsers (userId INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)""",
+               """CREATE TABLE IF NOT EXISTS ProcessCommands (commandId INTEGER PRIMARY KEY,
+                    commandLine TEXT NOT NULL UNIQUE)""",
+               """CREATE TABLE IF NOT EXISTS ProcessSamples (snapshotId INTEGER NOT NULL, PID INTEGER NOT NULL,
+                    PPID INTEGER, userId INTEGER NOT NULL, F INTEGER, S TEXT, C INTEGER, PRI INTEGER, NI INTEGER,
+                    ADDR TEXT, SZ INTEGER, WCHAN TEXT, STIME TEXT, TTY TEXT, cpuSeconds INTEGER,
+                    commandId INTEGER NOT NULL, startTime TEXT, PRIMARY KEY (snapshotId, PID)) WITHOUT ROWID""")
+
+SAMPLE_INSERT_SQL   = """INSERT INTO ProcessSamples (snapshotId, PID, PPID, userId, F, S, C, PRI, NI, ADDR, SZ, WCHAN,
+                            STIME, TTY, cpuSeconds, commandId, startTime) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)"""
+
+SAMPLE_SELECT_SQL   = """SELECT {alias}.PID, {alias}.PPID, ProcessUsers.name, {alias}.F, {alias}.S, {alias}.C,
+                            {alias}.PRI, {alias}.NI, {alias}.ADDR, {alias}.SZ, {alias}.WCHAN, {alias}.STIME,
+                            {alias}.TTY, {alias}.cpuSeconds, ProcessCommands.commandLine"""
+
+#   The start times match to the precision of the less precise one.  A sample with no startTime, imported from the
+#   ps_lf_A table, or with a STIME which could not be read, matches a sample of the same PID with any.
+SAME_START_SQL  = """({this}.startTime IS NULL OR {other}.startTime IS NULL OR
+                        substr({this}.startTime, 1, length({other}.startTime)) = {other}.startTime OR
+                        substr({other}.startTime, 1, length({this}.startTime)) = {this}.startTime)"""
+
+#   ps's STIME month names, in the C locale.
+STIME_MONTHS    = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+STIME_TIME      = re.compile(r'\d\d:\d\d')
+STIME_DAY       = re.compile(r'([A-Z][a-z][a-z])(\d\d)')
+STIME_YEAR      = re.compile(r'\d\d\d\d')
+CAPTURE_DATE    = re.compile(r'\d\d\d\d-\d\d-\d\d')
+
+#   Columns compared by diffSnapshots() to decide whether a process changed.
+CHANGE_COLUMNS  = ('PPID', 'userId', 'S', 'C', 'PRI', 'NI', 'SZ', 'WCHAN', 'TTY', 'cpuSeconds', 'commandId')
+
+
+def integerOrNone(text: str):
+    """
+    ps prints '-' for values which do not apply, e.g. NI of a real time process.
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def cpuSecondsFromTime(text: str):
+    """
+    Seconds in a ps TIME column value, [DD-]HH:MM:SS.
+    """
+    days = 0
+    if '-' in text:
+        dayText, text = text.split('-', 1)
+        days = int(dayText)
+    seconds = 0
+    for part in text.split(':'):
+        seconds = seconds * 60 + int(part)
+    return days * 86400 + seconds
+
+
+def startTimeFromSTIME(text: str, runTimeStamp: str):
+    """
+    A process's start from its ps STIME and the time it was captured:  YYYY-MM-DD HH:MM from HH:MM, which ps prints
+    on the day it started, YYYY-MM-DD from MonDD, later in the year, and YYYY from YYYY, in later years.
+    :return:    None if either cannot be read.
+    """
+    if text is None or runTimeStamp is None or CAPTURE_DATE.match(runTimeStamp) is None:
+        return None
+    if STIME_TIME.fullmatch(text) is not None:
+        return runTimeStamp[:10] + ' ' + text
+    match = STIME_DAY.fullmatch(text)
+    if match is not None and match.group(1) in STIME_MONTHS:
+        return runTimeStamp[:5] + str(STIME_MONTHS.index(match.group(1)) + 1).rjust(2, '0') + '-' + match.group(2)
+    if STIME_YEAR.fullmatch(text) is not None:
+        return text
+    return None
+
+
+class ProcessSnapshotStore:
+
+    #   database path -> {lookup table name: {value: id}}, valid while the database's lookup tables only grow.
+    internCache     = {}
+    schemaReady     = set()
+
+    def __init__(self, dbPath: str=None):
+        if dbPath is None:
+            dbPath = pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB))
+        if not isinstance(dbPath, str):
+            raise Exception("ProcessSnapshotStore constructor - Invalid dbPath argument:  " + str(dbPath))
+        self.dbPath = dbPath
+        if dbPath not in ProcessSnapshotStore.schemaReady:
+            with ConnectionManager.transaction(dbPath) as cursor:
+                for statement in SCHEMA_SQL:
+                    cursor.execute(statement)
+                ProcessSnapshotStore.addStartTimes(cursor)
+            ProcessSnapshotStore.schemaReady.add(dbPath)
+
+    @staticmethod
+    def addStartTimes(cursor):
+        """
+        Add the startTime column to a ProcessSamples table made before it had one, and fill it in.
+        """
+        cursor.execute("PRAGMA table_info(ProcessSamples)")
+        if 'startTime' in (row[1] for row in cursor.fetchall()):
+            return
+        cursor.execute("ALTER TABLE ProcessSamples ADD COLUMN startTime TEXT")
+        cursor.execute("""SELECT ProcessSamples.snapshotId, PID, STIME, runTimeStamp FROM ProcessSamples
+                            JOIN ProcessSnapshots ON ProcessSnapshots.snapshotId = ProcessSamples.snapshotId""")
+        startTimes = [(startTimeFromSTIME(stime, runTimeStamp), snapshotId, pid)
+                      for snapshotId, pid, stime, runTimeStamp in cursor.fetchall()]
+        cursor.executemany("UPDATE ProcessSamples SET startTime=? WHERE snapshotId=? AND PID=?", startTimes)
+
+    def internIds(self, cursor, tableName: str, idColumn: str, valueColumn: str, values):
+        """
+        The lookup table id of each of values, inserting the ones not seen before.
+        :return:    dict of value -> id.
+        """
+        cache = ProcessSnapshotStore.internCache.setdefault(self.dbPath, {}).setdefault(tableName, {})
+        for value in set(values):
+            if value not in cache:
+                cursor.execute("INSERT INTO " + tableName + " (" + valueColumn + ") VALUES(?) ON CONFLICT(" +
+                               valueColumn + ") DO NOTHING", (value,))
+                cursor.execute("SELECT " + idColumn + " FROM " + tableName + " WHERE " + valueColumn + "=?",
+                               (value,))
+                cache[value] = cursor.fetchone()[0]
+        return cache
+
+    @staticmethod
+    def parseCapture(consoleOutput: str):
+        """
+        :return:    List of token lists, one per process, in PS_LF_A_HEADER order.
+        """
+        lines = consoleOutput.split('\n')
+        if tuple(lines[0].split()) != PS_LF_A_HEADER:
+            raise Exception("ProcessSnapshotStore.parseCapture - Not ps -lf -A output:  " + lines[0])
+        records = []
+        for line in lines[1:]:
+            tokens = line.split(None, len(PS_LF_A_HEADER) - 1)
+            if len(tokens) == 0:
+                continue
+            if len(tokens) != len(PS_LF_A_HEADER):
+                raise Exception("ProcessSnapshotStore.parseCapture - Record length does not match heading count:  "
+                                + line)
+            records.append(tokens)
+        return records
+
+    def saveCapture(self, consoleOutput: str, runTimeStamp: str):
+        """
+        Save one ps -lf -A capture as a snapshot, in one transaction.  Saving the same runTimeStamp again does
+        nothing.
+        :return:    snapshotId.
+        """
+        if consoleOutput is None or not isinstance(consoleOutput, str):
+            raise Exception("ProcessSnapshotStore.saveCapture - Invalid consoleOutput argument:  " +
+                            str(consoleOutput))
+        if runTimeStamp is None or not isinstance(runTimeStamp, str):
+            raise Exception("ProcessSnapshotStore.saveCapture - Invalid runTimeStamp argument:  " + str(runTimeStamp))
+        records = ProcessSnapshotStore.parseCapture(consoleOutput)
+        try:
+            with ConnectionManager.transaction(self.dbPath) as cursor:
+                cursor.execute("SELECT snapshotId FROM ProcessSnapshots WHERE runTimeStamp=?", (runTimeStamp,))
+                row = cursor.fetchone()
+                if row is not None:
+                    return row[0]
+                cursor.execute("INSERT INTO ProcessSnapshots (runTimeStamp, processCount) VALUES(?,?)",
+                               (runTimeStamp, len(records)))
+                snapshotId = cursor.lastrowid
+                userIds = self.internIds(cursor, 'ProcessUsers', 'userId', 'name',
+                                         (tokens[2] for tokens in records))
+                commandIds = self.internIds(cursor, 'ProcessCommands', 'commandId', 'commandLine',
+                                            (tokens[14] for tokens in records))
+                cursor.executemany(SAMPLE_INSERT_SQL, ((snapshotId, int(tokens[3]), integerOrNone(tokens[4]),
+                                                        userIds[tokens[2]], integerOrNone(tokens[0]), tokens[1],
+                                                        integerOrNone(tokens[5]), integerOrNone(tokens[6]),
+                                                        integerOrNone(tokens[7]), tokens[8],
+                                                        integerOrNone(tokens[9]), tokens[10],
+                                                        None if tokens[11] == '-' else tokens[11],
+                                                        tokens[12], cpuSecondsFromTime(tokens[13]),
+                                                        commandIds[tokens[14]],
+                                                        startTimeFromSTIME(tokens[11], runTimeStamp))
+                                                       for tokens in records))
+        except:
+            #   Ids interned in the rolled back transaction no longer exist.
+            ProcessSnapshotStore.internCache.pop(self.dbPath, None)
+            raise
+        return snapshotId
+
+    def getSnapshots(self):
+        """
+        :return:    Tuple of (snapshotId, runTimeStamp, processCount), oldest first.
+        """
+        cursor = ConnectionManager.getConnection(self.dbPath).execute(
+            "SELECT snapshotId, runTimeStamp, processCount FROM ProcessSnapshots ORDER BY snapshotId")
+        snapshots = tuple(cursor.fetchall())
+        cursor.close()
+        return snapshots
+
+    def getSnapshotId(self, runTimeStamp: str):
+        cursor = ConnectionManager.getConnection(self.dbPath).execute(
+            "SELECT snapshotId FROM ProcessSnapshots WHERE runTimeStamp=?", (runTimeStamp,))
+        row = cursor.fetchone()
+        cursor.close()
+        return None if row is None else row[0]
+
+    def getSnapshot(self, snapshotId: int):
+        """
+        :return:    Tuple of SNAPSHOT_ROW_COLUMNS rows, in PID order.
+        """
+        cursor = ConnectionManager.getConnection(self.dbPath).execute(
+            SAMPLE_SELECT_SQL.format(alias='ProcessSamples') + """ FROM ProcessSamples
+                JOIN ProcessUsers ON ProcessUsers.userId = ProcessSamples.userId
+                JOIN ProcessCommands ON ProcessCommands.commandId = ProcessSamples.commandId
+                WHERE ProcessSamples.snapshotId=? ORDER BY ProcessSamples.PID""", (snapshotId,))
+        rows = tuple(cursor.fetchall())
+        cursor.close()
+        return rows
+
+    def diffSnapshots(self, fromSnapshotId: int, toSnapshotId: int):
+        """
+        Compare two snapshots.
+        :return:    OrderedDict with:
+                        'started':  Tuple of SNAPSHOT_ROW_COLUMNS rows of processes in the second snapshot only.
+                        'ended':    Tuple of rows of processes in the first snapshot only.
+                        'changed':  Tuple of (row in the first, row in the second) for processes in both whose
+                                    CHANGE_COLUMNS differ.
+        """
+        if fromSnapshotId is None or not isinstance(fromSnapshotId, int):
+            raise Exception("ProcessSnapshotStore.diffSnapshots - Invalid fromSnapshotId argument:  " +
+                            str(fromSnapshotId))
+        if toSnapshotId is None or not isinstance(toSnapshotId, int):
+            raise Exception("ProcessSnapshotStore.diffSnapshots - Invalid toSnapshotId argument:  " +
+                            str(toSnapshotId))
+        connection = ConnectionManager.getConnection(self.dbPath)
+        onlyInSQL = SAMPLE_SELECT_SQL.format(alias='this') + """ FROM ProcessSamples AS this
+                        JOIN ProcessUsers ON ProcessUsers.userId = this.userId
+                        JOIN ProcessCommands ON ProcessCommands.commandId = this.commandId
+                        WHERE this.snapshotId=? AND NOT EXISTS (SELECT 1 FROM ProcessSamples AS other
+                            WHERE other.snapshotId=? AND other.PID = this.PID AND """ + \
+                    SAME_START_SQL.format(this='this', other='other') + """)
+                        ORDER BY this.PID"""
+        diff = OrderedDict()
+        cursor = connection.execute(onlyInSQL, (toSnapshotId, fromSnapshotId))
+        diff['started'] = tuple(cursor.fetchall())
+        cursor = connection.execute(onlyInSQL, (fromSnapshotId, toSnapshotId))
+        diff['ended'] = tuple(cursor.fetchall())
+        cursor = connection.execute("""SELECT before.PID FROM ProcessSamples AS before
+                        JOIN ProcessSamples AS after ON after.snapshotId=? AND after.PID = before.PID
+                            AND """ + SAME_START_SQL.format(this='before', other='after') + """
+                        WHERE before.snapshotId=? AND (""" +
+                                    " OR ".join("after." + name + " IS NOT before." + name for name in CHANGE_COLUMNS) +
+                                    ") ORDER BY before.PID", (toSnapshotId, fromSnapshotId))
+        changedPIDs = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        changed = []
+        if len(changedPIDs) > 0:
+            rowSQL = SAMPLE_SELECT_SQL.format(alias='ProcessSamples') + """ FROM ProcessSamples
+                        JOIN ProcessUsers ON ProcessUsers.userId = ProcessSamples.userId
+                        JOIN ProcessCommands ON ProcessCommands.commandId = ProcessSamples.commandId
+                        WHERE ProcessSamples.snapshotId=? AND ProcessSamples.PID=?"""
+            for pid in changedPIDs:
+                before = connection.execute(rowSQL, (fromSnapshotId, pid)).fetchone()
+                after = connection.execute(rowSQL, (toSnapshotId, pid)).fetchone()
+                changed.append((before, after))
+        diff['changed'] = tuple(changed)
+        return diff
+
+    def importLegacyTable(self, tableName: str='ps_lf_A'):
+        """
+        Copy the captures saved by savePs_lf_A_OutputToDB() into snapshots.  That table has no STIME column, so
+        processes imported from it are matched with other snapshots' processes by PID alone.
+        :return:    Number of snapshots added.
+        """
+        connection = ConnectionManager.getConnection(self.dbPath)
+        cursor = connection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (tableName,))
+        exists = cursor.fetchone() is not None
+        cursor.close()
+        if not exists:
+            return 0
+        cursor = connection.execute("SELECT DISTINCT runTimeStamp FROM " + '"' + tableName.replace('"', '""') + '"' +
+                                    " ORDER BY runTimeStamp")
+        runTimeStamps = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        added = 0
+        for runTimeStamp in runTimeStamps:
+            if self.getSnapshotId(runTimeStamp) is not None:
+                continue
+            cursor = connection.execute("SELECT F, S, UID, PID, PPID, C, PRI, NI, ADDR, SZ, WCHAN, '-', TTY, TIME, "
+                                        "CMD FROM " + '"' + tableName.replace('"', '""') + '"' +
+                                        " WHERE runTimeStamp=? ORDER BY rowId", (runTimeStamp,))
+            lines = [' '.join(PS_LF_A_HEADER)]
+            for row in cursor.fetchall():
+                lines.append(' '.join(str(value) for value in row))
+            cursor.close()
+            self.saveCapture('\n'.join(lines), runTimeStamp)
+            added += 1
+        return added
+
+
+def saveProcessSnapshot(consoleOutput: str, runTimeStamp: str, dbPath: str=None):
+    return ProcessSnapshotStore(dbPath).saveCapture(consoleOutput, runTimeStamp)
+
+
+def benchmarkProcessSnapshots(captureCount: int=2000, processCount: int=400, seed: int=23):
+    """
+    Save captureCount synthetic captures in which a few processes start and end and some change between captures,
+    then time diffs between snapshots.  The same captures are saved in the ps_lf_A table layout for comparison,
+    diffed there with EXCEPT queries on runTimeStamp.
+    :return:    OrderedDict of measurements.
+    """
+    import os
+    from random import Random
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    from model.DBInterface import ConsoleImport, PS_LF_A_COLUMNS_SQL, PS_LF_A_COLUMN_NAMES, parsePs_lf_A_Output
+    generator = Random(seed)
+    commands = ['/usr/lib/command-' + str(commandIdx) + ' --option value --config /etc/command.conf'
+                for commandIdx in range(processCount * 2)]
+    processes = OrderedDict((pid, [generator.choice(('root', 'keith', 'message+')), generator.choice(commands), 0])
+                            for pid in range(1, processCount + 1))
+    nextPID = processCount + 1
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        dbPath = folderPath + '/' + USER_CONSOLE_OUT_DB
+        store = ProcessSnapshotStore(dbPath)
+        legacyPath = folderPath + '/Legacy.db'
+        legacyImport = ConsoleImport(legacyPath)
+        saveSeconds = 0.0
+        legacySeconds = 0.0
+        for captureIdx in range(captureCount):
+            for pid in generator.sample(list(processes.keys()), 3):
+                del processes[pid]
+            for newIdx in range(3):
+                processes[nextPID] = [generator.choice(('root', 'keith')), generator.choice(commands), 0]
+                nextPID += 1
+            for pid in generator.sample(list(processes.keys()), 20):
+                processes[pid][2] += 1
+            lines = [' '.join(PS_LF_A_HEADER)]
+            for pid, (user, command, cpuSeconds) in processes.items():
+                lines.append('1 S ' + user + ' ' + str(pid) + ' 1 0 80 0 - 4321 ep_pol 08:08 ? 00:00:' +
+                             str(cpuSeconds % 60).rjust(2, '0') + ' ' + command)
+            runTimeStamp = '2026-10-19 ' + str(captureIdx).rjust(8, '0')
+            startTime = perf_counter()
+            store.saveCapture('\n'.join(lines), runTimeStamp)
+            saveSeconds += perf_counter() - startTime
+            startTime = perf_counter()
+            legacyImport.importRows(['ps', '-lf', '-A'], PS_LF_A_COLUMNS_SQL, PS_LF_A_COLUMN_NAMES,
+                                    parsePs_lf_A_Output('\n'.join(lines), runTimeStamp))
+            legacySeconds += perf_counter() - startTime
+        results['save one capture, ms'] = saveSeconds * 1000 / captureCount
+        results['save one capture, ps_lf_A table, ms'] = legacySeconds * 1000 / captureCount
+        snapshots = store.getSnapshots()
+        diffCount = 100
+        startTime = perf_counter()
+        for diffIdx in range(diffCount):
+            fromSnapshot = generator.choice(snapshots)[0]
+            diff = store.diffSnapshots(fromSnapshot, fromSnapshot + 1 if fromSnapshot < len(snapshots) else 1)
+        results['diff two snapshots, ms'] = (perf_counter() - startTime) * 1000 / diffCount
+        results['started, ended, changed in last diff'] = (len(diff['started']), len(diff['ended']),
+                                                            len(diff['changed']))
+        legacyConnection = ConnectionManager.getConnection(legacyPath)
+        exceptSQL = """SELECT PID, CMD FROM ps_lf_A WHERE runTimeStamp=? EXCEPT
+                        SELECT PID, CMD FROM ps_lf_A WHERE runTimeStamp=?"""
+        legacyDiffCount = 10
+        startTime = perf_counter()
+        for diffIdx in range(legacyDiffCount):
+            fromTimeStamp = '2026-10-19 ' + str(generator.randrange(captureCount - 1)).rjust(8, '0')
+            toTimeStamp = fromTimeStamp[:-8] + str(int(fromTimeStamp[-8:]) + 1).rjust(8, '0')
+            legacyConnection.execute(exceptSQL, (toTimeStamp, fromTimeStamp)).fetchall()
+            legacyConnection.execute(exceptSQL, (fromTimeStamp, toTimeStamp)).fetchall()
+        results['started and ended, ps_lf_A table, ms'] = (perf_counter() - startTime) * 1000 / legacyDiffCount
+        ConnectionManager.closeConnection(dbPath)
+        ConnectionManager.closeConnection(legacyPath)
+        results['database MB'] = os.path.getsize(dbPath) / 1000000
+        results['database MB, ps_lf_A table'] = os.path.getsize(legacyPath) / 1000000
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in benchmarkProcessSnapshots().items():
+        print(name + ":\t" + str(value))
@@ -0,0 +1,553 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/RunMetrics.py
+#   Purpose:        Resource usage of each command the application runs, wall time, user and system CPU, peak
+#                   memory, exit status and output size, kept in LinuxTools.db to show which tools are expensive.
+#   Development:
+#       MeteredPopen starts its command through MeteredSpawner's helper, a small Python process started once, which
+#       reaps it with os.wait4() the moment it exits and passes back its rusage and exit time.  Started from this
+#       process instead, a command's ru_maxrss would start from this process's size, since the kernel carries the
+#       high water mark of the memory the child began with over exec():  true run from a 300 MB Python process
+#       reported 314 MB.  From the helper every command starts from the helper's size, about 11 MB, so peak memory
+#       is comparable between tools and hungriestTools() ranks the tools by their own use.  The exit time comes from
+#       the helper's reaping rather than from whenever the application next polls, so wall time is not stretched by
+#       the console's delivery interval.  ru_maxrss on Linux is in kilobytes and, like the CPU times, includes the
+#       descendants the process waited for, e.g. the commands run by a shell.
+#
+#       Tables, in LinuxTools.db:
+#           ToolRuns:           One row per run.  ToolName is the saved tool's name, NULL for a command typed into
+#                               the console or run by LinuxUtilities.
+#           ToolRunSummary:     View of the runs grouped by tool name, or command where there is none, with the
+#                               averages and maximums.  slowestTools() and hungriestTools() order it.
+#
+#       2026-10-19: python -m model.RunMetrics, 500 runs of true:
+#                                               Popen       MeteredPopen
+#               run and wait:                   0.65 ms     1.05 ms
+#               maxRSS reported, 300 MB parent: 314 MB      11 MB
+#           RunMetrics.record():  0.057 ms on the shared connection.  Summary over 20,000 runs of 40 tools:  29 ms,
+#           one pass over the ToolRuns_Tool index.
+#
+
+import os
+import sys
+import json
+import errno
+import socket
+from struct import Struct
+from signal import SIGTERM, SIGKILL
+from threading import Thread, Lock, Event
+from queue import SimpleQueue
+from datetime import datetime
+from time import monotonic
+from subprocess import Popen, PIPE, STDOUT, DEVNULL, TimeoutExpired
+from collections import OrderedDict
+
+from model.ConnectionManager import ConnectionManager
+
+TOOL_RUNS_SQL   = ("""CREATE TABLE IF NOT EXISTS ToolRuns ( RunId INTEGER PRIMARY KEY AUTOINCREMENT,
+                        StartTime TEXT NOT NULL, Source TEXT NOT NULL, ToolName TEXT, Command TEXT NOT NULL,
+                        CommandLine TEXT NOT NULL, WallTime REAL, UserCPU REAL, SystemCPU REAL, MaxRSS INTEGER,
+                        ExitStatus INTEGER, OutputBytes INTEGER )""",
+                   #    The summary groups by this expression, so the index both groups and covers the lookup of
+                   #    one tool's runs.
+                   "CREATE INDEX IF NOT EXISTS ToolRuns_Tool ON ToolRuns (COALESCE(ToolName, Command), StartTime)",
+                   "CREATE INDEX IF NOT EXISTS ToolRuns_StartTime ON ToolRuns (StartTime)",
+                   """CREATE VIEW IF NOT EXISTS ToolRunSummary AS
+                        SELECT COALESCE(ToolName, Command) AS Tool, COUNT(*) AS Runs,
+                            AVG(WallTime) AS AvgWallTime, MAX(WallTime) AS MaxWallTime,
+                            AVG(UserCPU + SystemCPU) AS AvgCPU, MAX(UserCPU + SystemCPU) AS MaxCPU,
+                            AVG(MaxRSS) AS AvgMaxRSS, MAX(MaxRSS) AS MaxRSS,
+                            AVG(OutputBytes) AS AvgOutputBytes, SUM(ExitStatus != 0) AS Failures,
+                            MAX(StartTime) AS LastRun
+                        FROM ToolRuns GROUP BY COALESCE(ToolName, Command)""")
+
+SUMMARY_COLUMNS = ('Tool', 'Runs', 'AvgWallTime', 'MaxWallTime', 'AvgCPU', 'MaxCPU', 'AvgMaxRSS', 'MaxRSS',
+                   'AvgOutputBytes', 'Failures', 'LastRun')
+
+
+#   MeteredSpawner's helper:  a small Python process, started once, which starts the commands it is sent with
+#   posix_spawnp() and reaps them with os.wait4() as soon as they exit.  A request is the length (4 bytes) followed by
+#   {'commands': [argv, ...], 'env', 'session', 'group'} as JSON, sent with each command's stdin, stdout and stderr
+#   as SCM_RIGHTS file descriptors.  With 'group' the first command leads a new process group which the others join.
+#   Replies are frames:  kind (1 byte), length (4 bytes), payload.  Kinds:  's' started ([[pid, monotonic start
+#   time], ...]), 'e' not started ([errno, message, file]), 'x' exited ([pid, exit code, monotonic exit time,
+#   user CPU, system CPU, max RSS]).
+#   The helper reaps only while it holds the lock a request is started under, so a group's leader, if it exits
+#   at once, is still there for the rest of the group to join, and a command's exit is never sent before its start.
+#   Python ignores SIGPIPE and SIGXFSZ, and posix_spawnp() keeps ignored signals ignored, so the commands are given
+#   their default actions with setsigdef, as Popen does, e.g. for yes | head -1 to end yes quietly.
+SPAWN_FRAME_HEADER  = Struct('!cI')
+SPAWN_REQUEST_HEADER = Struct('!I')
+LOST_EXIT_CODE      = -1        #   returncode of a command whose exit the helper did not report, e.g. it was killed
+SPAWN_HELPER_PROGRAM = """
+import os, sys, json, struct, socket, signal, threading, time
+channel = socket.socket(fileno=int(sys.argv[1]))
+os.set_inheritable(channel.fileno(), False)
+frameHeader = struct.Struct('!cI')
+children = threading.Condition()
+running = [0]
+def send(kind, payload):
+    channel.sendall(frameHeader.pack(kind, len(payload)) + payload)
+def reap():
+    while True:
+        with children:
+            while running[0] == 0:
+                children.wait()
+        os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+        with children:
+            while running[0] > 0:
+                pid, status, usage = os.wait4(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                running[0] -= 1
+                send(b'x', json.dumps([pid, os.waitstatus_to_exitcode(status), time.monotonic(), usage.ru_utime,
+                                       usage.ru_stime, usage.ru_maxrss]).encode())
+threading.Thread(target=reap, daemon=True).start()
+while True:
+    data, fds, flags, address = socket.recv_fds(channel, 65536, 255)
+    if not data:
+        break
+    while len(data) < 4 or len(data) < 4 + struct.unpack('!I', data[:4])[0]:
+        part = channel.recv(65536)
+        if not part:
+            sys.exit(0)
+        data += part
+    request = json.loads(data[4:])
+    try:
+        for fd in fds:
+            os.set_inheritable(fd, False)
+        with children:
+            started = []
+            try:
+                for index, argv in enumerate(request['commands']):
+                    options = {}
+                    if request['session']:
+                        options['setsid'] = True
+                    elif request['group']:
+                        options['setpgroup'] = 0 if index == 0 else started[0][0]
+                    startTime = time.monotonic()
+                    pid = os.posix_spawnp(argv[0], argv, request['env'],
+                                          file_actions=[(os.POSIX_SPAWN_DUP2, fd, stream) for stream, fd in
+                                                        enumerate(fds[index * 3: index * 3 + 3])],
+                                          setsigdef=(signal.SIGPIPE, signal.SIGXFSZ), **options)
+                    started.append([pid, startTime])
+                    running[0] += 1
+                    children.notify()
+            except OSError as error:
+                for pid, startTime in started:
+                    os.kill(pid, signal.SIGKILL)
+                send(b'e', json.dumps([error.errno, error.strerror, argv[0]]).encode())
+                continue
+            send(b's', json.dumps(started).encode())
+    finally:
+        for fd in fds:
+            os.close(fd)
+"""
+
+
+class MeteredSpawner:
+    """
+    The helper process which starts MeteredPopen commands, started on first use and again if it has died.
+    """
+
+    lock        = Lock()            #   one start request at a time
+    channel     = None
+    pending     = None              #   the MeteredPopen objects being started
+    started     = SimpleQueue()     #   None, or the OSError, for the pending start
+    processes   = {}                #   pid -> MeteredPopen, until its exit is reported
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def startHelper():
+        channel, helperChannel = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            Popen((sys.executable, '-I', '-S', '-c', SPAWN_HELPER_PROGRAM, str(helperChannel.fileno())),
+                  pass_fds=(helperChannel.fileno(),), stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL)
+        finally:
+            helperChannel.close()
+        MeteredSpawner.channel = channel
+        Thread(target=MeteredSpawner.readReplies, args=(channel,), name="MeteredSpawner", daemon=True).start()
+
+    @staticmethod
+    def receive(channel, size: int):
+        data = b''
+        while len(data) < size:
+            part = channel.recv(size - len(data))
+            if not part:
+                return None
+            data += part
+        return data
+
+    @staticmethod
+    def readReplies(channel):
+        #   Reply thread.
+        while True:
+            header = MeteredSpawner.receive(channel, SPAWN_FRAME_HEADER.size)
+            payload = None if header is None else \
+                MeteredSpawner.receive(channel, SPAWN_FRAME_HEADER.unpack(header)[1])
+            if payload is None:
+                break
+            kind = SPAWN_FRAME_HEADER.unpack(header)[0]
+            if kind == b's':
+                for process, (pid, startTime) in zip(MeteredSpawner.pending, json.loads(payload)):
+                    process.pid = pid
+                    process.startTime = startTime
+                    MeteredSpawner.processes[pid] = process
+                MeteredSpawner.started.put(None)
+            elif kind == b'e':
+                errorNumber, message, fileName = json.loads(payload)
+                MeteredSpawner.started.put(OSError(errorNumber, message, fileName))
+            else:
+                pid, exitCode, endTime, userCPU, systemCPU, maxRSS = json.loads(payload)
+                process = MeteredSpawner.processes.pop(pid, None)
+                if process is not None:
+                    process.setExited(exitCode, endTime, {'userCPU': userCPU, 'systemCPU': systemCPU,
+                                                          'maxRSS': maxRSS})
+        channel.close()
+        #   The helper has gone, and with it the exits of the commands it started.
+        with MeteredSpawner.lock:
+            if MeteredSpawner.channel is channel:
+                MeteredSpawner.channel = None
+            if MeteredSpawner.pending is not None:
+                MeteredSpawner.started.put(OSError(errno.ECHILD, "MeteredSpawner helper process ended"))
+        for pid in list(MeteredSpawner.processes.keys()):
+            MeteredSpawner.processes.pop(pid).setExited(LOST_EXIT_CODE, monotonic(), None)
+
+    @staticmethod
+    def spawn(processes, session: bool, group: bool):
+        """
+        Start processes, MeteredPopen objects whose streams are open, in one request.  Sets their pids.  Raises
+        OSError, e.g. FileNotFoundError, if one cannot be started, in which case none are left running.
+        :param group:   The first process leads a new process group, which the others join.
+        """
+        fds = []
+        for process in processes:
+            fds.extend(process.childFds)
+        request = json.dumps({'commands': [[str(arg) for arg in process.args] for process in processes],
+                              'env': dict(os.environ), 'session': session, 'group': group}).encode()
+        with MeteredSpawner.lock:
+            if MeteredSpawner.channel is None:
+                MeteredSpawner.startHelper()
+            MeteredSpawner.pending = processes
+            try:
+                socket.send_fds(MeteredSpawner.channel, [SPAWN_REQUEST_HEADER.pack(len(request)) + request], fds)
+                error = MeteredSpawner.started.get()
+            except OSError:
+                MeteredSpawner.channel.close()
+                MeteredSpawner.channel = None
+                raise
+            finally:
+                MeteredSpawner.pending = None
+        if error is not None:
+            raise error
+
+
+class MeteredPopen:
+    """
+    The parts of Popen the application uses, for a command started by MeteredSpawner's helper rather than by this
+    process, so that the peak memory reported for it is its own rather than this process's.  Reaped by the helper the
+    moment it exits, which records its resource usage and exit time.  getUsage() returns them.
+    stdin, stdout and stderr take None, PIPE, DEVNULL, STDOUT (stderr only), a file descriptor or a file.
+    process_group may only be 0, a new group;  startPipeline() starts commands which share one.
+    """
+
+    def __init__(self, args, stdin=None, stdout=None, stderr=None, start_new_session: bool=False,
+                 process_group: int=None, start: bool=True):
+        if not isinstance(args, (list, tuple)) or len(args) == 0:
+            raise Exception("MeteredPopen constructor - Invalid args argument:  " + str(args))
+        if process_group not in (None, 0):
+            raise Exception("MeteredPopen constructor - Invalid process_group argument:  " + str(process_group))
+        self.args = args
+        self.pid = None
+        self.returncode = None
+        self.stdin = None
+        self.stdout = None
+        self.stderr = None
+        self.usage = None
+        self.startDateTime = datetime.now()
+        self.startTime = None           #   monotonic, from the helper
+        self.endTime = None
+        self.exited = Event()
+        self.childFds = []
+        self.childEnds = []             #   this process's copies of the descriptors given to the command
+        try:
+            self.openStreams(stdin, stdout, stderr)
+            if start:
+                MeteredSpawner.spawn((self,), start_new_session, process_group == 0)
+        except BaseException:
+            self.closeStreams()
+            raise
+        finally:
+            if start:
+                self.closeChildEnds()
+
+    def openStreams(self, stdin, stdout, stderr):
+        for index, stream in enumerate((stdin, stdout, stderr)):
+            if stream is None:
+                self.childFds.append(index)
+            elif stream == DEVNULL:
+                self.childEnds.append(os.open(os.devnull, os.O_RDWR))
+                self.childFds.append(self.childEnds[-1])
+            elif stream == PIPE:
+                readFd, writeFd = os.pipe()
+                if index == 0:
+                    self.childEnds.append(readFd)
+                    self.stdin = open(writeFd, 'wb')
+                else:
+                    self.childEnds.append(writeFd)
+                    setattr(self, ('stdout', 'stderr')[index - 1], open(readFd, 'rb'))
+                self.childFds.append(self.childEnds[-1])
+            elif stream == STDOUT and index == 2:
+                self.childFds.append(self.childFds[1])
+            elif isinstance(stream, int):
+                self.childFds.append(stream)
+            elif hasattr(stream, 'fileno'):
+                self.childFds.append(stream.fileno())
+            else:
+                raise Exception("MeteredPopen.openStreams - Invalid stream argument:  " + str(stream))
+
+    def closeChildEnds(self):
+        while len(self.childEnds) > 0:
+            os.close(self.childEnds.pop())
+
+    def closeStreams(self):
+        self.closeChildEnds()
+        for stream in (self.stdin, self.stdout, self.stderr):
+            if stream is not None:
+                stream.close()
+
+    @staticmethod
+    def startPipeline(commandLines, output: int):
+        """
+        Start commandLines as a pipe chain, each command's stdout connected directly to the next one's stdin, all in
+        one new process group whose id is the first command's pid.  The last command's stdout and every command's
+        stderr go to output, a file descriptor.
+        :return:    List of MeteredPopen, in pipeline order.  Raises OSError if one cannot be started, in which case
+                    none are left running.
+        """
+        processes = []
+        try:
+            stdin = DEVNULL
+            for index, commandLine in enumerate(commandLines):
+                processes.append(MeteredPopen(commandLine, stdin=stdin,
+                                              stdout=output if index == len(commandLines) - 1 else PIPE,
+                                              stderr=output, start=False))
+                stdin = processes[-1].stdout
+            MeteredSpawner.spawn(processes, False, True)
+        except BaseException:
+            for process in processes:
+                process.closeStreams()
+            raise
+        finally:
+            #   This process's copies of the pipes between the commands are closed, so that the data goes from
+            #   command to command in the kernel and each sees end of input, or SIGPIPE, as in a shell pipeline.
+            for process in processes:
+                process.closeChildEnds()
+            for process in processes[:-1]:
+                process.stdout.close()
+        return processes
+
+    def setExited(self, returnCode: int, endTime: float, usage: dict):
+        #   Reply thread.
+        self.endTime = endTime
+        self.usage = usage
+        self.returncode = returnCode
+        self.exited.set()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout: float=None):
+        if not self.exited.wait(timeout):
+            raise TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def communicate(self, input: bytes=None, timeout: float=None):
+        """
+        Write input, if any, read stdout and stderr to their ends and wait for the command.  timeout applies to the
+        wait after the output has ended.
+        """
+        if self.stdin is not None:
+            try:
+                if input is not None:
+                    self.stdin.write(input)
+            finally:
+                self.stdin.close()
+        errorParts = []
+        errorReader = None
+        if self.stderr is not None:
+            errorReader = Thread(target=lambda: errorParts.append(self.stderr.read()), daemon=True)
+            errorReader.start()
+        output = None
+        if self.stdout is not None:
+            with self.stdout:
+                output = self.stdout.read()
+        if errorReader is not None:
+            errorReader.join()
+            self.stderr.close()
+        self.wait(timeout)
+        return output, errorParts[0] if errorReader is not None else None
+
+    def send_signal(self, signalNumber: int):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, signalNumber)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(SIGTERM)
+
+    def kill(self):
+        self.send_signal(SIGKILL)
+
+    def getUsage(self):
+        """
+        :return:    {'wallTime', 'userCPU', 'systemCPU' (seconds), 'maxRSS' (KB)}, or None before the process has
+                    exited, or if its exit was not reported.
+        """
+        if self.usage is None:
+            return None
+        return {'wallTime': self.endTime - self.startTime, 'userCPU': self.usage['userCPU'],
+                'systemCPU': self.usage['systemCPU'], 'maxRSS': self.usage['maxRSS']}
+
+
+class RunMetrics:
+
+    schemaReady = set()
+    #   Recording must never stop a command's output from being shown, so a failure is reported once, not raised.
+    failureReported = False
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def getDBPath():
+        #   model.ToolDB imports this module.
+        from model.ToolDB import ToolManager
+        return ToolManager.getDBPath()
+
+    @staticmethod
+    def getConnection(dbPath: str=None):
+        dbPath = RunMetrics.getDBPath() if dbPath is None else dbPath
+        connection = ConnectionManager.getConnection(dbPath)
+        if dbPath not in RunMetrics.schemaReady:
+            with ConnectionManager.transaction(dbPath) as cursor:
+                for statement in TOOL_RUNS_SQL:
+                    cursor.execute(statement)
+            RunMetrics.schemaReady.add(dbPath)
+        return connection
+
+    @staticmethod
+    def record(source: str, process: MeteredPopen, outputBytes: int=None, toolName: str=None, dbPath: str=None):
+        """
+        Store a finished run of process.
+        :param source:      What ran it, e.g. 'Tool.run', 'LinuxUtilities', 'Console'.
+        :param outputBytes: Bytes of output read from the process, None if its output went elsewhere, e.g. to the
+                            next command in a pipeline.
+        :return:            The RunId, or None if the run could not be recorded.
+        """
+        if not isinstance(source, str):
+            raise Exception("RunMetrics.record - Invalid source argument:  " + str(source))
+        if not isinstance(process, MeteredPopen):
+            raise Exception("RunMetrics.record - Invalid process argument:  " + str(process))
+        usage = process.getUsage()
+        if usage is None:
+            usage = {'wallTime': None, 'userCPU': None, 'systemCPU': None, 'maxRSS': None}
+        commandLine = process.args
+        if isinstance(commandLine, (str, bytes)):
+            commandLine = commandLine.split()
+        commandLine = tuple(str(arg) for arg in commandLine)
+        try:
+            cursor = RunMetrics.getConnection(dbPath).execute(
+                """INSERT INTO ToolRuns ( StartTime, Source, ToolName, Command, CommandLine, WallTime, UserCPU,
+                    SystemCPU, MaxRSS, ExitStatus, OutputBytes ) VALUES( ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ? )""",
+                (str(process.startDateTime), source, toolName, os.path.basename(commandLine[0]),
+                 ' '.join(commandLine), usage['wallTime'], usage['userCPU'], usage['systemCPU'], usage['maxRSS'],
+                 process.returncode, outputBytes))
+            return cursor.lastrowid
+        except Exception as error:
+            if not RunMetrics.failureReported:
+                RunMetrics.failureReported = True
+                print("RunMetrics.record - runs are not being recorded:  " + str(error), file=sys.stderr)
+            return None
+
+    @staticmethod
+    def getSummary(orderBy: str='MaxWallTime', limit: int=20, dbPath: str=None):
+        """
+        :param orderBy: A ToolRunSummary column, in descending order.
+        :return:        List of OrderedDict of SUMMARY_COLUMNS.
+        """
+        if orderBy not in SUMMARY_COLUMNS:
+            raise Exception("RunMetrics.getSummary - Invalid orderBy argument:  " + str(orderBy))
+        if not isinstance(limit, int) or limit < 1:
+            raise Exception("RunMetrics.getSummary - Invalid limit argument:  " + str(limit))
+        cursor = RunMetrics.getConnection(dbPath).execute(
+            "SELECT " + ", ".join(SUMMARY_COLUMNS) + " FROM ToolRunSummary ORDER BY " + orderBy + " DESC LIMIT ?",
+            (limit,))
+        return [OrderedDict(zip(SUMMARY_COLUMNS, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def slowestTools(limit: int=20, dbPath: str=None):
+        return RunMetrics.getSummary('MaxWallTime', limit, dbPath)
+
+    @staticmethod
+    def hungriestTools(limit: int=20, dbPath: str=None):
+        return RunMetrics.getSummary('MaxRSS', limit, dbPath)
+
+
+def benchmarkRunMetrics(runs: int=500, summaryRuns: int=20000, toolCount: int=40, parentMB: int=300):
+    """
+    Milliseconds per run and wait of /bin/true with Popen and MeteredPopen, the peak memory each reports for it from a
+    process parentMB larger, and milliseconds per RunMetrics.record() and for the summary over summaryRuns runs of
+    toolCount tools.
+    """
+    from tempfile import TemporaryDirectory
+    from random import Random
+    results = OrderedDict()
+    for popenClass in (Popen, MeteredPopen):
+        startTime = monotonic()
+        for runIdx in range(runs):
+            popenClass(('true',)).wait()
+        results[popenClass.__name__ + ' run and wait'] = (monotonic() - startTime) * 1000 / runs
+    #   Peak memory reported for true, which uses about 1 MB, run from this process grown by parentMB.
+    ballast = bytearray(parentMB * 1000000)
+    for offset in range(0, len(ballast), 4096):
+        ballast[offset] = 1
+    process = Popen(('true',))
+    results['Popen maxRSS of true, KB'] = os.wait4(process.pid, 0)[2].ru_maxrss
+    process.returncode = 0
+    process = MeteredPopen(('true',))
+    process.wait()
+    results['MeteredPopen maxRSS of true, KB'] = process.getUsage()['maxRSS']
+    ballast = None
+    with TemporaryDirectory() as folderPath:
+        dbPath = folderPath + '/LinuxTools.db'
+        process = MeteredPopen(('true',))
+        process.wait()
+        startTime = monotonic()
+        for runIdx in range(runs):
+            RunMetrics.record('benchmark', process, 0, 'true', dbPath=dbPath)
+        results['record'] = (monotonic() - startTime) * 1000 / runs
+        random = Random(19)
+        with ConnectionManager.transaction(dbPath) as cursor:
+            cursor.executemany("""INSERT INTO ToolRuns ( StartTime, Source, ToolName, Command, CommandLine, WallTime,
+                                    UserCPU, SystemCPU, MaxRSS, ExitStatus, OutputBytes )
+                                    VALUES( ?, 'benchmark', ?, 'tool', 'tool', ?, ?, ?, ?, 0, ? )""",
+                               ((str(runIdx), 'Tool ' + str(random.randrange(toolCount)), random.random(),
+                                 random.random(), random.random(), random.randrange(100000), random.randrange(10 ** 6))
+                                for runIdx in range(summaryRuns)))
+        startTime = monotonic()
+        RunMetrics.slowestTools(dbPath=dbPath)
+        results['summary'] = (monotonic() - startTime) * 1000
+        ConnectionManager.closeConnection(dbPath)
+    return results
+
+
+if __name__ == "__main__":
+    for operation, value in benchmarkRunMetrics().items():
+        print(operation + ":\t" + str(round(value, 3)) + ("" if operation.endswith('KB') else " ms"))
@@ -0,0 +1,357 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         model/TableReader.py
+#   Purpose:        Page by page reading of tables described by a TableDescriptor, so that views can scroll
+#                   console output tables of millions of rows while holding only a few pages in memory.
+#   Development:
+#       Pages are found by keyset, the sort key of the last row read, rather than by OFFSET, which makes SQLite
+#       step over every row before the page and so slows down the further into the table the page is.  A keyset
+#       query starts at the right place in the table's rowid b-tree, or in the sort column's index.
+#
+#       Keyset paging steps forward from a known key, so the key each page starts after is kept, one per page read.
+#       A jump to a page not reached yet, e.g. by dragging the scroll bar, finds its key with an OFFSET query which
+#       reads only keys, the rowid, or the sort column's index, which is still much less work than reading the
+#       rows of the pages before it.
+#
+#       SQLite sorts NULL before every other value, and (column, rowid) > (?, ?) is never true for a NULL column,
+#       so for a sort column the NULL rows are read as a segment of their own, in rowid order, ahead of the others
+#       ascending and after them descending.
+#
+#       2026-10-19: 1,000,000 row ps style table, 500 row pages (python -m model.TableReader):
+#                                               seconds         peak traced memory
+#               fetchall() of the table:        4.2 - 4.7       626 MB
+#               first page:                     0.002 - 0.003   0.2 MB
+#               page 1,000 by rowid, cold:      0.026 - 0.029
+#               page 1,000 by PID, cold:        0.026
+#               page 1,000, warm:               0.00003
+#               iterate all rows:               4.4 - 4.7       0.5 MB
+#           Reading the pages before page 1,000 to find its key took 1.9 - 2.1 s.
+#
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from model.DBInterface import TableDescriptor, ColumnAttrib, TableAttrib, ConsoleImport, SchemaCache
+from model.ConnectionManager import ConnectionManager
+
+
+class TableReader:
+    """
+    Reads a table in pages of pageSize rows, in rowid order or in the order of an indexed sort column, with ties
+    in the sort column ordered by rowid.
+    The pages most recently read, up to CACHED_PAGES, are kept, and the page after the one last read is fetched
+    in the background so that it is ready when the user scrolls to it.
+    Rows are tuples of the table's columns, as in SELECT *.
+    """
+
+    DEFAULT_PAGE_SIZE   = 500
+    CACHED_PAGES        = 4
+
+    #   Segments of the sort order.
+    ROWID_SEGMENT   = 'rowid'
+    NULL_SEGMENT    = 'null'
+    VALUE_SEGMENT   = 'value'
+
+    def __init__(self, tableDescriptor: TableDescriptor, sortColumn: str=None, descending: bool=False,
+                 pageSize: int=DEFAULT_PAGE_SIZE, prefetch: bool=True):
+        """
+        :param tableDescriptor: The table to read.
+        :param sortColumn:      Name of an indexed column to order the rows by, or None for rowid order.
+        :param descending:      Read from the end of the sort order.
+        :param pageSize:        Rows per page.
+        :param prefetch:        Fetch the next page in the background after each page read.
+        """
+        if tableDescriptor is None or not isinstance(tableDescriptor, TableDescriptor):
+            raise Exception("TableReader constructor - Invalid tableDescriptor argument:  " + str(tableDescriptor))
+        if pageSize is None or not isinstance(pageSize, int) or pageSize < 1:
+            raise Exception("TableReader constructor - Invalid pageSize argument:  " + str(pageSize))
+        columns = tableDescriptor.getTableInfo()['columns']
+        createSQL = tableDescriptor.getTableInfo().get(TableAttrib.CREATE_SQL)
+        if createSQL is None or 'WITHOUT ROWID' in createSQL.upper():
+            raise Exception("TableReader constructor - Table has no rowid:  " + tableDescriptor.getTtableName())
+        if sortColumn is not None:
+            if sortColumn not in columns:
+                raise Exception("TableReader constructor - Invalid sortColumn argument:  " + str(sortColumn))
+            if TableReader.isRowidAlias(columns, sortColumn):
+                sortColumn = None
+            elif not TableReader.isIndexed(tableDescriptor, sortColumn):
+                #   Every page would sort the whole table.
+                raise Exception("TableReader constructor - sortColumn is not indexed:  " + str(sortColumn))
+        self.tableDescriptor    = tableDescriptor
+        self.dbPath             = tableDescriptor.getDatabasePath()
+        self.sortColumn         = sortColumn
+        self.descending         = descending
+        self.pageSize           = pageSize
+        self.columnNames        = tuple(columns.keys())
+        self.sortIndex          = None if sortColumn is None else self.columnNames.index(sortColumn) + 1
+
+        tableName = ConsoleImport.quoteName(tableDescriptor.getTtableName())
+        direction = " DESC" if descending else ""
+        comparison = " < " if descending else " > "
+        select = "SELECT rowid, * FROM " + tableName
+        rowidOrder = " ORDER BY rowid" + direction + " LIMIT ?"
+        if sortColumn is None:
+            self.segments = (TableReader.ROWID_SEGMENT,)
+            self.firstSQL = {TableReader.ROWID_SEGMENT: select + rowidOrder}
+            self.nextSQL = {TableReader.ROWID_SEGMENT: select + " WHERE rowid" + comparison + "?" + rowidOrder}
+            self.seekSQL = {TableReader.ROWID_SEGMENT: "SELECT rowid FROM " + tableName + rowidOrder + " OFFSET ?"}
+            self.countSQL = {TableReader.ROWID_SEGMENT: "SELECT count(*) FROM " + tableName}
+        else:
+            quotedColumn = ConsoleImport.quoteName(sortColumn)
+            nullSelect = select + " WHERE " + quotedColumn + " IS NULL"
+            valueSelect = select + " WHERE " + quotedColumn + " IS NOT NULL"
+            valueOrder = " ORDER BY " + quotedColumn + direction + ", rowid" + direction + " LIMIT ?"
+            if descending:
+                self.segments = (TableReader.VALUE_SEGMENT, TableReader.NULL_SEGMENT)
+            else:
+                self.segments = (TableReader.NULL_SEGMENT, TableReader.VALUE_SEGMENT)
+            self.firstSQL = {TableReader.NULL_SEGMENT: nullSelect + " ORDER BY rowid" + direction + " LIMIT ?",
+                             TableReader.VALUE_SEGMENT: valueSelect + valueOrder}
+            self.nextSQL = {TableReader.NULL_SEGMENT: nullSelect + " AND rowid" + comparison + "? ORDER BY rowid" +
+                                                      direction + " LIMIT ?",
+                            TableReader.VALUE_SEGMENT: valueSelect + " AND (" + quotedColumn + ", rowid)" +
+                                                       comparison + "(?, ?)" + valueOrder}
+            #   Keys only, so these read the sort column's index and not the table.
+            self.seekSQL = {TableReader.NULL_SEGMENT: "SELECT rowid FROM " + tableName + " WHERE " + quotedColumn +
+                                                      " IS NULL" + rowidOrder + " OFFSET ?",
+                            TableReader.VALUE_SEGMENT: "SELECT rowid, " + quotedColumn + " FROM " + tableName +
+                                                       " WHERE " + quotedColumn + " IS NOT NULL" + valueOrder +
+                                                       " OFFSET ?"}
+            self.countSQL = {TableReader.NULL_SEGMENT: "SELECT count(*) FROM " + tableName + " WHERE " +
+                                                       quotedColumn + " IS NULL",
+                             TableReader.VALUE_SEGMENT: "SELECT count(*) FROM " + tableName + " WHERE " +
+                                                        quotedColumn + " IS NOT NULL"}
+
+        #   page number -> the position the page starts after: (segment index, key), key None for a segment's start.
+        self.pageStarts     = {0: (0, None)}
+        self.pageCache      = OrderedDict()
+        self.endPage        = None          #   number of pages, once the last one has been read
+        self.executor       = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self.prefetched     = None          #   (page number, Future)
+
+    @staticmethod
+    def isRowidAlias(columns: dict, columnName: str):
+        """
+        An INTEGER PRIMARY KEY column, e.g. rowId in console output tables, is another name for the rowid.
+        """
+        primaryKeys = [name for name, attributes in columns.items() if attributes[ColumnAttrib.PRIMARY_KEY_IDX] > 0]
+        return primaryKeys == [columnName] and columns[columnName][ColumnAttrib.TYPE].upper() == 'INTEGER'
+
+    @staticmethod
+    def isIndexed(tableDescriptor: TableDescriptor, columnName: str):
+        """
+        Whether columnName is the first column of one of the table's indexes.
+        """
+        cursor = ConnectionManager.getConnection(tableDescriptor.getDatabasePath(), readOnly=True).cursor()
+        try:
+            cursor.execute("PRAGMA index_list(" + ConsoleImport.quoteName(tableDescriptor.getTtableName()) + ")")
+            for indexRow in cursor.fetchall():
+                cursor.execute("PRAGMA index_info(" + ConsoleImport.quoteName(indexRow[1]) + ")")
+                for infoRow in cursor.fetchall():
+                    if infoRow[0] == 0 and infoRow[2] is not None and infoRow[2].lower() == columnName.lower():
+                        return True
+            return False
+        finally:
+            cursor.close()
+
+    def fetchPage(self, pageStart: tuple):
+        """
+        Read one page from the database, on whichever thread calls this.
+        :param pageStart:   (segment index, key) the page starts after.
+        :return:            (rows, start of the following page), the latter None if the table ends on this page.
+        """
+        segmentIdx, key = pageStart
+        connection = ConnectionManager.getConnection(self.dbPath, readOnly=True)
+        rows = []
+        while segmentIdx < len(self.segments):
+            segment = self.segments[segmentIdx]
+            limit = self.pageSize - len(rows)
+            if key is None:
+                cursor = connection.execute(self.firstSQL[segment], (limit,))
+            else:
+                cursor = connection.execute(self.nextSQL[segment], key + (limit,))
+            segmentRows = cursor.fetchall()
+            cursor.close()
+            rows.extend(segmentRows)
+            if len(segmentRows) == limit:
+                return tuple(row[1:] for row in rows), (segmentIdx, TableReader.rowKey(segment, segmentRows[-1], self.sortIndex))
+            segmentIdx += 1
+            key = None
+        return tuple(row[1:] for row in rows), None
+
+    @staticmethod
+    def rowKey(segment: str, row: tuple, sortIndex: int):
+        """
+        Keyset of a row read with one of the segment's queries, which all select the rowid first.
+        """
+        if segment == TableReader.VALUE_SEGMENT:
+            return row[sortIndex], row[0]
+        return row[0],
+
+    def seekPageStart(self, pageNumber: int):
+        """
+        Find where a page starts without reading the pages before it: the key of the row before the page is read
+        with one OFFSET query per segment, which steps over keys without building rows.
+        :return:    (segment index, key), or None if the page is past the end of the table.
+        """
+        rowsBefore = pageNumber * self.pageSize
+        connection = ConnectionManager.getConnection(self.dbPath, readOnly=True)
+        for segmentIdx, segment in enumerate(self.segments):
+            cursor = connection.execute(self.seekSQL[segment], (1, rowsBefore - 1))
+            row = cursor.fetchone()
+            cursor.close()
+            if row is not None:
+                return segmentIdx, TableReader.rowKey(segment, row, 1)
+            cursor = connection.execute(self.countSQL[segment])
+            rowsBefore -= cursor.fetchone()[0]
+            cursor.close()
+        return None
+
+    def readPage(self, pageNumber: int):
+        """
+        :param pageNumber:  Page to read, from 0.
+        :return:            Tuple of rows, empty past the end of the table.
+        """
+        if pageNumber is None or not isinstance(pageNumber, int) or pageNumber < 0:
+            raise Exception("TableReader.readPage - Invalid pageNumber argument:  " + str(pageNumber))
+        if pageNumber in self.pageCache:
+            self.pageCache.move_to_end(pageNumber)
+            rows = self.pageCache[pageNumber]
+        else:
+            if self.endPage is not None and pageNumber >= self.endPage:
+                return ()
+            if pageNumber not in self.pageStarts:
+                pageStart = self.seekPageStart(pageNumber)
+                if pageStart is None:
+                    return ()
+                self.pageStarts[pageNumber] = pageStart
+            rows = self.loadPage(pageNumber)
+        self.startPrefetch(pageNumber + 1)
+        return rows
+
+    def loadPage(self, pageNumber: int):
+        if self.prefetched is not None and self.prefetched[0] == pageNumber:
+            rows, nextStart = self.prefetched[1].result()
+            self.prefetched = None
+        else:
+            rows, nextStart = self.fetchPage(self.pageStarts[pageNumber])
+        if nextStart is None:
+            self.endPage = pageNumber + 1 if len(rows) > 0 else pageNumber
+        else:
+            self.pageStarts[pageNumber + 1] = nextStart
+        self.pageCache[pageNumber] = rows
+        while len(self.pageCache) > TableReader.CACHED_PAGES:
+            self.pageCache.popitem(last=False)
+        return rows
+
+    def startPrefetch(self, pageNumber: int):
+        if self.executor is None or pageNumber in self.pageCache or pageNumber not in self.pageStarts:
+            return
+        if self.prefetched is not None:
+            if self.prefetched[0] == pageNumber:
+                return
+            self.prefetched[1].cancel()
+        self.prefetched = (pageNumber, self.executor.submit(self.fetchPage, self.pageStarts[pageNumber]))
+
+    def pages(self):
+        """
+        Generator of the pages of the table, in order, without keeping them in the page cache.
+        """
+        pageStart = (0, None)
+        if self.executor is None:
+            while pageStart is not None:
+                rows, pageStart = self.fetchPage(pageStart)
+                if len(rows) > 0:
+                    yield rows
+            return
+        future = self.executor.submit(self.fetchPage, pageStart)
+        while future is not None:
+            rows, pageStart = future.result()
+            #   The next page is fetched while the consumer works on this one.
+            future = None if pageStart is None else self.executor.submit(self.fetchPage, pageStart)
+            if len(rows) > 0:
+                yield rows
+
+    def __iter__(self):
+        for rows in self.pages():
+            yield from rows
+
+    def rowCount(self):
+        cursor = ConnectionManager.getConnection(self.dbPath, readOnly=True).execute(
+            "SELECT count(*) FROM " + ConsoleImport.quoteName(self.tableDescriptor.getTtableName()))
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count
+
+    def getColumnNames(self):
+        return self.columnNames
+
+    def close(self):
+        """
+        Stop the background fetch thread and forget cached pages.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.prefetched = None
+        self.pageCache.clear()
+
+
+def benchmarkTableReader(rowCount: int=1000000, pageSize: int=500):
+    """
+    Time and peak traced memory of reading a rowCount row table all at once, and with a TableReader.
+    :return:    OrderedDict of (seconds, peak MB or None).
+    """
+    import datetime
+    import tracemalloc
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    from model.DBInterface import TabularImport
+    lines = ['F S UID          PID    PPID  C PRI  NI ADDR SZ WCHAN  STIME TTY          TIME CMD']
+    for lineIdx in range(rowCount):
+        lines.append('1 S root     ' + str(lineIdx + 1).rjust(8) + '       2  0  80   0 -     0 kthrea 08:08 ?' +
+                     '        00:00:00 /usr/lib/command-' + str(lineIdx % 500) + ' --option value')
+    results = OrderedDict()
+    with TemporaryDirectory() as folderPath:
+        dbPath = folderPath + '/Benchmark.db'
+        TabularImport(dbPath).importOutput(['ps', '-lf'], '\n'.join(lines), str(datetime.datetime.now()))
+        lines = None
+        tableDescriptor = TableDescriptor('Benchmark', dbPath, 'ps_lf')
+
+        def measure(name, function, traceMemory: bool=False):
+            #   Tracing slows allocation several times over, so memory is measured on a second run.
+            startTime = perf_counter()
+            function()
+            elapsed = perf_counter() - startTime
+            peak = None
+            if traceMemory:
+                tracemalloc.start()
+                function()
+                peak = tracemalloc.get_traced_memory()[1] / 1000000
+                tracemalloc.stop()
+            results[name] = (elapsed, peak)
+
+        connection = ConnectionManager.getConnection(dbPath)
+        measure('fetchall() of the table', lambda: connection.execute('SELECT * FROM ps_lf').fetchall(), True)
+        reader = TableReader(tableDescriptor, pageSize=pageSize)
+        measure('first page', lambda: reader.fetchPage((0, None)), True)
+        middlePage = rowCount // pageSize // 2
+        measure('page ' + str(middlePage) + ' by rowid, cold', lambda: reader.readPage(middlePage))
+        measure('page ' + str(middlePage) + ' by rowid, warm', lambda: reader.readPage(middlePage))
+        measure('iterate all rows', lambda: sum(1 for row in reader), True)
+        reader.close()
+        reader = TableReader(tableDescriptor, sortColumn='PID', descending=True, pageSize=pageSize)
+        measure('first page by PID, descending', lambda: reader.readPage(0))
+        measure('page ' + str(middlePage) + ' by PID, descending, cold', lambda: reader.readPage(middlePage))
+        reader.close()
+        ConnectionManager.closeConnection(dbPath)
+        SchemaCache.invalidate(dbPath)
+    return results
+
+
+if __name__ == "__main__":
+    for name, (seconds, megabytes) in benchmarkTableReader().items():
+        print(name + ":\t" + str(round(seconds, 4)) + " s" +
+              ("" if megabytes is None else "\t" + str(round(megabytes, 1)) + " MB"))
@@ -63,25 +63,46 @@
 #                           (Breach detection with Linux filesystem forensics)
 #                           (23 Apr 2018 | Gary Smith (/users/greptile))
 #
+#       2026-10-19: Tool arguments moved from a pickled OrderedDict in Tools.Arguments to ToolArguments, one row per
+#           flag in command line order, indexed on Flag, with Tools indexed on LinuxCommand.  Loading the tool map
+#           no longer unpickles anything and ToolManager.findTools() answers command and flag queries in SQL.
+#           An existing LinuxTools.db is converted the first time ToolManager opens it (ToolManager.migrateDB).
+#       2026-10-19: ToolRegistry caches the Tool objects.  Triggers log every change to Tools, ToolArguments and
+#           ToolSetIndex in ToolChanges, so after the first read ToolManager.readDB() re-reads only the tools changed
+#           since, by this or any other process.  PRAGMA data_version was not enough: it does not change for
+#           writes made through the connection that asks.
+#           Tool map, 2,000 tools (ToolDB.benchmarkToolRegistry):
+#               full read:          32 ms
+#               nothing changed:    0.4 ms
+#               one tool added:     1.4 ms
+#           Each refresh which reads new changes trims ToolChanges to its last TOOL_CHANGES_KEEP rows, so the log
+#           does not grow for the life of the database.
+#       2026-10-19: Unique index on Tools.Name.  toolExists, getTool and removeTool are parameterized point lookups
+#           on it, so the tool name can be checked on every keystroke in ConfirmCommandLine.  Tools which already
+#           shared a name are renamed "<name> (<RowId>)" when the index is added.
+#
 
 
-from sqlite3 import connect, Binary
 from os import environ
 from collections import OrderedDict
 from datetime import datetime
 from copy import deepcopy
-from subprocess import Popen, PIPE, STDOUT
-from pickle import loads, dumps
+from subprocess import PIPE, STDOUT
+from pickle import loads
+from threading import Lock
 from enum import Enum
 
 from tkinter import Tk, messagebox
 
 from model.Installation import USER_DATA_FOLDER
+from model.ConnectionManager import ConnectionManager
+from model.RunMetrics import MeteredPopen, RunMetrics
 
 PROGRAM_TITLE = "Tools Database"
 
-INSTALLING  = False
-TESTING     = True
+INSTALLING      = False
+TESTING         = True
+BENCHMARKING    = False
 
 
 class ExportFormat(Enum):
@@ -130,18 +151,27 @@ class Tool:
         return self.command
 
     def getArgList(self):
-        #   Uses flag=value format for parameters, flags with arguments
+        #   A flag stored with a trailing '=', e.g. '--lines=', is joined to its argument, '--lines=1000'.
+        #   Any other flag with an argument is followed by it as a separate argument, e.g. '-o', 'json'.
         argList = [self.command, ]
         for name, value in self.arguments.items():
-            argString = name
-            if value is not None:
-                argString += "=" + value
-            argList.append(argString)
+            if value is None:
+                argList.append(name)
+            elif name.endswith('='):
+                argList.append(name + value)
+            else:
+                argList.append(name)
+                argList.append(value)
         return tuple(argList)
 
+    def getCommandLine(self):
+        #   getArgList() with the command split into words, e.g. 'sudo dpkg', for Popen.
+        return tuple(self.command.split()) + self.getArgList()[1:]
+
     def run(self, background: bool=False):
-        sub = Popen(self.getArgList(), stdout=PIPE, stderr=STDOUT)
+        sub = MeteredPopen(self.getCommandLine(), stdout=PIPE, stderr=STDOUT)
         output, error_message = sub.communicate()
+        RunMetrics.record('Tool.run', sub, len(output), toolName=self.name)
         return output.decode('utf-8')
 
     def __str__(self):
@@ -193,6 +223,57 @@ class ToolSet:
             raise Exception("ToolSet constructor - Invalid name argument:  " + str(name))
 
 
+#   A tool's arguments are rows of ToolArguments in command line order, Value NULL for a flag without an argument.
+#   Flag is stored as written in Tool.arguments, including a trailing '=' where the argument follows one.
+TOOLS_TABLE_SQL         = """CREATE TABLE "Tools" ( 
+                            `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
+                            `timeStamp` TEXT NOT NULL, 
+                            `Name` TEXT NOT NULL, 
+                            `Description` TEXT NOT NULL, 
+                            `LinuxCommand` TEXT NOT NULL, 
+                            `deleted` INTEGER )"""
+TOOL_ARGUMENTS_TABLE_SQL = """CREATE TABLE IF NOT EXISTS "ToolArguments" ( 
+                            `ToolRowId` INTEGER NOT NULL REFERENCES Tools(RowId) ON DELETE CASCADE, 
+                            `Position` INTEGER NOT NULL, 
+                            `Flag` TEXT NOT NULL, 
+                            `Value` TEXT, 
+                            PRIMARY KEY (ToolRowId, Position) ) WITHOUT ROWID"""
+TOOL_INDEXES_SQL        = ("CREATE UNIQUE INDEX IF NOT EXISTS Tools_Name ON Tools (Name)",
+                           "CREATE INDEX IF NOT EXISTS Tools_LinuxCommand ON Tools (LinuxCommand)",
+                           "CREATE INDEX IF NOT EXISTS ToolArguments_Flag ON ToolArguments (Flag, ToolRowId)")
+
+#   Every change to Tools, ToolArguments or ToolSetIndex, from this or any other process, is logged in ToolChanges by
+#   trigger, ToolRowId NULL for a ToolSetIndex change, so ToolRegistry can re-read just the tools changed since it last
+#   looked.  AUTOINCREMENT keeps ChangeId increasing even if the log is trimmed.  ToolRegistry trims it to the last
+#   TOOL_CHANGES_KEEP changes once it has read them, so registries in other processes which are less far behind than
+#   that still find theirs;  one further behind reads every tool again.
+TOOL_CHANGES_KEEP       = 1000
+TOOL_CHANGES_SQL        = ("""CREATE TABLE IF NOT EXISTS "ToolChanges" ( 
+                            `ChangeId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, 
+                            `ToolRowId` INTEGER )""",
+                           "CREATE TRIGGER IF NOT EXISTS Tools_Insert AFTER INSERT ON Tools BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (NEW.RowId); END",
+                           "CREATE TRIGGER IF NOT EXISTS Tools_Update AFTER UPDATE ON Tools BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (OLD.RowId); "
+                           "INSERT INTO ToolChanges (ToolRowId) SELECT NEW.RowId WHERE NEW.RowId <> OLD.RowId; END",
+                           "CREATE TRIGGER IF NOT EXISTS Tools_Delete AFTER DELETE ON Tools BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (OLD.RowId); END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolArguments_Insert AFTER INSERT ON ToolArguments BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (NEW.ToolRowId); END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolArguments_Update AFTER UPDATE ON ToolArguments BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (OLD.ToolRowId); "
+                           "INSERT INTO ToolChanges (ToolRowId) SELECT NEW.ToolRowId "
+                           "WHERE NEW.ToolRowId <> OLD.ToolRowId; END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolArguments_Delete AFTER DELETE ON ToolArguments BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (OLD.ToolRowId); END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolSetIndex_Insert AFTER INSERT ON ToolSetIndex BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (NULL); END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolSetIndex_Update AFTER UPDATE ON ToolSetIndex BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (NULL); END",
+                           "CREATE TRIGGER IF NOT EXISTS ToolSetIndex_Delete AFTER DELETE ON ToolSetIndex BEGIN "
+                           "INSERT INTO ToolChanges (ToolRowId) VALUES (NULL); END")
+
+
 class ToolManager:
 
     __record  = OrderedDict()
@@ -200,65 +281,184 @@ class ToolManager:
     ToolMap = OrderedDict()
     __ChangeMap = OrderedDict()
 
+    #   Databases checked, and migrated if needed, by this process.
+    schemaChecked = set()
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def getDBPath():
+        return environ['HOME']+'/'+USER_DATA_FOLDER+'/'+ToolManager.__DBFile
+
+    @staticmethod
+    def getConnection():
+        dbPath = ToolManager.getDBPath()
+        connection = ConnectionManager.getConnection(dbPath)
+        if dbPath not in ToolManager.schemaChecked:
+            ToolManager.migrateDB(dbPath)
+            ToolManager.schemaChecked.add(dbPath)
+        return connection
+
+    @staticmethod
+    def migrateDB(dbPath: str):
+        """
+        One time conversion of a LinuxTools.db whose Tools table keeps each tool's arguments as a pickled
+        OrderedDict in an Arguments BLOB column: the arguments are moved to ToolArguments and Tools is rebuilt
+        without the column, so nothing is unpickled after this.
+        Also adds the ToolChanges log and its triggers, and the unique index on tool name, to a database created
+        before they existed.
+        """
+        with ConnectionManager.transaction(dbPath) as cursor:
+            #   The unique name index is the last addition, so a database which has it is up to date.
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'Tools_Name'")
+            if cursor.fetchone() is not None:
+                return
+            cursor.execute("PRAGMA table_info(Tools)")
+            columnNames = [definition[1] for definition in cursor.fetchall()]
+            if len(columnNames) == 0:           #   Not created yet, createLinuxToolsDB() makes the full schema.
+                return
+            #   Nothing stopped duplicate names before the index.  The first of each keeps its name.
+            cursor.execute("""UPDATE Tools SET Name = Name || ' (' || RowId || ')' 
+                                WHERE RowId NOT IN (SELECT MIN(RowId) FROM Tools GROUP BY Name)""")
+            if cursor.rowcount > 0:
+                print("ToolManager.migrateDB:\trenamed " + str(cursor.rowcount) + " tools with duplicate names")
+            if 'Arguments' in columnNames:
+                ToolManager.migratePickledArguments(cursor, dbPath)
+            for changesSQL in TOOL_CHANGES_SQL:
+                cursor.execute(changesSQL)
+            for indexSQL in TOOL_INDEXES_SQL:
+                cursor.execute(indexSQL)
+
+    @staticmethod
+    def migratePickledArguments(cursor, dbPath: str):
+        """
+        Move the pickled Tools.Arguments to ToolArguments and rebuild Tools without the column, keeping every other
+        column, e.g. deleted, including any TOOLS_TABLE_SQL does not have.
+        """
+        print("ToolManager.migrateDB:\tmoving pickled tool arguments to ToolArguments in " + dbPath)
+        cursor.execute(TOOL_ARGUMENTS_TABLE_SQL)
+        cursor.execute("SELECT RowId, Arguments FROM Tools")
+        argumentRows = []
+        for rowId, pickled in cursor.fetchall():
+            for position, (flag, value) in enumerate(loads(pickled).items()):
+                argumentRows.append((rowId, position, flag, value))
+        cursor.executemany("INSERT INTO ToolArguments (ToolRowId, Position, Flag, Value) VALUES(?,?,?,?)",
+                           argumentRows)
+        #   ALTER TABLE DROP COLUMN needs SQLite 3.35, so the table is copied instead.
+        cursor.execute(TOOLS_TABLE_SQL.replace('"Tools"', '"Tools_migrated"', 1))
+        cursor.execute("PRAGMA table_info(Tools)")
+        columns = [(definition[1], definition[2]) for definition in cursor.fetchall() if definition[1] != 'Arguments']
+        cursor.execute("PRAGMA table_info(Tools_migrated)")
+        migratedNames = set(definition[1] for definition in cursor.fetchall())
+        for columnName, columnType in columns:
+            if columnName not in migratedNames:
+                cursor.execute("ALTER TABLE Tools_migrated ADD COLUMN `" + columnName + "` " + columnType)
+        columnList = ', '.join('`' + columnName + '`' for columnName, columnType in columns)
+        print("ToolManager.migrateDB:\tkeeping Tools columns " + columnList)
+        cursor.execute("INSERT INTO Tools_migrated (" + columnList + ") SELECT " + columnList + " FROM Tools")
+        cursor.execute("DROP TABLE Tools")
+        cursor.execute("ALTER TABLE Tools_migrated RENAME TO Tools")
+
+    @staticmethod
+    def insertTool(cursor, tool: Tool, timeStamp):
+        cursor.execute('''INSERT INTO Tools( timeStamp, Name, Description, LinuxCommand ) 
+                        VALUES( ?, ?, ?, ? )''', (timeStamp, tool.name, tool.description, tool.command))
+        toolRowId = cursor.lastrowid
+        cursor.executemany("INSERT INTO ToolArguments (ToolRowId, Position, Flag, Value) VALUES(?,?,?,?)",
+                           ((toolRowId, position, flag, value)
+                            for position, (flag, value) in enumerate(tool.arguments.items())))
+        return toolRowId
+
     @staticmethod
     def addTool(tool: Tool):
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+ToolManager.__DBFile)
-        cursor = connection.cursor()
-        info = dumps(tool.arguments)
-        cursor.execute('''INSERT INTO Tools( timeStamp, Name, Description, LinuxCommand, Arguments ) 
-                        VALUES( ?, ?, ?, ?, ? )''',
-                       (tool.timeStamp, tool.name, tool.description, tool.command, Binary(info)))
-        connection.commit()
+        ToolManager.getConnection()
+        with ConnectionManager.transaction(ToolManager.getDBPath()) as cursor:
+            ToolManager.insertTool(cursor, tool, tool.timeStamp)
+
+    @staticmethod
+    def findTools(command: str=None, flag: str=None):
+        """
+        Names of the tools which run command, or which use flag, or both, e.g. findTools('journalctl', '--lines').
+        A flag matches with or without the '=' its argument follows.
+        :return:    Tuple of tool names, in the order they were added.
+        """
+        if command is not None and not isinstance(command, str):
+            raise Exception("ToolManager.findTools - Invalid command argument:  " + str(command))
+        if flag is not None and not isinstance(flag, str):
+            raise Exception("ToolManager.findTools - Invalid flag argument:  " + str(flag))
+        sql = "SELECT Name FROM Tools"
+        conditions = []
+        parameters = []
+        if command is not None:
+            conditions.append("LinuxCommand = ?")
+            parameters.append(command)
+        if flag is not None:
+            flag = flag.rstrip('=')
+            conditions.append("RowId IN (SELECT ToolRowId FROM ToolArguments WHERE Flag IN (?, ?))")
+            parameters += [flag, flag + '=']
+        if len(conditions) > 0:
+            sql += " WHERE " + " AND ".join(conditions)
+        cursor = ToolManager.getConnection().execute(sql + " ORDER BY RowId", parameters)
+        names = tuple(row[0] for row in cursor.fetchall())
         cursor.close()
-        connection.close()
+        return names
 
     @staticmethod
     def toolExists(toolName: str):
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+ToolManager.__DBFile)
-        cursor = connection.cursor()
-        cursor.execute("""SELECT * FROM [Tools] WHERE Name='{toolName}'""".format(toolName=toolName))
-        rows = cursor.fetchall()
+        #   A parameter rather than the name formatted into the SQL, so the prepared statement is reused, and a
+        #   probe of the unique Tools_Name index, cheap enough to run on every keystroke of a name being typed.
+        connection = ToolManager.getConnection()
+        cursor = connection.execute("""SELECT 1 FROM [Tools] WHERE Name=?""", (toolName,))
+        row = cursor.fetchone()
         cursor.close()
-        connection.close()
-        return len(rows) > 0
+        return row is not None
 
     @staticmethod
     def removeTool(name: str):
-        pass
+        """
+        Delete the tool named name, its arguments, and its entries in the tool set index.
+        :return:    True if there was a tool named name, False otherwise.
+        """
+        if not isinstance(name, str):
+            raise Exception("ToolManager.removeTool - Invalid name argument:  " + str(name))
+        ToolManager.getConnection()
+        with ConnectionManager.transaction(ToolManager.getDBPath()) as cursor:
+            cursor.execute("""SELECT RowId FROM Tools WHERE Name=?""", (name,))
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            cursor.execute("""DELETE FROM ToolArguments WHERE ToolRowId=?""", (row[0],))
+            cursor.execute("""DELETE FROM Tools WHERE RowId=?""", (row[0],))
+            cursor.execute("""DELETE FROM ToolSetIndex WHERE ToolName=?""", (name,))
+        return True
 
     @staticmethod
     def getTool(name: str):
-        pass
+        """
+        :return:    The Tool named name, read from the database, or None if there is none.
+        """
+        if not isinstance(name, str):
+            raise Exception("ToolManager.getTool - Invalid name argument:  " + str(name))
+        cursor = ToolManager.getConnection().cursor()
+        cursor.execute("""SELECT RowId, Name, Description, LinuxCommand FROM Tools WHERE Name=?""", (name,))
+        row = cursor.fetchone()
+        if row is None:
+            cursor.close()
+            return None
+        cursor.execute("""SELECT Flag, Value FROM ToolArguments WHERE ToolRowId=? ORDER BY Position""", (row[0],))
+        arguments = OrderedDict(cursor.fetchall())
+        cursor.close()
+        return Tool(row[1], row[2], row[3], arguments)
 
     @staticmethod
     def readDB():
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+ToolManager.__DBFile)
-        cursor = connection.cursor()
-
-        toolMap = OrderedDict()
-        cursor.execute("""SELECT * FROM Tools""")
-        rows = cursor.fetchall()
-        for row in rows:
-            arguments = loads(row[5])
-            toolMap[row[2]] = Tool(row[2], row[3], row[4], arguments)
-
-        toolSetIndex = OrderedDict()
-        cursor.execute("""SELECT * FROM ToolSetIndex""")
-        rows = cursor.fetchall()
-        for row in rows:
-            if row[1] not in toolSetIndex:
-                toolSetIndex[row[1]] = []
-            toolSetIndex[row[1]].append(row[2])
-        for toolSetName in toolSetIndex:
-            toolSetIndex[toolSetName] = tuple(toolSetIndex[toolSetName])
-
-        cursor.close()
-        connection.close()
-        return toolMap, toolSetIndex
-
+        """
+        The tool map, name to Tool in the order added, and tool set index, set name to tuple of tool names.
+        Both come from ToolRegistry, which re-reads only what has changed since it was last asked, and are copies
+        of its maps, but the Tool objects are shared and must not be modified.
+        """
+        return ToolRegistry.getToolMap(), ToolRegistry.getToolSetIndex()
 
     @staticmethod
     def writeDB():
@@ -274,24 +474,26 @@ class ToolManager:
 
     @staticmethod
     def createLinuxToolsDB():
-        connection = connect(environ['HOME']+'/'+USER_DATA_FOLDER+'/'+ToolManager.__DBFile)
-        cursor = connection.cursor()
+        with ConnectionManager.transaction(ToolManager.getDBPath()) as cursor:
+            ToolManager.initializeDB(cursor)
+        ToolManager.schemaChecked.add(ToolManager.getDBPath())
+
+    @staticmethod
+    def initializeDB(cursor):
         cursor.execute("""CREATE TABLE `Events` ( 
                             `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
                             `timeStamp` TEXT NOT NULL, 
                             `info` BLOB NOT NULL )""")
-        cursor.execute("""CREATE TABLE "Tools" ( 
-                            `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
-                            `timeStamp` TEXT NOT NULL, 
-                            `Name` TEXT NOT NULL, 
-                            `Description` TEXT NOT NULL, 
-                            `LinuxCommand` TEXT NOT NULL, 
-                            `Arguments` BLOB NOT NULL )""")
+        cursor.execute(TOOLS_TABLE_SQL)
+        cursor.execute(TOOL_ARGUMENTS_TABLE_SQL)
+        for indexSQL in TOOL_INDEXES_SQL:
+            cursor.execute(indexSQL)
         cursor.execute("""CREATE TABLE "ToolSetIndex" ( 
                             `RowId` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE, 
                             `ToolSetName` TEXT NOT NULL, 
                             `ToolName` TEXT NOT NULL )""")
-        connection.commit()
+        for changesSQL in TOOL_CHANGES_SQL:
+            cursor.execute(changesSQL)
 
         #   Initial tool set (Same as those in Tool menu in Console)
 
@@ -342,24 +544,18 @@ class ToolManager:
 
         toolSet = ToolSet("Tools in Initial Installation")
         for tool in tools:
-            arguments = dumps(tool.arguments)
             timeStamp = tool.timeStamp
             timeStampStr    = "{year:4d}/{month:2d}/{day:2d}" \
                     .format(year=timeStamp.year, month=timeStamp.month, day=timeStamp.day).replace(' ', '0') + ' ' + \
                        "{hour:2d}:{minute:2d}:{second:2d}.{micro:6d}" \
                            .format(hour=timeStamp.hour, minute=timeStamp.minute, second=timeStamp.second,
                                    micro=timeStamp.microsecond).replace(' ', '0')
-            cursor.execute('''INSERT INTO Tools( timeStamp, Name, Description, LinuxCommand, Arguments ) 
-                                VALUES( ?, ?, ?, ?, ?)''', (timeStampStr, tool.name, tool.description,
-                                                            tool.command, Binary(arguments)))
+            ToolManager.insertTool(cursor, tool, timeStampStr)
             toolSet.addTool(tool.name, tool)
         for toolName in toolSet.toolMap:
             toolSet.name, toolName
             cursor.execute('''INSERT INTO ToolSetIndex( ToolSetName, ToolName ) VALUES( ?, ?)''',
                            (toolSet.name, toolName))
-        connection.commit()
-        cursor.close()
-        connection.close()
 
     @staticmethod
     def exportTools(format: ExportFormat, filePath: str, verbose: bool=False):
@@ -377,6 +573,173 @@ class ToolManager:
         pass
 
 
+class ToolRegistry:
+    """
+    In-process cache of the tools in LinuxTools.db.  The first request reads every tool; after that each request
+    reads the ToolChanges log past the last change it saw and re-reads only the tools those changes name, or every
+    tool again if changes it had not seen have been trimmed from the log.
+    """
+    lock            = Lock()
+    dbPath          = None
+    lastChangeId    = None
+    toolsByRowId    = {}
+    toolMap         = OrderedDict()
+    toolSetIndex    = OrderedDict()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def getToolMap():
+        with ToolRegistry.lock:
+            ToolRegistry.refresh()
+            return OrderedDict(ToolRegistry.toolMap)
+
+    @staticmethod
+    def getToolSetIndex():
+        with ToolRegistry.lock:
+            ToolRegistry.refresh()
+            return OrderedDict(ToolRegistry.toolSetIndex)
+
+    @staticmethod
+    def getTool(name: str):
+        """
+        :return:    The Tool named name, or None if there is none.
+        """
+        if not isinstance(name, str):
+            raise Exception("ToolRegistry.getTool - Invalid name argument:  " + str(name))
+        with ToolRegistry.lock:
+            ToolRegistry.refresh()
+            return ToolRegistry.toolMap.get(name)
+
+    @staticmethod
+    def invalidate():
+        """
+        Forget everything cached, e.g. after LinuxTools.db has been replaced.
+        """
+        with ToolRegistry.lock:
+            ToolRegistry.dbPath = None
+            ToolRegistry.lastChangeId = None
+
+    @staticmethod
+    def refresh():
+        #   Caller holds ToolRegistry.lock.
+        dbPath = ToolManager.getDBPath()
+        cursor = ToolManager.getConnection().cursor()
+        cursor.execute("SELECT COALESCE(MAX(ChangeId), 0), MIN(ChangeId) FROM ToolChanges")
+        lastChangeId, firstChangeId = cursor.fetchone()
+        if dbPath != ToolRegistry.dbPath or ToolRegistry.lastChangeId is None or \
+                (firstChangeId is not None and firstChangeId > ToolRegistry.lastChangeId + 1):
+            ToolRegistry.toolsByRowId = {}
+            ToolRegistry.readTools(cursor, "", ())
+            ToolRegistry.readToolSetIndex(cursor)
+        elif lastChangeId != ToolRegistry.lastChangeId:
+            #   Changes committed after the MAX above are read again on the next refresh, which does no harm.
+            changeRange = (ToolRegistry.lastChangeId, lastChangeId)
+            cursor.execute("""SELECT DISTINCT ToolRowId FROM ToolChanges WHERE ChangeId > ? AND ChangeId <= ?""",
+                           changeRange)
+            changedRowIds = set(row[0] for row in cursor.fetchall())
+            if None in changedRowIds:
+                changedRowIds.discard(None)
+                ToolRegistry.readToolSetIndex(cursor)
+            if len(changedRowIds) > 0:
+                for rowId in changedRowIds:
+                    ToolRegistry.toolsByRowId.pop(rowId, None)
+                ToolRegistry.readTools(cursor, " IN (SELECT ToolRowId FROM ToolChanges WHERE ChangeId > ? AND "
+                                               "ChangeId <= ?)", changeRange)
+        else:
+            cursor.close()
+            return
+        if firstChangeId is not None and firstChangeId <= lastChangeId - TOOL_CHANGES_KEEP:
+            cursor.execute("DELETE FROM ToolChanges WHERE ChangeId <= ?", (lastChangeId - TOOL_CHANGES_KEEP,))
+        cursor.close()
+        ToolRegistry.toolMap = OrderedDict((tool.name, tool) for rowId, tool in
+                                           sorted(ToolRegistry.toolsByRowId.items()))
+        ToolRegistry.dbPath = dbPath
+        ToolRegistry.lastChangeId = lastChangeId
+
+    @staticmethod
+    def readTools(cursor, rowIdCondition: str, parameters: tuple):
+        """
+        Read the tools whose RowId satisfies rowIdCondition, all of them if it is empty, into toolsByRowId.
+        """
+        argumentsSQL = "SELECT ToolRowId, Flag, Value FROM ToolArguments"
+        toolsSQL = "SELECT RowId, Name, Description, LinuxCommand FROM Tools"
+        if len(rowIdCondition) > 0:
+            argumentsSQL += " WHERE ToolRowId" + rowIdCondition
+            toolsSQL += " WHERE RowId" + rowIdCondition
+        argumentMaps = {}
+        cursor.execute(argumentsSQL + " ORDER BY ToolRowId, Position", parameters)
+        for toolRowId, flag, value in cursor.fetchall():
+            if toolRowId not in argumentMaps:
+                argumentMaps[toolRowId] = OrderedDict()
+            argumentMaps[toolRowId][flag] = value
+        cursor.execute(toolsSQL, parameters)
+        for row in cursor.fetchall():
+            ToolRegistry.toolsByRowId[row[0]] = Tool(row[1], row[2], row[3], argumentMaps.get(row[0], OrderedDict()))
+
+    @staticmethod
+    def readToolSetIndex(cursor):
+        toolSetIndex = OrderedDict()
+        cursor.execute("""SELECT ToolSetName, ToolName FROM ToolSetIndex ORDER BY RowId""")
+        for toolSetName, toolName in cursor.fetchall():
+            if toolSetName not in toolSetIndex:
+                toolSetIndex[toolSetName] = []
+            toolSetIndex[toolSetName].append(toolName)
+        for toolSetName in toolSetIndex:
+            toolSetIndex[toolSetName] = tuple(toolSetIndex[toolSetName])
+        ToolRegistry.toolSetIndex = toolSetIndex
+
+
+def benchmarkToolRegistry(toolCount: int=2000, repetitions: int=50):
+    """
+    Milliseconds to get the tool map with a full read, as every ToolManager.readDB() call did, with nothing
+    changed since the last read, and with one tool added since the last read.  Uses a LinuxTools.db in a temporary
+    HOME folder.
+    """
+    import os
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    results = OrderedDict()
+    savedHome = environ['HOME']
+    with TemporaryDirectory() as folderPath:
+        environ['HOME'] = folderPath
+        try:
+            os.makedirs(folderPath + '/' + USER_DATA_FOLDER)
+            ToolManager.createLinuxToolsDB()
+            with ConnectionManager.transaction(ToolManager.getDBPath()) as cursor:
+                for toolIdx in range(toolCount):
+                    ToolManager.insertTool(cursor, Tool('Tool ' + str(toolIdx), 'description', 'ps',
+                                                        OrderedDict({'-lf': None, '-u': 'user' + str(toolIdx)})),
+                                           '2026/10/19')
+
+            startTime = perf_counter()
+            for repetition in range(repetitions):
+                ToolRegistry.invalidate()
+                ToolRegistry.getToolMap()
+            results['full read'] = (perf_counter() - startTime) * 1000 / repetitions
+
+            startTime = perf_counter()
+            for repetition in range(repetitions):
+                ToolRegistry.getToolMap()
+            results['nothing changed'] = (perf_counter() - startTime) * 1000 / repetitions
+
+            elapsed = 0.0
+            for repetition in range(repetitions):
+                ToolManager.addTool(Tool('New Tool ' + str(repetition), 'description', 'ps', OrderedDict({'-A': None})))
+                startTime = perf_counter()
+                toolMap = ToolRegistry.getToolMap()
+                elapsed += perf_counter() - startTime
+                if 'New Tool ' + str(repetition) not in toolMap:
+                    raise Exception("benchmarkToolRegistry - added tool missing from the tool map")
+            results['one tool added'] = elapsed * 1000 / repetitions
+        finally:
+            ConnectionManager.closeConnection(ToolManager.getDBPath())
+            ToolRegistry.invalidate()
+            environ['HOME'] = savedHome
+    return results
+
+
 def ExitProgram():
     answer = messagebox.askyesno('Exit program ', "Exit the " + PROGRAM_TITLE + " program?")
     if answer:
@@ -390,6 +753,11 @@ if __name__ == "__main__":
         toolSet = ToolManager.createLinuxToolsDB()
         exit(0)
 
+    if BENCHMARKING:
+        for case, milliseconds in benchmarkToolRegistry().items():
+            print("ToolRegistry, " + case + ":\t" + str(round(milliseconds, 3)) + " ms")
+        exit(0)
+
     if TESTING:
         dpkgTool = Tool('dpkgHelp', 'Show the simple help output of the dpkg program', 'dpkg',
                         OrderedDict({'--help': None}))
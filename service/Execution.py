@@ -0,0 +1,929 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         service/Execution.py
+#   Purpose:        Running Linux commands without blocking the Tk event loop, with their output delivered to the
+#                   user interface as it arrives.
+#   Development:
+#       Popen.communicate() on the Tk thread froze the console until the command exited and showed nothing until
+#       all of its output had arrived.  StreamingCommand reads the output on a worker thread and hands it to the
+#       Tk thread in batches from after() callbacks, since Tk widgets may only be touched from the thread running
+#       mainloop().
+#
+#       Each command runs in its own session, so its process group id is its pid and cancel() can signal
+#       everything it started, e.g. the pager or the children of a shell pipeline, not just the command itself.
+#
+#       2026-10-19: 100,000 journalctl style JSON lines, 48 MB (no journal in the test environment), with an after()
+#           loop standing in for Tk:
+#                                               communicate()       StreamingCommand
+#               first output shown:             0.91 s              0.06 s
+#               longest event loop stall:       0.91 s              0.03 s
+#               all output delivered:           0.91 s              1.32 s
+#       2026-10-19: ToolSetRunner runs the tools of a set concurrently, each with a timeout and all within an
+#           optional deadline.  Seconds, python -m service.Execution and 8 tools sleeping 0.1 to 0.8 s:
+#                                               one at a time       ToolSetRunner
+#               Tools in Initial Installation:  0.07                0.07 (12 parallel, slowest tool 0.02)
+#               sleep 0.1 ... sleep 0.8:        3.62                0.81 (8 parallel)
+#           The initial tools finish in milliseconds in the test environment, without a journal or sudo, so there
+#           process start up is all there is to overlap.
+#       2026-10-19: ResultCache keeps the output of read only commands, dpkg -l, man <page>, <command> --help, for up to
+#           an hour or until /var/lib/dpkg/status changes.  dpkg -l: 18 ms to run, 0.05 ms from the cache.
+#       2026-10-19: ExecService runs argv lists through a pool of helper processes, started once with the interpreter
+#           in isolated mode, which posix_spawnp() the commands: no shell, no fork of the application process.
+#           ms per command, 300 x ls / back to back (benchmarkExecService):
+#                                       os.popen()      Popen       ExecService
+#               this process:           1.76            1.17        1.30
+#               500 MB more resident:   1.88            1.28        1.45
+#           Against the os.popen() calls it replaces it saves the shell.  Popen uses vfork() on Linux, so going
+#           straight to it would be slightly faster still, at the cost of spawning from the Tk process.
+#           A helper runs one command to the end, so one more is started whenever all of them are busy and closed
+#           again once EXEC_POOL_SIZE are idle, and ExecCancel kills a command whose output is no longer wanted.
+#           Only a command which cannot be started, CommandStartError, leaves its helper in the pool;  any other error
+#           means the helper died or its frames can no longer be trusted, and it is replaced.
+#       2026-10-19: StreamingPipeline runs saved Tools as an OS pipe chain, spawnPipeline() connecting each stage's
+#           stdout to the next one's stdin, so only the last stage's output passes through this process.
+#           200,000 journalctl style JSON lines | jq | sort | uniq -c (benchmarkPipeline):
+#                                       capture and feed        spawnPipeline
+#               seconds:                3.64                    3.14
+#               most output held:       32.7 MB                 4 KB
+#           The stages also run concurrently, jq parsing while the generator is still writing.
+#
+
+import os
+import sys
+import json
+import atexit
+from struct import Struct
+from signal import SIGTERM, SIGKILL, SIGPIPE
+from subprocess import Popen, PIPE, STDOUT, DEVNULL, TimeoutExpired
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from time import monotonic
+from queue import SimpleQueue, Queue, Empty
+from codecs import getincrementaldecoder
+from datetime import datetime
+
+from model.RunMetrics import MeteredPopen
+
+READ_SIZE           = 65536     #   bytes per read from the command's stdout
+BATCH_INTERVAL      = 50        #   milliseconds between deliveries of output to the listener
+MAX_BATCH_BYTES     = 1048576   #   per delivery, so a flood of output cannot hold the event loop for long
+KILL_GRACE          = 2000      #   milliseconds after SIGTERM before a cancelled command's group gets SIGKILL
+
+#   ResultCache: only commands which read state the fingerprint files cover are cached.  The dpkg status file
+#   changes whenever a package is installed, removed or upgraded, which is also when man pages and --help texts do.
+DPKG_STATUS_FILE    = '/var/lib/dpkg/status'
+DPKG_READ_ONLY_ARGS = ('-l', '--list', '-s', '--status', '-L', '--listfiles', '--help', '--version')
+#   Not -h, which is human readable sizes to df, free, du, ls and others, whose output changes from run to run.
+HELP_ARGS           = ('--help', '--version', 'all')
+CACHE_TTL           = 3600.0        #   seconds
+CACHE_MAX_ENTRIES   = 64
+CACHE_MAX_CHARS     = 32000000      #   total output held, all entries
+
+#   ExecService: each helper is a small Python process started once, which spawns the commands sent to it with
+#   posix_spawnp(), no shell, and streams their output back as frames:  kind (1 byte), length (4 bytes), payload.
+#   Kinds:  'p' started (its pid, '!i', also its session and process group id), 'o' output, 'e' the command could not
+#   be started ([errno, message, file] as JSON), 'x' exit code ('!i').  Requests are the length (4 bytes) followed
+#   by the argv list as JSON.  The commands get SIGPIPE's and SIGXFSZ's default actions, which Python ignores.
+EXEC_POOL_SIZE      = 2         #   helpers kept idle;  more are started while all are busy, and closed after
+FRAME_HEADER        = Struct('!cI')
+REQUEST_HEADER      = Struct('!I')
+EXIT_CODE           = Struct('!i')
+EXEC_HELPER_PROGRAM = """
+import os, sys, json, struct, signal
+frameHeader = struct.Struct('!cI')
+requests = sys.stdin.buffer
+responses = sys.stdout.buffer
+def send(kind, payload):
+    responses.write(frameHeader.pack(kind, len(payload)) + payload)
+    responses.flush()
+while True:
+    header = requests.read(4)
+    if len(header) < 4:
+        break
+    argv = json.loads(requests.read(struct.unpack('!I', header)[0]))
+    readFd, writeFd = os.pipe()
+    try:
+        pid = os.posix_spawnp(argv[0], argv, os.environ, setsid=True,
+                              file_actions=[(os.POSIX_SPAWN_OPEN, 0, '/dev/null', os.O_RDONLY, 0),
+                                            (os.POSIX_SPAWN_DUP2, writeFd, 1), (os.POSIX_SPAWN_DUP2, writeFd, 2)],
+                              setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+    except OSError as error:
+        os.close(readFd)
+        os.close(writeFd)
+        send(b'e', json.dumps([error.errno, error.strerror, argv[0]]).encode())
+        continue
+    os.close(writeFd)
+    send(b'p', struct.pack('!i', pid))
+    while True:
+        chunk = os.read(readFd, 65536)
+        if not chunk:
+            break
+        send(b'o', chunk)
+    os.close(readFd)
+    send(b'x', struct.pack('!i', os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])))
+"""
+
+
+class StreamingCommand:
+    """
+    Runs a command and passes its output, stdout and stderr together, to listener on the Tk thread:
+        {'source': 'StreamingCommand', 'action': 'output', 'text': <output since the last message>}
+        {'source': 'StreamingCommand', 'action': 'finished', 'text': <all of the output>, 'returnCode': <int>,
+            'cancelled': <bool>, 'outputBytes': <int>}
+    process is a MeteredPopen, so its resource usage can be recorded with RunMetrics once it has finished.
+    """
+
+    def __init__(self, widget, commandList: list, listener):
+        if widget is None or not hasattr(widget, 'after'):
+            raise Exception("StreamingCommand constructor - Invalid widget argument:  " + str(widget))
+        if not isinstance(commandList, (list, tuple)) or len(commandList) == 0:
+            raise Exception("StreamingCommand constructor - Invalid commandList argument:  " + str(commandList))
+        if listener is None or not callable(listener):
+            raise Exception("StreamingCommand constructor - Invalid listener argument:  " + str(listener))
+        self.widget = widget
+        self.commandList = tuple(commandList)
+        self.listener = listener
+        self.process = None
+        self.startTime = None
+        self.returnCode = None
+        self.cancelled = False
+        self.finished = False
+        self.chunks = SimpleQueue()
+        self.readerDone = False
+        self.decoder = getincrementaldecoder('utf-8')(errors='replace')
+        self.outputParts = []
+        self.outputBytes = 0
+
+    def start(self):
+        """
+        Start the command and its reader thread.  Raises whatever Popen raises, e.g. FileNotFoundError.
+        :return:    The time the command was started.
+        """
+        if self.process is not None:
+            raise Exception("StreamingCommand.start - command already started:  " + str(self.commandList))
+        self.process = MeteredPopen(self.commandList, stdout=PIPE, stderr=STDOUT, stdin=DEVNULL,
+                                    start_new_session=True)
+        self.stream = self.process.stdout
+        self.startTime = datetime.now()
+        Thread(target=self.readOutput, name="StreamingCommand " + self.commandList[0], daemon=True).start()
+        self.widget.after(BATCH_INTERVAL, self.deliver)
+        return self.startTime
+
+    def isRunning(self):
+        return self.process is not None and not self.finished
+
+    def cancel(self):
+        """
+        SIGTERM to the command's process group, then SIGKILL if its output has not ended KILL_GRACE ms later.
+        The listener still gets the 'finished' message, with 'cancelled': True.
+        """
+        if self.isRunning() and not self.cancelled:
+            self.cancelled = True
+            self.signalGroup(SIGTERM)
+            self.widget.after(KILL_GRACE, self.killIfRunning)
+
+    def killIfRunning(self):
+        if self.isRunning():
+            self.signalGroup(SIGKILL)
+
+    def signalGroup(self, signalNumber):
+        try:
+            os.killpg(self.process.pid, signalNumber)
+        except ProcessLookupError:      #   The whole group has exited already.
+            pass
+
+    def readOutput(self):
+        #   Reader thread.  read1() returns whatever is available, up to READ_SIZE, rather than waiting for a
+        #   full buffer, so a slow command's output is not held back.
+        stream = self.stream
+        try:
+            while True:
+                chunk = stream.read1(READ_SIZE)
+                if not chunk:
+                    break
+                self.chunks.put(chunk)
+        finally:
+            stream.close()
+            self.chunks.put(None)
+
+    def deliver(self):
+        #   Tk thread.
+        pieces = []
+        batchBytes = 0
+        while not self.readerDone and batchBytes < MAX_BATCH_BYTES:
+            try:
+                chunk = self.chunks.get_nowait()
+            except Empty:
+                break
+            if chunk is None:
+                self.readerDone = True
+                pieces.append(self.decoder.decode(b'', final=True))
+            else:
+                pieces.append(self.decoder.decode(chunk))
+                batchBytes += len(chunk)
+                self.outputBytes += len(chunk)
+        text = ''.join(pieces)
+        if len(text) > 0:
+            self.outputParts.append(text)
+            self.listener({'source': 'StreamingCommand', 'action': 'output', 'text': text})
+
+        if self.readerDone and self.hasExited():
+            self.finished = True
+            self.listener(self.finishedMessage())
+        elif batchBytes >= MAX_BATCH_BYTES:
+            #   More is waiting: let the event loop handle pending events, then continue.
+            self.widget.after(1, self.deliver)
+        else:
+            self.widget.after(BATCH_INTERVAL, self.deliver)
+
+
+    def hasExited(self):
+        return self.process.poll() is not None
+
+    def finishedMessage(self):
+        self.returnCode = self.process.returncode
+        return {'source': 'StreamingCommand', 'action': 'finished', 'text': ''.join(self.outputParts),
+                'returnCode': self.returnCode, 'cancelled': self.cancelled, 'outputBytes': self.outputBytes}
+
+
+def spawnPipeline(commandLines, output):
+    """
+    Start commandLines as a pipe chain, each command's stdout connected directly to the next one's stdin, all in one
+    new process group whose id is the first command's pid.  The last command's stdout and every command's stderr go
+    to output, a file descriptor.  See MeteredPopen.startPipeline().
+    :return:    List of the MeteredPopen objects, in pipeline order.  If a command cannot be started, none are left
+                running and the error, e.g. FileNotFoundError, is raised.
+    """
+    return MeteredPopen.startPipeline(commandLines, output)
+
+
+def stageReturnCode(processes, index: int):
+    """
+    The exit status of the process processes[index] of a pipeline, 0 for a stage before the last which SIGPIPE
+    ended, since the stages after it had stopped reading, e.g. yes in yes | head -1.
+    """
+    returnCode = processes[index].returncode
+    if returnCode == -SIGPIPE and index < len(processes) - 1:
+        return 0
+    return returnCode
+
+
+class StreamingPipeline(StreamingCommand):
+    """
+    Runs saved Tools, or argv lists, as an OS pipe chain, e.g. journalctl -o json | jq . | sort, with spawnPipeline().
+    Only the last stage's output, with the stderr of every stage, reaches the listener, in the same messages as
+    StreamingCommand's.  The 'finished' message has the last stage's 'returnCode', as in the shell, and also
+        'stages': [{'commandLine': <tuple>, 'returnCode': <int>, 'wallTime': <seconds from start to exit>}, ...]
+    each stage's returnCode being stageReturnCode()'s.
+    commandList is the whole pipeline with '|' between the stages, for display.
+    """
+
+    def __init__(self, widget, stages, listener):
+        if not isinstance(stages, (list, tuple)) or len(stages) == 0:
+            raise Exception("StreamingPipeline constructor - Invalid stages argument:  " + str(stages))
+        commandLines = []
+        for stage in stages:
+            if hasattr(stage, 'getCommandLine'):            #   model.ToolDB.Tool
+                commandLine = tuple(stage.getCommandLine())
+            elif isinstance(stage, (list, tuple)):
+                commandLine = tuple(stage)
+            else:
+                commandLine = ()
+            if len(commandLine) == 0:
+                raise Exception("StreamingPipeline constructor - Invalid stage in stages argument:  " + str(stage))
+            commandLines.append(commandLine)
+        commandList = list(commandLines[0])
+        for commandLine in commandLines[1:]:
+            commandList += ['|'] + list(commandLine)
+        super().__init__(widget, commandList, listener)
+        self.stageCommandLines = tuple(commandLines)
+        self.processes = None
+        self.startedAt = None
+        self.stageWallTimes = [None] * len(commandLines)
+
+    def start(self):
+        """
+        Start the pipeline, its reader thread and a thread per stage timing it.  Raises whatever Popen raises.
+        :return:    The time the pipeline was started.
+        """
+        if self.process is not None:
+            raise Exception("StreamingPipeline.start - pipeline already started:  " + str(self.commandList))
+        readFd, writeFd = os.pipe()
+        try:
+            self.startedAt = monotonic()
+            self.processes = spawnPipeline(self.stageCommandLines, writeFd)
+        except BaseException:
+            os.close(readFd)
+            raise
+        finally:
+            os.close(writeFd)
+        self.process = self.processes[0]        #   the process group leader, for cancel()
+        self.stream = os.fdopen(readFd, 'rb')
+        self.startTime = datetime.now()
+        for index in range(len(self.processes)):
+            Thread(target=self.timeStage, args=(index,), name="StreamingPipeline stage " + str(index),
+                   daemon=True).start()
+        Thread(target=self.readOutput, name="StreamingPipeline " + self.commandList[0], daemon=True).start()
+        self.widget.after(BATCH_INTERVAL, self.deliver)
+        return self.startTime
+
+    def timeStage(self, index: int):
+        #   Stage thread.  The wall time is set after wait() has set returncode.
+        self.processes[index].wait()
+        self.stageWallTimes[index] = monotonic() - self.startedAt
+
+    def hasExited(self):
+        return None not in self.stageWallTimes
+
+    def finishedMessage(self):
+        message = super().finishedMessage()
+        self.returnCode = self.processes[-1].returncode
+        message['returnCode'] = self.returnCode
+        message['stages'] = [{'commandLine': commandLine, 'returnCode': stageReturnCode(self.processes, index),
+                              'wallTime': wallTime} for index, (commandLine, wallTime) in
+                             enumerate(zip(self.stageCommandLines, self.stageWallTimes))]
+        return message
+
+
+class ToolRunResult:
+    """
+    What one tool in a ToolSetRunner run produced.  returnCode is None if the tool could not be started, was
+    skipped because the deadline had passed, or was killed for running too long, in which case timedOut is True
+    and output is what it wrote before it was killed.
+    """
+    __slots__ = ('name', 'commandLine', 'output', 'returnCode', 'wallTime', 'timedOut', 'error')
+
+    def __init__(self, name: str, commandLine: tuple):
+        self.name = name
+        self.commandLine = commandLine
+        self.output = ''
+        self.returnCode = None
+        self.wallTime = 0.0         #   seconds
+        self.timedOut = False
+        self.error = None
+
+    def __str__(self):
+        return str({name: getattr(self, name) for name in ToolRunResult.__slots__ if name != 'output'})
+
+
+class ToolSetRunner:
+    """
+    Runs every tool of a ToolSet, or any collection of Tools, concurrently, at most maxParallel at a time.
+    Each tool is killed, with its process group, if it runs longer than toolTimeout seconds or past the deadline,
+    seconds after run() is called, and tools not started by the deadline are skipped.
+    """
+
+    def __init__(self, tools, maxParallel: int=4, toolTimeout: float=60.0, deadline: float=None):
+        if hasattr(tools, 'getToolMap'):            #   model.ToolDB.ToolSet
+            tools = tools.getToolMap().values()
+        elif isinstance(tools, dict):
+            tools = tools.values()
+        if not isinstance(tools, (list, tuple)) and not hasattr(tools, '__iter__'):
+            raise Exception("ToolSetRunner constructor - Invalid tools argument:  " + str(tools))
+        if not isinstance(maxParallel, int) or maxParallel < 1:
+            raise Exception("ToolSetRunner constructor - Invalid maxParallel argument:  " + str(maxParallel))
+        if not isinstance(toolTimeout, (int, float)) or toolTimeout <= 0:
+            raise Exception("ToolSetRunner constructor - Invalid toolTimeout argument:  " + str(toolTimeout))
+        if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+            raise Exception("ToolSetRunner constructor - Invalid deadline argument:  " + str(deadline))
+        self.tools = tuple(tools)
+        self.maxParallel = maxParallel
+        self.toolTimeout = toolTimeout
+        self.deadline = deadline
+        self.deadlineTime = None
+
+    def run(self):
+        """
+        :return:    OrderedDict of tool name to ToolRunResult, in the order the tools were given.
+        """
+        self.deadlineTime = None if self.deadline is None else monotonic() + self.deadline
+        results = OrderedDict()
+        with ThreadPoolExecutor(max_workers=self.maxParallel, thread_name_prefix="ToolSetRunner") as executor:
+            futures = OrderedDict((tool.name, executor.submit(self.runTool, tool)) for tool in self.tools)
+            for name, future in futures.items():
+                results[name] = future.result()
+        return results
+
+    def runTool(self, tool):
+        #   Worker thread.
+        result = ToolRunResult(tool.name, tool.getCommandLine())
+        timeout = self.toolTimeout
+        if self.deadlineTime is not None:
+            timeout = min(timeout, self.deadlineTime - monotonic())
+            if timeout <= 0:
+                result.timedOut = True
+                result.error = "Not started before the deadline"
+                return result
+        startTime = monotonic()
+        try:
+            process = Popen(result.commandLine, stdout=PIPE, stderr=STDOUT, stdin=DEVNULL, start_new_session=True)
+        except OSError as error:
+            result.error = str(error)
+            return result
+        try:
+            output, unused = process.communicate(timeout=timeout)
+            result.returnCode = process.returncode
+        except TimeoutExpired:
+            try:
+                os.killpg(process.pid, SIGKILL)
+            except ProcessLookupError:
+                pass
+            output, unused = process.communicate()
+            result.timedOut = True
+        result.wallTime = monotonic() - startTime
+        result.output = output.decode('utf-8', errors='replace')
+        return result
+
+
+class CachedResult:
+    __slots__ = ('argv', 'fingerprint', 'runTime', 'expires', 'text', 'returnCode')
+
+    def __init__(self, argv: tuple, fingerprint: tuple, runTime: datetime, text: str, returnCode: int, ttl: float):
+        self.argv = argv
+        self.fingerprint = fingerprint
+        self.runTime = runTime
+        self.expires = monotonic() + ttl
+        self.text = text
+        self.returnCode = returnCode
+
+
+class ResultCache:
+    """
+    Process wide cache of the output of read only commands, e.g. dpkg -l, man <page>, ps --help all, keyed by argv.
+    A cached result is used while it is younger than CACHE_TTL and the modification time and size of the files its
+    command reads, its fingerprint, are unchanged.  The least recently used results are dropped past
+    CACHE_MAX_ENTRIES or CACHE_MAX_CHARS.  Commands getPolicy() does not recognize are never cached.
+    """
+
+    entries     = OrderedDict()
+    totalChars  = 0
+    lock        = Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def getPolicy(argv: tuple):
+        """
+        :return:    (ttl seconds, fingerprint file paths) if argv's output may be cached, otherwise None.
+        """
+        if len(argv) < 2:
+            return None
+        command = os.path.basename(argv[0])
+        if command == 'dpkg' and all(arg in DPKG_READ_ONLY_ARGS or not arg.startswith('-') for arg in argv[1:]):
+            return CACHE_TTL, (DPKG_STATUS_FILE,)
+        if command == 'man' and all(not arg.startswith('-') for arg in argv[1:]):
+            return CACHE_TTL, (DPKG_STATUS_FILE,)
+        if all(arg in HELP_ARGS for arg in argv[1:]) and ('--help' in argv or '--version' in argv):
+            return CACHE_TTL, (DPKG_STATUS_FILE,)
+        return None
+
+    @staticmethod
+    def fingerprint(paths: tuple):
+        stamp = ()
+        for path in paths:
+            try:
+                status = os.stat(path)
+                stamp += (status.st_mtime_ns, status.st_size)
+            except OSError:
+                stamp += (None, None)
+        return stamp
+
+    @staticmethod
+    def begin(argv):
+        """
+        Call before running argv.  The fingerprint is taken now, so that a change made while the command runs makes
+        its result stale.
+        :return:    A token for put(), or None if argv is not cacheable.
+        """
+        argv = tuple(argv)
+        policy = ResultCache.getPolicy(argv)
+        if policy is None:
+            return None
+        return argv, policy[0], ResultCache.fingerprint(policy[1])
+
+    @staticmethod
+    def get(argv):
+        """
+        :return:    The CachedResult for argv if there is a current one, otherwise None.
+        """
+        argv = tuple(argv)
+        policy = ResultCache.getPolicy(argv)
+        if policy is None:
+            return None
+        fingerprint = ResultCache.fingerprint(policy[1])
+        with ResultCache.lock:
+            result = ResultCache.entries.get(argv)
+            if result is None:
+                return None
+            if result.fingerprint != fingerprint or result.expires < monotonic():
+                ResultCache.remove(argv)
+                return None
+            ResultCache.entries.move_to_end(argv)
+            return result
+
+    @staticmethod
+    def put(token, runTime: datetime, text: str, returnCode: int):
+        """
+        Cache the output of a completed run begun with token = begin(argv).  Failed runs are not cached.
+        """
+        if token is None or returnCode != 0 or len(text) > CACHE_MAX_CHARS:
+            return
+        argv, ttl, fingerprint = token
+        with ResultCache.lock:
+            ResultCache.remove(argv)
+            ResultCache.entries[argv] = CachedResult(argv, fingerprint, runTime, text, returnCode, ttl)
+            ResultCache.totalChars += len(text)
+            while len(ResultCache.entries) > CACHE_MAX_ENTRIES or ResultCache.totalChars > CACHE_MAX_CHARS:
+                ResultCache.remove(next(iter(ResultCache.entries)))
+
+    @staticmethod
+    def remove(argv: tuple):
+        #   Caller holds ResultCache.lock.
+        result = ResultCache.entries.pop(argv, None)
+        if result is not None:
+            ResultCache.totalChars -= len(result.text)
+
+    @staticmethod
+    def clear():
+        with ResultCache.lock:
+            ResultCache.entries.clear()
+            ResultCache.totalChars = 0
+
+    @staticmethod
+    def run(argv):
+        """
+        Run argv to completion, or take its output from the cache.
+        :return:    (output text, CachedResult if it came from the cache else None)
+        """
+        cached = ResultCache.get(argv)
+        if cached is not None:
+            return cached.text, cached
+        token = ResultCache.begin(argv)
+        runTime = datetime.now()
+        process = Popen(tuple(argv), stdout=PIPE, stderr=STDOUT, stdin=DEVNULL)
+        output, unused = process.communicate()
+        text = output.decode('utf-8', errors='replace')
+        ResultCache.put(token, runTime, text, process.returncode)
+        return text, None
+
+
+class CommandStartError(OSError):
+    """
+    A command ExecService was asked to run could not be started, e.g. [Errno 2] No such file or directory.  Any
+    other error from a helper means the helper itself has failed.
+    """
+
+
+class ExecCancel:
+    """
+    Passed to ExecService.execute() so that another thread can stop the command with cancel(), e.g. when the window
+    showing its output is closed.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.helper = None
+        self.cancelled = False
+
+    def attach(self, helper):
+        with self.lock:
+            self.helper = helper
+            return not self.cancelled
+
+    def cancel(self):
+        """
+        SIGKILL to the command's session, so its process group and the commands it started.  A command not yet
+        started is not started.
+        """
+        with self.lock:
+            self.cancelled = True
+            if self.helper is not None:
+                self.helper.killCommand()
+
+
+class ExecHelper:
+    """
+    One helper process of the ExecService pool.  Runs one command at a time.
+    """
+
+    def __init__(self):
+        self.process = Popen((sys.executable, '-I', '-S', '-c', EXEC_HELPER_PROGRAM), stdin=PIPE, stdout=PIPE,
+                             stderr=DEVNULL)
+        self.lock = Lock()
+        self.commandPid = None          #   the running command, its session id, between its 'p' and 'x' frames
+        self.killRequested = False      #   killCommand() was called for the current command
+
+    def sendRequest(self, argv: tuple):
+        request = json.dumps(argv).encode()
+        self.process.stdin.write(REQUEST_HEADER.pack(len(request)) + request)
+        self.process.stdin.flush()
+
+    def readResult(self, argv: tuple, outputReceiver):
+        """
+        Read the frames of the command sendRequest() started, passing each piece of its output, bytes, to
+        outputReceiver as it arrives.
+        :return:    The exit code.  Raises CommandStartError if argv could not be started.
+        """
+        while True:
+            header = self.process.stdout.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                raise Exception("ExecHelper.readResult - helper process ended running:  " + str(argv))
+            kind, length = FRAME_HEADER.unpack(header)
+            payload = self.process.stdout.read(length)
+            if kind == b'o':
+                outputReceiver(payload)
+            elif kind == b'p':
+                with self.lock:
+                    self.commandPid = EXIT_CODE.unpack(payload)[0]
+                if self.killRequested:
+                    self.killCommand()
+            elif kind == b'x':
+                with self.lock:
+                    self.commandPid = None
+                return EXIT_CODE.unpack(payload)[0]
+            elif kind == b'e':
+                raise CommandStartError(*json.loads(payload))
+            else:
+                raise Exception("ExecHelper.readResult - Invalid frame from helper process:  " + str(kind))
+
+    def killCommand(self):
+        with self.lock:
+            self.killRequested = True
+            if self.commandPid is not None:
+                try:
+                    os.killpg(self.commandPid, SIGKILL)
+                except ProcessLookupError:      #   The whole group has exited already.
+                    pass
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.wait()
+
+    def kill(self):
+        self.killCommand()
+        self.process.kill()
+        self.process.wait()
+
+
+class ExecService:
+    """
+    Runs commands, given as argv lists, through a pool of helper processes started once and reused, rather than a
+    shell, or a fork of this much larger process, per command.  Up to EXEC_POOL_SIZE helpers are kept between
+    commands, and one more is started whenever all of them are busy, so a long running command, e.g. journalctl -f
+    in a ToolOutput, never holds up the next.
+    """
+
+    idleHelpers     = Queue()
+    helperCount     = 0
+    lock            = Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def checkArgv(argv, methodName: str):
+        if not isinstance(argv, (list, tuple)) or len(argv) == 0 or not all(isinstance(arg, str) for arg in argv):
+            raise Exception("ExecService." + methodName + " - Invalid argv argument:  " + str(argv))
+        return tuple(argv)
+
+    @staticmethod
+    def acquireHelper():
+        try:
+            return ExecService.idleHelpers.get_nowait()
+        except Empty:
+            pass
+        with ExecService.lock:
+            ExecService.helperCount += 1
+        try:
+            return ExecHelper()
+        except:
+            with ExecService.lock:
+                ExecService.helperCount -= 1
+            raise
+
+    @staticmethod
+    def releaseHelper(helper: ExecHelper):
+        with ExecService.lock:
+            if ExecService.idleHelpers.qsize() < EXEC_POOL_SIZE:
+                ExecService.idleHelpers.put(helper)
+                return
+            ExecService.helperCount -= 1
+        helper.close()
+
+    @staticmethod
+    def discardHelper(helper: ExecHelper):
+        helper.kill()
+        with ExecService.lock:
+            ExecService.helperCount -= 1
+
+    @staticmethod
+    def execute(argv, outputReceiver, cancel: ExecCancel=None):
+        """
+        Run argv, passing each piece of its output, stdout and stderr together as bytes, to outputReceiver as it
+        arrives.  Blocks until the command exits, or is killed by cancel.cancel().
+        :return:    The exit code, None if cancelled before it started.  Raises CommandStartError, an OSError, if
+                    argv could not be started, e.g. FileNotFoundError's message.
+        """
+        argv = ExecService.checkArgv(argv, 'execute')
+        if outputReceiver is None or not callable(outputReceiver):
+            raise Exception("ExecService.execute - Invalid outputReceiver argument:  " + str(outputReceiver))
+        if cancel is not None and not isinstance(cancel, ExecCancel):
+            raise Exception("ExecService.execute - Invalid cancel argument:  " + str(cancel))
+        for attempt in (1, 2):
+            helper = ExecService.acquireHelper()
+            helper.killRequested = False
+            if cancel is not None and not cancel.attach(helper):
+                ExecService.releaseHelper(helper)
+                return None
+            try:
+                helper.sendRequest(argv)
+                break
+            except OSError:
+                #   An idle helper which has died, e.g. been killed, is replaced and the command sent again, once.
+                if cancel is not None:
+                    cancel.attach(None)
+                ExecService.discardHelper(helper)
+                if attempt == 2:
+                    raise
+        helperFailed = True
+        try:
+            returnCode = helper.readResult(argv, outputReceiver)
+            helperFailed = False
+            return returnCode
+        except CommandStartError:
+            helperFailed = False
+            raise
+        finally:
+            #   Detached first, so that a late cancel() cannot reach the helper's next command.
+            if cancel is not None:
+                cancel.attach(None)
+            if helperFailed:
+                #   The helper failed, or the output stopped part way through, so its stream cannot be trusted.
+                ExecService.discardHelper(helper)
+            else:
+                ExecService.releaseHelper(helper)
+
+    @staticmethod
+    def run(argv):
+        """
+        :return:    (output text, exit code)
+        """
+        pieces = []
+        returnCode = ExecService.execute(argv, pieces.append)
+        return b''.join(pieces).decode('utf-8', errors='replace'), returnCode
+
+    @staticmethod
+    def shutdown():
+        with ExecService.lock:
+            while True:
+                try:
+                    helper = ExecService.idleHelpers.get_nowait()
+                except Empty:
+                    break
+                helper.close()
+                ExecService.helperCount -= 1
+
+
+atexit.register(ExecService.shutdown)
+
+
+def benchmarkExecService(commands: int=300, parentMB: int=0):
+    """
+    Milliseconds per command running a short command, ls /, commands times back to back through os.popen(), as
+    ToolOutput and ManPageScanner did, through Popen, and through ExecService.
+    :param parentMB:    Memory to allocate in this process first, since a fork costs more the larger the parent.
+    """
+    from time import perf_counter
+    ballast = bytearray(parentMB * 1000000)
+    for offset in range(0, len(ballast), 4096):
+        ballast[offset] = 1
+    results = OrderedDict()
+    ExecService.run(('true',))              #   helper start up is not counted
+    for method in ('os.popen', 'Popen', 'ExecService'):
+        startTime = perf_counter()
+        for commandIdx in range(commands):
+            if method == 'os.popen':
+                outputStream = os.popen('ls /')
+                outputStream.read()
+                outputStream.close()
+            elif method == 'Popen':
+                Popen(('ls', '/'), stdout=PIPE, stderr=STDOUT).communicate()
+            else:
+                ExecService.run(('ls', '/'))
+        results[method] = (perf_counter() - startTime) * 1000 / commands
+    del ballast
+    return results
+
+
+def benchmarkToolSetRunner(maxParallel: int=12):
+    """
+    Seconds to run the "Tools in Initial Installation" tool set one tool at a time and with ToolSetRunner.
+    """
+    from tempfile import TemporaryDirectory
+    from model.Installation import USER_DATA_FOLDER
+    from model.ConnectionManager import ConnectionManager
+    from model.ToolDB import ToolManager, ToolRegistry
+    savedHome = os.environ['HOME']
+    with TemporaryDirectory() as folderPath:
+        os.environ['HOME'] = folderPath
+        try:
+            os.makedirs(folderPath + '/' + USER_DATA_FOLDER)
+            ToolManager.createLinuxToolsDB()
+            toolMap, toolSetIndex = ToolManager.readDB()
+        finally:
+            ConnectionManager.closeConnection(ToolManager.getDBPath())
+            ToolRegistry.invalidate()
+            os.environ['HOME'] = savedHome
+    tools = [toolMap[name] for name in toolSetIndex["Tools in Initial Installation"]]
+    results = OrderedDict()
+    startTime = monotonic()
+    sequentialResults = ToolSetRunner(tools, maxParallel=1).run()
+    results['one at a time'] = monotonic() - startTime
+    results['slowest tool'] = max(result.wallTime for result in sequentialResults.values())
+    startTime = monotonic()
+    ToolSetRunner(tools, maxParallel=maxParallel).run()
+    results['ToolSetRunner, ' + str(maxParallel) + ' parallel'] = monotonic() - startTime
+    return results
+
+
+def benchmarkPipeline(lineCount: int=200000):
+    """
+    Seconds, and the most output held by this process at once, to run a journalctl -o json | jq | sort | uniq -c
+    style pipeline with spawnPipeline() and by capturing each command's output in Python and feeding it to the next.
+    A Python one liner stands in for journalctl.
+    """
+    generator = (sys.executable, '-c',
+                 "import json\nfor n in range(" + str(lineCount) + "):\n    print(json.dumps({'__REALTIME_TIMESTAMP': "
+                 "str(1660000000000000 + n), 'PRIORITY': str(n % 8), '_SYSTEMD_UNIT': 'unit' + str(n % 97) + "
+                 "'.service', 'MESSAGE': 'message ' + str(n) * 8}))")
+    commandLines = (generator, ('jq', '-r', '._SYSTEMD_UNIT + " " + .PRIORITY'), ('sort',), ('uniq', '-c'))
+    results = OrderedDict()
+
+    startTime = monotonic()
+    data = b''
+    mostHeld = 0
+    for commandLine in commandLines:
+        data = Popen(commandLine, stdin=DEVNULL if len(data) == 0 else PIPE, stdout=PIPE).communicate(data)[0]
+        mostHeld = max(mostHeld, len(data))
+    results['capture and feed'] = (monotonic() - startTime, mostHeld)
+    feedOutput = data
+
+    startTime = monotonic()
+    readFd, writeFd = os.pipe()
+    try:
+        processes = spawnPipeline(commandLines, writeFd)
+    finally:
+        os.close(writeFd)
+    chunks = []
+    mostHeld = 0
+    with os.fdopen(readFd, 'rb') as stream:
+        while True:
+            chunk = stream.read1(READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            mostHeld = max(mostHeld, len(chunk))
+    for process in processes:
+        process.wait()
+    results['spawnPipeline'] = (monotonic() - startTime, mostHeld)
+    if b''.join(chunks) != feedOutput:
+        raise Exception("benchmarkPipeline - spawnPipeline output differs from capture and feed output")
+    return results
+
+
+def checkPipelineSignals():
+    """
+    yes | head -1 through spawnPipeline() must output only y, and every stage's status must be 0:  yes must end on
+    SIGPIPE, as in the shell, rather than write an error and exit with 1.
+    """
+    readFd, writeFd = os.pipe()
+    try:
+        processes = spawnPipeline((('yes',), ('head', '-1')), writeFd)
+    finally:
+        os.close(writeFd)
+    with os.fdopen(readFd, 'rb') as stream:
+        output = stream.read()
+    for process in processes:
+        process.wait()
+    returnCodes = [stageReturnCode(processes, index) for index in range(len(processes))]
+    if output != b'y\n' or returnCodes != [0, 0]:
+        raise Exception("checkPipelineSignals - yes | head -1 gave " + repr(output) + ", exit codes " +
+                        str(returnCodes))
+
+
+if __name__ == "__main__":
+    checkPipelineSignals()
+    for method, (seconds, mostHeld) in benchmarkPipeline().items():
+        print(method + ":\t" + str(round(seconds, 3)) + " s,  most held:  " + str(mostHeld) + " bytes")
+    for case, seconds in benchmarkToolSetRunner().items():
+        print(case + ":\t" + str(round(seconds, 3)) + " s")
+    for parentMB in (0, 500):
+        for method, milliseconds in benchmarkExecService(parentMB=parentMB).items():
+            print(method + ", " + str(parentMB) + " MB parent:\t" + str(round(milliseconds, 3)) + " ms per command")
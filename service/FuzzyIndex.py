@@ -0,0 +1,251 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         service/FuzzyIndex.py
+#   Purpose:        Candidate pruning for fuzzy text searches of table columns, so that fuzz.ratio() is only applied
+#                   to the values which can possibly reach the percent match the user asked for.
+#   Development:
+#       fuzz.ratio() is 2 * M / (n + m) for strings of length n and m with M matching characters, in order, so a
+#       percent threshold sets a minimum M.  Pruning uses three filters which can never reject a value that
+#       fuzz.ratio() would pass:
+#           Length:     M can be no more than min(n, m).
+#           Bigrams:    Keeping M characters of the query deletes n - M of them, each breaking at most 2 of its
+#                       bigrams, and inserts m - M, each breaking at most 1.  The bigrams left are shared by the
+#                       value, so it must share at least (n - 1) - 2 * (n - M) - (m - M) of them.  Only values
+#                       containing one of the rarest query bigrams can share enough, so candidates come from the
+#                       shortest posting lists.
+#           Characters: M can be no more than the size of the intersection of the two character multisets.
+#       Trigrams were tried first, but at the 70 - 90 percent thresholds the user normally picks their bound is
+#       not positive for command line length strings, leaving only the length filter.
+#
+#       2026-10-19: Benchmark, 1,000,000 synthetic command line strings, 80 percent threshold
+#           (python -m service.FuzzyIndex, fuzz.ratio() backed by difflib):
+#               Index build:                    16 - 20 s
+#               Naive fuzz.ratio() scan:        18,000 - 19,600 rows / second
+#               NGramIndex.search():            290,000 - 4,250,000 rows / second, depending on the query
+#
+
+from collections import OrderedDict, Counter
+from array import array
+from math import ceil, floor
+from random import Random
+from time import perf_counter
+
+from fuzzywuzzy import fuzz
+
+GRAM_SIZE = 2
+
+
+def gramKeys(text: str):
+    """
+    The bigrams of text as a set in which repeated bigrams are numbered, so that the size of the intersection of
+    two of these sets is the size of the intersection of the bigram multisets.
+    """
+    keys = set()
+    counts = {}
+    for idx in range(len(text) - GRAM_SIZE + 1):
+        gram = text[idx: idx + GRAM_SIZE]
+        if gram in keys:
+            counts[gram] = counts.get(gram, 1) + 1
+            keys.add(gram + '\x00' + str(counts[gram]))
+        else:
+            keys.add(gram)
+    return keys
+
+
+class FuzzyBounds:
+    """
+    The length range, minimum bigram overlap and minimum character overlap a value must have to reach percent with a query of length
+    queryLength.  fuzz.ratio() rounds to the nearest integer, so a true ratio half a percent below passes.
+    """
+
+    def __init__(self, queryLength: int, percent: int):
+        self.queryLength = queryLength
+        self.ratio = max(0.0, (percent - 0.5) / 100.0)
+        if self.ratio > 0:
+            self.minLength = ceil(self.ratio * queryLength / (2.0 - self.ratio))
+            self.maxLength = floor(queryLength * (2.0 - self.ratio) / self.ratio)
+        else:
+            self.minLength = 0
+            self.maxLength = None
+
+    def lengthPasses(self, length: int):
+        return length >= self.minLength and (self.maxLength is None or length <= self.maxLength)
+
+    def requiredMatches(self, length: int):
+        return ceil(self.ratio * (self.queryLength + length) / 2.0 - 1e-9)
+
+    def requiredGrams(self, length: int):
+        matches = self.requiredMatches(length)
+        return max(self.queryLength - GRAM_SIZE + 1 - GRAM_SIZE * (self.queryLength - matches) -
+                   (GRAM_SIZE - 1) * (length - matches),
+                   length - GRAM_SIZE + 1 - GRAM_SIZE * (length - matches) -
+                   (GRAM_SIZE - 1) * (self.queryLength - matches))
+
+    def charactersPass(self, queryCounts: dict, value: str):
+        common = 0
+        for character, count in queryCounts.items():
+            common += min(count, value.count(character))
+        return common >= self.requiredMatches(len(value))
+
+
+class NGramIndex:
+    """
+    Inverted bigram index over a sequence of column values.
+    Values are referenced by their position in the sequence, which is the row index in the table data the
+    index was built from.  None is indexed as an empty string, and other non string values by their str().
+    Console output columns repeat the same values many times, so each distinct value is indexed, filtered and
+    scored once and mapped back to the rows it appears in.
+    """
+
+    def __init__(self, values):
+        if values is None or not (isinstance(values, list) or isinstance(values, tuple)):
+            raise Exception("NGramIndex constructor - Invalid values argument:  " + str(type(values)))
+        self.values = tuple('' if value is None else value if isinstance(value, str) else str(value)
+                            for value in values)
+        self.distinctValues = []
+        self.rowIndexes = []
+        self.postings = {}
+        self.lengthBuckets = {}
+        distinctIndexes = {}
+        for rowIdx, value in enumerate(self.values):
+            distinctIdx = distinctIndexes.get(value)
+            if distinctIdx is None:
+                distinctIdx = len(self.distinctValues)
+                distinctIndexes[value] = distinctIdx
+                self.distinctValues.append(value)
+                self.rowIndexes.append(array('l'))
+                if len(value) not in self.lengthBuckets:
+                    self.lengthBuckets[len(value)] = array('l')
+                self.lengthBuckets[len(value)].append(distinctIdx)
+                for key in gramKeys(value):
+                    if key not in self.postings:
+                        self.postings[key] = array('l')
+                    self.postings[key].append(distinctIdx)
+            self.rowIndexes[distinctIdx].append(rowIdx)
+
+    def distinctCandidates(self, query: str, percent: int):
+        """
+        Indexes into distinctValues of the values which survive the length, bigram and character filters.
+        """
+        bounds = FuzzyBounds(len(query), percent)
+        lengths = [length for length in self.lengthBuckets if bounds.lengthPasses(length)]
+        if len(lengths) == 0:
+            return []
+        queryKeys = gramKeys(query)
+        minRequired = min(bounds.requiredGrams(length) for length in lengths)
+        if minRequired <= 0:
+            #   Short query or low threshold: bigrams cannot rule anything out, only the length filter applies.
+            candidateIds = set()
+            for length in lengths:
+                candidateIds.update(self.lengthBuckets[length])
+        else:
+            #   A value sharing minRequired of the query's bigrams must contain one of its
+            #   len(queryKeys) - minRequired + 1 rarest ones.
+            rarest = sorted(queryKeys, key=lambda key: len(self.postings.get(key, ())))
+            candidateIds = set()
+            for key in rarest[: len(queryKeys) - minRequired + 1]:
+                candidateIds.update(self.postings.get(key, ()))
+
+        queryCounts = Counter(query)
+        survivors = []
+        for distinctIdx in candidateIds:
+            value = self.distinctValues[distinctIdx]
+            if not bounds.lengthPasses(len(value)):
+                continue
+            required = bounds.requiredGrams(len(value))
+            if required > 0 and len(queryKeys.intersection(gramKeys(value))) < required:
+                continue
+            if not bounds.charactersPass(queryCounts, value):
+                continue
+            survivors.append(distinctIdx)
+        return survivors
+
+    def candidates(self, query: str, percent: int):
+        """
+        Row indexes, in ascending order, of the values which survive the length, bigram and character filters.
+        """
+        rowIndexes = []
+        for distinctIdx in self.distinctCandidates(query, percent):
+            rowIndexes.extend(self.rowIndexes[distinctIdx])
+        rowIndexes.sort()
+        return rowIndexes
+
+    def search(self, query: str, percent: int):
+        """
+        Find the values whose fuzz.ratio() with query is at least percent.
+        :param query:   The text the user entered.
+        :param percent: Minimum match percent, as in stringEntry['percentSpinner'].
+        :return:        Tuple of (row index, ratio) in row order.
+        """
+        if query is None or not isinstance(query, str):
+            raise Exception("NGramIndex.search - Invalid query argument:  " + str(query))
+        if percent is None or not isinstance(percent, int) or not 0 <= percent <= 100:
+            raise Exception("NGramIndex.search - Invalid percent argument:  " + str(percent))
+        matches = []
+        for distinctIdx in self.distinctCandidates(query, percent):
+            ratio = fuzz.ratio(query, self.distinctValues[distinctIdx])
+            if ratio >= percent:
+                for rowIdx in self.rowIndexes[distinctIdx]:
+                    matches.append((rowIdx, ratio))
+        matches.sort()
+        return tuple(matches)
+
+    @staticmethod
+    def valuePasses(query: str, value: str, percent: int, queryKeys: set=None):
+        """
+        Apply the same filters and scoring to a single value, for consumers streaming rows which cannot be
+        indexed ahead of time.
+        """
+        bounds = FuzzyBounds(len(query), percent)
+        if not bounds.lengthPasses(len(value)):
+            return False
+        required = bounds.requiredGrams(len(value))
+        if required > 0:
+            if queryKeys is None:
+                queryKeys = gramKeys(query)
+            if len(queryKeys.intersection(gramKeys(value))) < required:
+                return False
+        if not bounds.charactersPass(Counter(query), value):
+            return False
+        return fuzz.ratio(query, value) >= percent
+
+
+def benchmark(rowCount: int=1000000, percent: int=80, naiveSampleSize: int=20000, seed: int=17):
+    """
+    Compare a naive fuzz.ratio() scan with NGramIndex.search() on a synthetic column of command lines.
+    The naive scan is timed on naiveSampleSize rows and reported as rows per second.
+    """
+    words = ('journalctl', 'systemd', 'dpkg', 'apt', 'python3', 'bash', 'sshd', 'cron', 'kworker', 'firefox',
+             '--user', '--system', '--lines=1000', '-o', 'json', '-lf', '-A', '/usr/bin', '/usr/lib', '/var/log',
+             'gnome-shell', 'pulseaudio', 'NetworkManager', 'dbus-daemon', 'snapd', 'udisksd', 'polkitd',
+             'containerd', 'dockerd', 'xdg-desktop-portal', '--session', '--config', 'evolution', 'tracker')
+    generator = Random(seed)
+    column = [' '.join(generator.choice(words) for wordIdx in range(generator.randint(1, 4))) +
+              ' ' + str(generator.randint(1, 99999)) for rowIdx in range(rowCount)]
+    queries = ('journalctl --user', 'gnome-shell --session', 'dpkg -lf', 'NetworkManager 1234')
+
+    results = OrderedDict()
+    startTime = perf_counter()
+    index = NGramIndex(column)
+    results['index build seconds'] = perf_counter() - startTime
+
+    startTime = perf_counter()
+    for query in queries:
+        for value in column[:naiveSampleSize]:
+            fuzz.ratio(query, value)
+    results['naive rows / second'] = naiveSampleSize * len(queries) / (perf_counter() - startTime)
+
+    for query in queries:
+        startTime = perf_counter()
+        matches = index.search(query, percent)
+        elapsed = perf_counter() - startTime
+        results['indexed rows / second: ' + query] = rowCount / elapsed
+        results['matches: ' + query] = len(matches)
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in benchmark().items():
+        print(name + ":\t" + str(round(value, 2)))
@@ -0,0 +1,408 @@
+#   Project:        LinuxTools
+#   Author:         George Keith Watson
+#   Date Started:   October 19, 2026
+#   Copyright:      (c) Copyright 2022 George Keith Watson
+#   Module:         service/Scheduler.py
+#   Purpose:        Running saved Tools periodically, e.g. ps -lf -A, free and journalctl snapshots, in the background,
+#                   with their output saved to the console output database.
+#   Development:
+#       ToolScheduler keeps its schedules in a heap ordered by the time each is next due.  One dispatcher thread
+#       sleeps until the earliest is due, hands it to a worker pool and puts it back for its next run, so the cost
+#       of waiting does not grow with the number of schedules.
+#
+#       Each run is due at a multiple of its schedule's interval from the first, optionally aligned to the clock,
+#       e.g. every 5 minutes on the 5 minutes as cron would, so runs do not drift by the time they take.  A random
+#       delay of up to the schedule's jitter is added to each run so that schedules with the same interval do not
+#       all start their commands at the same moment.  A run which is due while the schedule's previous run is still
+#       going is skipped, not queued.
+#
+#       Output is saved by a single writer thread, which collects the results for up to WRITE_INTERVAL seconds and
+#       saves them in one transaction, each in a savepoint so that one bad capture does not lose the others.
+#       journalctl -o json output is saved by JournalIngester in its own batches after the transaction.
+#
+#       2026-10-19: 40 schedules of free --mega, df and ps -lf -A every 0.5 s with 0.125 s jitter, for 10 s, 800 runs
+#           (python -m service.Scheduler):
+#                                           one transaction per result      batched
+#               transactions:               800                             8
+#               writer busy:                1.52 s                          0.49 s
+#               dispatch lateness, median:  2.0 ms                          0.9 ms
+#               dispatch lateness, max:     29 ms                           16 ms
+#
+
+import os
+import sys
+import heapq
+from io import StringIO
+from random import uniform
+from time import monotonic, time
+from datetime import datetime
+from math import ceil
+from signal import SIGKILL
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
+from threading import Thread, Condition
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty
+from collections import OrderedDict
+
+from model.Installation import INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB, pathFromList
+from model.ConnectionManager import ConnectionManager
+from model.DBInterface import ConsoleImport, JournalIngester, TabularImport, DPKG_L_COLUMNS_SQL, \
+    DPKG_L_COLUMN_NAMES, parseDpkg_l_Output
+from model.ProcessSnapshots import ProcessSnapshotStore
+from service.Execution import ToolRunResult
+
+WRITE_INTERVAL      = 2.0       #   seconds the writer collects results before saving them together
+WRITE_BATCH         = 100       #   results saved together at most
+MAX_WORKERS         = 4
+
+#   Interval units and cron style names, in seconds.
+INTERVAL_UNITS      = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+INTERVAL_NAMES      = {'@minutely': 60, '@hourly': 3600, '@daily': 86400, '@weekly': 604800}
+
+
+class Schedule:
+    """
+    A saved Tool, or an argv list, to run every interval seconds.  interval may also be a string, '30s', '5m',
+    '2h', '1d', or '@hourly', '@daily', etc.
+    The run counts and lastResult, a service.Execution.ToolRunResult, are updated by the ToolScheduler's threads.
+    """
+
+    def __init__(self, tool, interval, jitter: float=0.0, timeout: float=None, aligned: bool=False):
+        if hasattr(tool, 'getCommandLine'):                 #   model.ToolDB.Tool
+            self.name = tool.name
+            self.commandLine = tuple(tool.getCommandLine())
+        elif isinstance(tool, (list, tuple)) and len(tool) > 0:
+            self.name = ' '.join(tool)
+            self.commandLine = tuple(tool)
+        else:
+            raise Exception("Schedule constructor - Invalid tool argument:  " + str(tool))
+        self.interval = Schedule.parseInterval(interval)
+        if not isinstance(jitter, (int, float)) or jitter < 0 or jitter >= self.interval:
+            raise Exception("Schedule constructor - Invalid jitter argument:  " + str(jitter))
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise Exception("Schedule constructor - Invalid timeout argument:  " + str(timeout))
+        self.jitter = jitter
+        #   A run may not outlast its interval by default, since the next one would be skipped anyway.
+        self.timeout = self.interval if timeout is None else timeout
+        self.aligned = aligned
+        self.baseDue = None             #   monotonic time the next run is due, before jitter
+        self.running = False
+        self.cancelled = False
+        self.runCount = 0
+        self.skipCount = 0
+        self.failCount = 0
+        self.lastResult = None
+
+    @staticmethod
+    def parseInterval(interval):
+        """
+        :return:    The interval in seconds.
+        """
+        seconds = None
+        if isinstance(interval, (int, float)) and not isinstance(interval, bool):
+            seconds = interval
+        elif isinstance(interval, str):
+            text = interval.strip().lower()
+            if text in INTERVAL_NAMES:
+                seconds = INTERVAL_NAMES[text]
+            elif len(text) > 1 and text[-1] in INTERVAL_UNITS:
+                try:
+                    seconds = float(text[:-1]) * INTERVAL_UNITS[text[-1]]
+                except ValueError:
+                    pass
+        if seconds is None or seconds <= 0:
+            raise Exception("Schedule.parseInterval - Invalid interval argument:  " + str(interval))
+        return seconds
+
+    def firstDue(self, now: float):
+        if self.aligned:
+            #   The next multiple of the interval on the wall clock, expressed in monotonic time.
+            return now + self.interval - time() % self.interval
+        return now
+
+    def advance(self, now: float):
+        """
+        Move baseDue to the next run after now.  Runs missed entirely, e.g. while the machine was suspended, are
+        counted as skipped.
+        """
+        self.baseDue += self.interval
+        if self.baseDue < now:
+            missed = ceil((now - self.baseDue) / self.interval)
+            self.skipCount += missed
+            self.baseDue += missed * self.interval
+
+    def __str__(self):
+        return str({'name': self.name, 'commandLine': self.commandLine, 'interval': self.interval,
+                    'jitter': self.jitter, 'runCount': self.runCount, 'skipCount': self.skipCount,
+                    'failCount': self.failCount})
+
+
+class ToolScheduler:
+    """
+    Runs Schedules on a pool of maxWorkers threads and saves their output to the console output database, dbPath.
+    Nothing runs on, or waits for, the Tk thread.
+    """
+
+    def __init__(self, maxWorkers: int=MAX_WORKERS, dbPath: str=None, writeInterval: float=WRITE_INTERVAL,
+                 writeBatch: int=WRITE_BATCH):
+        if not isinstance(maxWorkers, int) or maxWorkers < 1:
+            raise Exception("ToolScheduler constructor - Invalid maxWorkers argument:  " + str(maxWorkers))
+        if dbPath is None:
+            dbPath = pathFromList((INSTALLATION_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB))
+        if not isinstance(dbPath, str):
+            raise Exception("ToolScheduler constructor - Invalid dbPath argument:  " + str(dbPath))
+        if not isinstance(writeInterval, (int, float)) or writeInterval < 0:
+            raise Exception("ToolScheduler constructor - Invalid writeInterval argument:  " + str(writeInterval))
+        if not isinstance(writeBatch, int) or writeBatch < 1:
+            raise Exception("ToolScheduler constructor - Invalid writeBatch argument:  " + str(writeBatch))
+        self.maxWorkers = maxWorkers
+        self.dbPath = dbPath
+        self.writeInterval = writeInterval
+        self.writeBatch = writeBatch
+        self.condition = Condition()
+        self.heap = []                  #   (due, sequence, Schedule)
+        self.sequence = 0
+        self.schedules = []
+        self.executor = None
+        self.dispatcher = None
+        self.writer = None
+        self.results = Queue()          #   (Schedule, ToolRunResult, runTimeStamp), None to stop the writer
+        self.stopping = False
+        self.lateness = []              #   seconds each run was dispatched after it was due, jitter included
+
+    def add(self, tool, interval, jitter: float=0.0, timeout: float=None, aligned: bool=False):
+        """
+        Schedule tool, a saved Tool or an argv list.  The arguments are those of Schedule.
+        :return:    The Schedule, for remove() and its run counts.
+        """
+        schedule = Schedule(tool, interval, jitter=jitter, timeout=timeout, aligned=aligned)
+        with self.condition:
+            self.schedules.append(schedule)
+            if self.dispatcher is not None:
+                self.push(schedule, schedule.firstDue(monotonic()))
+        return schedule
+
+    def remove(self, schedule: Schedule):
+        #   The heap entry is dropped when it comes due.  A run in progress finishes and is saved.
+        with self.condition:
+            if schedule in self.schedules:
+                self.schedules.remove(schedule)
+                schedule.cancelled = True
+
+    def push(self, schedule: Schedule, baseDue: float):
+        #   Called with the condition held.
+        schedule.baseDue = baseDue
+        self.sequence += 1
+        heapq.heappush(self.heap, (baseDue + uniform(0, schedule.jitter), self.sequence, schedule))
+        self.condition.notify()
+
+    def start(self):
+        if self.dispatcher is not None:
+            raise Exception("ToolScheduler.start - already started")
+        self.stopping = False
+        self.executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix="ToolScheduler")
+        self.writer = Thread(target=self.write, name="ToolScheduler writer", daemon=True)
+        self.writer.start()
+        with self.condition:
+            now = monotonic()
+            for schedule in self.schedules:
+                self.push(schedule, schedule.firstDue(now))
+            self.dispatcher = Thread(target=self.dispatch, name="ToolScheduler dispatcher", daemon=True)
+            self.dispatcher.start()
+
+    def stop(self):
+        """
+        Stop dispatching, wait for the runs in progress and save their output.
+        """
+        if self.dispatcher is None:
+            return
+        with self.condition:
+            self.stopping = True
+            self.heap.clear()
+            self.condition.notify()
+        self.dispatcher.join()
+        self.executor.shutdown(wait=True)
+        self.results.put(None)
+        self.writer.join()
+        self.dispatcher = self.executor = self.writer = None
+
+    def dispatch(self):
+        #   Dispatcher thread.
+        with self.condition:
+            while not self.stopping:
+                if len(self.heap) == 0:
+                    self.condition.wait()
+                    continue
+                due, sequence, schedule = self.heap[0]
+                now = monotonic()
+                if due > now:
+                    self.condition.wait(due - now)
+                    continue
+                heapq.heappop(self.heap)
+                if schedule.cancelled:
+                    continue
+                if schedule.running:
+                    schedule.skipCount += 1
+                else:
+                    schedule.running = True
+                    self.lateness.append(now - due)
+                    self.executor.submit(self.runSchedule, schedule)
+                schedule.advance(now)
+                self.push(schedule, schedule.baseDue)
+
+    def runSchedule(self, schedule: Schedule):
+        #   Worker thread.  stderr is kept apart from the output, which is saved, e.g. journalctl's hints.
+        result = ToolRunResult(schedule.name, schedule.commandLine)
+        runTimeStamp = str(datetime.now())
+        startTime = monotonic()
+        try:
+            try:
+                process = Popen(schedule.commandLine, stdout=PIPE, stderr=PIPE, stdin=DEVNULL,
+                                start_new_session=True)
+            except OSError as error:
+                result.error = str(error)
+                return
+            try:
+                output, errors = process.communicate(timeout=schedule.timeout)
+                result.returnCode = process.returncode
+            except TimeoutExpired:
+                try:
+                    os.killpg(process.pid, SIGKILL)
+                except ProcessLookupError:
+                    pass
+                output, errors = process.communicate()
+                result.timedOut = True
+            result.wallTime = monotonic() - startTime
+            result.output = output.decode('utf-8', errors='replace')
+            if len(errors) > 0:
+                result.error = errors.decode('utf-8', errors='replace')
+        finally:
+            schedule.runCount += 1
+            schedule.lastResult = result
+            if result.returnCode != 0:
+                schedule.failCount += 1
+            else:
+                self.results.put((schedule, result, runTimeStamp))
+            schedule.running = False
+
+    def write(self):
+        #   Writer thread, the only one writing scheduled output to the database.
+        stopped = False
+        while not stopped:
+            item = self.results.get()
+            if item is None:
+                break
+            batch = [item]
+            batchEnd = monotonic() + self.writeInterval
+            while len(batch) < self.writeBatch:
+                try:
+                    item = self.results.get(timeout=max(0.0, batchEnd - monotonic()))
+                except Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                batch.append(item)
+            self.saveResults(batch)
+        ConnectionManager.closeConnections()
+
+    def saveResults(self, batch: list):
+        """
+        Save the output of batch, a list of (Schedule, ToolRunResult, runTimeStamp), in one transaction.
+        """
+        journalRuns = []
+        try:
+            with ConnectionManager.transaction(self.dbPath) as cursor:
+                for schedule, result, runTimeStamp in batch:
+                    if ToolScheduler.isJournalJson(result.commandLine):
+                        journalRuns.append((schedule, result, runTimeStamp))
+                        continue
+                    cursor.execute("SAVEPOINT scheduledRun")
+                    try:
+                        self.saveOutput(result.commandLine, result.output, runTimeStamp)
+                        cursor.execute("RELEASE scheduledRun")
+                    except Exception as error:
+                        cursor.execute("ROLLBACK TO scheduledRun")
+                        cursor.execute("RELEASE scheduledRun")
+                        ToolScheduler.saveFailed(schedule, result, error)
+        except Exception as error:
+            #   The table name and id caches may now name rows which were rolled back.
+            ConsoleImport.tableNameCache.pop(self.dbPath, None)
+            ProcessSnapshotStore.internCache.pop(self.dbPath, None)
+            print("ToolScheduler.saveResults - batch of " + str(len(batch)) + " not saved:  " + str(error),
+                  file=sys.stderr)
+        for schedule, result, runTimeStamp in journalRuns:
+            try:
+                JournalIngester(self.dbPath).ingest(result.commandLine, StringIO(result.output), runTimeStamp)
+            except Exception as error:
+                ToolScheduler.saveFailed(schedule, result, error)
+
+    def saveOutput(self, argv, consoleOutput: str, runTimeStamp: str):
+        #   The same choice of table as the console's 'Save to DB Table'.
+        if argv[0] == 'dpkg' and '-l' in argv:
+            ConsoleImport(self.dbPath).importRows(argv, DPKG_L_COLUMNS_SQL, DPKG_L_COLUMN_NAMES,
+                                                  parseDpkg_l_Output(consoleOutput, runTimeStamp))
+        elif argv[0] == 'ps' and len(argv) == 3 and '-lf' in argv and '-A' in argv:
+            ProcessSnapshotStore(self.dbPath).saveCapture(consoleOutput, runTimeStamp)
+        else:
+            TabularImport(self.dbPath).importOutput(argv, consoleOutput, runTimeStamp)
+
+    @staticmethod
+    def isJournalJson(argv):
+        return argv[0] == 'journalctl' and ('json' in argv or '--output=json' in argv)
+
+    @staticmethod
+    def saveFailed(schedule: Schedule, result: ToolRunResult, error: Exception):
+        schedule.failCount += 1
+        result.error = "Output not saved:  " + str(error)
+        print("ToolScheduler - " + schedule.name + " output not saved:  " + str(error), file=sys.stderr)
+
+
+def benchmarkToolScheduler(scheduleCount: int=40, interval: float=0.5, seconds: float=10.0):
+    """
+    scheduleCount schedules of free, df and ps -lf -A, every interval seconds with jitter, saving into a temporary
+    database, with each result saved as it arrives and with the writer's batches.
+    """
+    from tempfile import TemporaryDirectory
+    from time import sleep
+    commandLines = (('free', '--mega'), ('df',), ('ps', '-lf', '-A'))
+    results = OrderedDict()
+    for mode, writeInterval, writeBatch in (('one transaction per result', 0.0, 1),
+                                            ('batched', WRITE_INTERVAL, WRITE_BATCH)):
+        with TemporaryDirectory() as folderPath:
+            scheduler = ToolScheduler(maxWorkers=8, dbPath=folderPath + '/ConsoleOutput.db',
+                                      writeInterval=writeInterval, writeBatch=writeBatch)
+            batchCount = [0]
+            writeSeconds = [0.0]
+            saveResults = scheduler.saveResults
+
+            def countingSaveResults(batch: list):
+                batchCount[0] += 1
+                writeStart = monotonic()
+                saveResults(batch)
+                writeSeconds[0] += monotonic() - writeStart
+
+            scheduler.saveResults = countingSaveResults
+            schedules = [scheduler.add(commandLines[index % len(commandLines)], interval, jitter=interval / 4)
+                         for index in range(scheduleCount)]
+            startTime = monotonic()
+            scheduler.start()
+            sleep(seconds)
+            scheduler.stop()
+            elapsed = monotonic() - startTime
+            lateness = sorted(scheduler.lateness)
+            results[mode] = OrderedDict((
+                ('runs', sum(schedule.runCount for schedule in schedules)),
+                ('skipped', sum(schedule.skipCount for schedule in schedules)),
+                ('failed', sum(schedule.failCount for schedule in schedules)),
+                ('transactions', batchCount[0]),
+                ('writer busy s', round(writeSeconds[0], 2)),
+                ('median dispatch lateness ms', round(lateness[len(lateness) // 2] * 1000, 2)),
+                ('max dispatch lateness ms', round(lateness[-1] * 1000, 2)),
+                ('seconds', round(elapsed, 2))))
+    return results
+
+
+if __name__ == "__main__":
+    for mode, counts in benchmarkToolScheduler().items():
+        print(mode + ":\t" + str(dict(counts)))
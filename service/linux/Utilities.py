@@ -107,6 +107,7 @@ import os, json, string
 from pathlib import Path
 
 from service.linux.NroffMan import NroffScanner
+from service.Execution import ExecService
 
 class ManPageScanner:
 
@@ -128,9 +129,15 @@ class ManPageScanner:
 
     @staticmethod
     def parseManPage(utilityName):
-        outputStream = os.popen('man ' + utilityName)
-        manPageText = outputStream.read().strip()
-        outputStream.close()
+        #   No shell: the utility name is passed to man as is.  man's stderr comes back with its stdout, so a failed
+        #   run, e.g. "No manual entry", counts as no text.
+        try:
+            manPageText, returnCode = ExecService.run(('man', utilityName))
+        except OSError:
+            manPageText, returnCode = '', None
+        if returnCode != 0:
+            manPageText = ''
+        manPageText = manPageText.strip()
         if len(manPageText) == 0:
             raise Exception('ManPageScan constructor - unable to run command:\t' + utilityName)
 
@@ -362,6 +362,7 @@ class JsonTreeView(Treeview):
             self['show'] = 'tree headings'
 
         self.jsonContent = None
+        self.listBranchIds = {}         #   appendElements() list name -> its branch id
         if jsonContent is not None:
             self.setModel(jsonContent)
 
@@ -456,10 +457,32 @@ class JsonTreeView(Treeview):
     def setModel(self, jsonContent: dict):
         items = self.get_children()
         self.delete(*items)
+        self.listBranchIds = {}
         for name, value in jsonContent.items():
             self.addBranch('', name, value)
         self.jsonContent = jsonContent
 
+    def appendElements(self, name: str, elements: list):
+        """
+        Add elements to the list named name at the top of the tree, creating it if needed, without redrawing what
+        is already shown.  The model, jsonContent[name], grows with them.
+        """
+        if self.jsonContent is None:
+            self.jsonContent = {}
+        if name not in self.jsonContent:
+            self.jsonContent[name] = []
+            if self.mode == JsonTreeView.MODE_STRICT:
+                self.listBranchIds[name] = self.insert('', END, text=str(name), tags=str(name),
+                                                       open=self.openBranches)
+            else:
+                self.listBranchIds[name] = self.insert('', END, values=(str(name), ""), tags=str(name),
+                                                       open=self.openBranches)
+        listIdx = len(self.jsonContent[name])
+        for element in elements:
+            self.addBranch(self.listBranchIds[name], "Idx: " + str(listIdx), element)
+            listIdx += 1
+        self.jsonContent[name].extend(elements)
+
     def getState(self):
         return self.jsonContent
 
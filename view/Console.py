@@ -192,12 +192,18 @@ from model.Util import JsonIndex, pathFromList, INSTALLATION_FOLDER, DOCUMENTATI
                     USER_DATA_FOLDER, SAVED_CONSOLE_OUT_FOLDER, CONSOLE_OUT_TEXT_FOLDER, CONSOLE_OUT_DB_FOLDER,\
                     USER_LOG_ARCHIVES_FOLDER, APP_DATA_FOLDER, USER_CONSOLE_OUT_DB
 
-from model.DBInterface import saveDpkg_l_OutputToDB, savePs_lf_A_OutputToDB, journalctl_o_json_OutputToDB
+from model.DBInterface import saveDpkg_l_OutputToDB, savePs_lf_A_OutputToDB, journalctl_o_json_OutputToDB, \
+    saveTabularOutputToDB
+from model.ProcessSnapshots import saveProcessSnapshot
 from model.HelpContent import HelpContent
 from service.tools.dpkg import DEFAULT_DEB_DPKG_LOCATION, DEFAULT_DEB_DPKG_NAME
 from view.Components import OptionEntryDialog, JsonTreeViewFrame, JsonTreeView
 from view.Help import HelpDialog, HelpAndApproval
 from view.Administration import Administration
+from service.Execution import StreamingCommand, StreamingPipeline, ResultCache
+from model.RunMetrics import RunMetrics
+from model.OutputParsers import OutputParsers
+from model.CaptureStore import CaptureStore
 
 FEATURE_NAME_IMAGE_LOGS     = "CD / DVD Image of Logs"
 FEATURE_NAME_ISO_IMAGE_FOLDER   = "Make ISO Image of Folder"
@@ -308,6 +314,10 @@ class OutputFrame(LabelFrame):
         self.horzScrollBar = None
         self.currentViewMode = None
         self.setViewMode('text')
+        self.partialLine = ''
+        self.maxLineLen = 0
+        self.outputParser = OutputParsers.forCommand(())
+        self.treeName = ''
 
         """
         #   Load some sample text from the help files
@@ -316,57 +326,70 @@ class OutputFrame(LabelFrame):
         sudoManFile.close()
         """
         self.content = None
-        try:
-            commandList = ['dpkg', '-l']
-            sub     = Popen(commandList, stdout=PIPE, stderr=STDOUT )
-            self.container.lastCommandRunTime = datetime.now()
-            output, error_message = sub.communicate()
-            content  = output.decode('utf-8')
-            self.setContent(content, commandList)
-        except Exception:
-            self.content = ''
-            for line in exc_info():
-                self.content += str(line) + '\n'
 
     def setContent(self, content: str, commandList: list):
+        self.beginContent(commandList)
         self.outputText.config(state=NORMAL)
-        self.outputText.delete('1.0', 'end')
         self.outputText.insert(END, content)
         self.outputText.config(state=DISABLED)
+        self.parseContent(content)
+        self.endContent(content, commandList)
 
-        lines = content.split('\n')
-        maxLineLen = 0
-        lineIdx = 0
-        for line in lines:
-            length = len(line)
-            if length > maxLineLen:
-                maxLineLen = length
-            lineIdx += 1
+    def beginContent(self, commandList: list=()):
+        """
+        Clear the views for the output of a command which will arrive in pieces through appendContent(), and choose
+        the parser which turns it into records for the tree view as it arrives.
+        """
+        self.content = None
+        self.outputText.config(state=NORMAL)
+        self.outputText.delete('1.0', 'end')
+        self.outputText.config(state=DISABLED)
         self.outputListBox.delete(0, END)
-        self.outputListBox.insert(END, *lines)
-        self.outputListBox.configure(height=50, width=maxLineLen + 4)
-
-        jsonContent = None
-        try:
-            jsonContent = loads(content)
-        except:
-            #   Possibly a list of json formatted lines
-            commandString = ''
-            for arg in commandList:
-                commandString += arg + ' '
-            commandString = commandString.strip()
-            jsonContent = {}
-            jsonContent[commandString] = []
-            lines = content.split('\n')
-            for line in lines:
-                #   print("json:\t" + line)
-                if line.strip() != '':
-                    jsonContent[commandString].append(loads(line))
-
-        if jsonContent is not None:
-            self.outputTreview.setModel(jsonContent)
+        self.outputTreview.setModel({})
+        self.partialLine = ''
+        self.maxLineLen = 0
+        self.outputParser = OutputParsers.forCommand(commandList)
+        self.treeName = ' '.join(arg for arg in commandList if arg != '')
+
+    def appendContent(self, text: str):
+        #   Only follow the output if the user has not scrolled up to read something.
+        following = self.outputText.yview()[1] >= 1.0
+        self.outputText.config(state=NORMAL)
+        self.outputText.insert(END, text)
+        self.outputText.config(state=DISABLED)
+        if following:
+            self.outputText.see(END)
+        self.parseContent(text)
+
+    def parseContent(self, text: str):
+        #   The complete lines of text go to the list view and the records the parser makes of them to the tree.
+        #   Nothing received before is looked at again.
+        lines = (self.partialLine + text).split('\n')
+        self.partialLine = lines.pop()
+        self.addListLines(lines)
+        self.addTreeRecords(self.outputParser.feed(text))
+
+    def addListLines(self, lines: list):
+        if len(lines) > 0:
+            self.outputListBox.insert(END, *lines)
+            maxLineLen = max(len(line) for line in lines)
+            if maxLineLen > self.maxLineLen:
+                self.maxLineLen = maxLineLen
+                self.outputListBox.configure(height=50, width=maxLineLen + 4)
+
+    def addTreeRecords(self, records: list):
+        if len(records) > 0:
+            self.outputTreview.appendElements(self.treeName, records)
             self.currentViewType = 'tree'
 
+    def endContent(self, content: str, commandList: list):
+        """
+        Add the last line, if the output did not end with a new line, to the list and tree views, which have the
+        rest of the output already, as does the text view.
+        """
+        self.addListLines([self.partialLine])
+        self.partialLine = ''
+        self.addTreeRecords(self.outputParser.finish())
         self.content = content
 
     def setViewMode(self, mode: str):
@@ -882,6 +905,11 @@ class ConsoleMenuBar(Menu):
     def redirectOutput(self, **keyWordArguments):
         if 'text' not in keyWordArguments:
             raise Exception('redirectOutput - text argument missing')
+        if keyWordArguments['text'] is None and self.consoleView.streamingCommand is not None and \
+                self.consoleView.streamingCommand.isRunning():
+            messagebox.showinfo('Redirect Output', 'The command is still running.\n'
+                                                   'Wait for it to finish or cancel it, then save its output.')
+            return
         if not isinstance(keyWordArguments['text'], str):
             raise Exception('redirectOutput - invalid text argument:    ' + str(keyWordArguments['text']))
         if 'target' not in keyWordArguments:
@@ -929,7 +957,9 @@ class ConsoleMenuBar(Menu):
                     if len(commandLine) >= 1:
                         commandLine = tuple(commandLine)
                         fileName += ' ' + str(commandLine)
-                    fileName += '.cmd_out'
+                    #   Stored in USER_CONSOLE_OUT_DB as a list of deduplicated, compressed chunks, which
+                    #   CaptureStore.read() turns back into the text.
+                    fileName = CaptureStore(filePath).save(fileName, keyWordArguments['text'])
                     messagebox.showinfo('File Name for Output', fileName )
                     jsonIndex   = JsonIndex(indexFileName='consoleOutArchive.index', archiveType='console output archive')
                     jsonIndex.addEntry('console output archive', 'consoleOutArchive.index',
@@ -937,11 +967,6 @@ class ConsoleMenuBar(Menu):
                                         'timeStamp': str(self.consoleView.lastCommandRunTime),
                                      'project': None, 'analysis': None, 'workflow': None, 'notes': '',
                                      'fileName': fileName, 'contentName': None})
-                    contentFilePath = INSTALLATION_FOLDER + '/' + USER_DATA_FOLDER + '/' + CONSOLE_OUT_TEXT_FOLDER + '/' + \
-                                    fileName
-                    contentFile     = open(contentFilePath, 'w')
-                    contentFile.write(keyWordArguments['text'])
-                    contentFile.close()
 
             else:
                 messagebox.showerror('Save Console Output to File',
@@ -950,17 +975,21 @@ class ConsoleMenuBar(Menu):
         #   DB Table Option:
         elif keyWordArguments['target'] == 'dbTable':
             argv = keyWordArguments['commandText'].split()
-            if argv[0] == 'dpkg' and '-lf' in argv:      #   CHECK: always same tabular format with '-l' option?
+            if argv[0] == 'dpkg' and '-l' in argv:      #   CHECK: always same tabular format with '-l' option?
                 #   Assumption: -l in the argv means:
                 #   The four fields in each line, in order, are: Name, Version, Architecture, and Description
-                saveDpkg_l_OutputToDB(argv, keyWordArguments['text'])
+                saveDpkg_l_OutputToDB(argv, keyWordArguments['text'], str(self.consoleView.lastCommandRunTime))
             elif argv[0] == 'ps' and len(argv) == 3 and '-lf' in argv and '-A' in argv:
-                #   ps -l -A
-                savePs_lf_A_OutputToDB(argv, keyWordArguments['text'])
+                #   ps -l -A, saved as a snapshot of the process table so that captures can be compared over time.
+                saveProcessSnapshot(keyWordArguments['text'], str(self.consoleView.lastCommandRunTime))
             #   journalctl --system --lines=1000 -o json
             elif argv[0] == "journalctl" and len(argv) == 5 and "-o" in argv and "json" in argv:
                 print("journalctl --system --lines=1000 -o json ==>> SQLite DB Table")
-                journalctl_o_json_OutputToDB(argv, keyWordArguments['text'])
+                journalctl_o_json_OutputToDB(argv, keyWordArguments['text'],
+                                             str(self.consoleView.lastCommandRunTime))
+            else:
+                #   Any other command with a header line followed by columns, e.g. df, lsblk, free, ps aux, ss -tan
+                saveTabularOutputToDB(argv, keyWordArguments['text'], str(self.consoleView.lastCommandRunTime))
 
 
 class ExfoliateCopyOptions(LabelFrame):
@@ -1036,6 +1065,12 @@ class ConsoleView(Toplevel):
         self.commandLineLabel   = Label(self, text='Command', border=2, relief=RIDGE, padx=10)
         self.commandLineEntry   = Entry(self, border=3, relief=RIDGE, textvariable=self.commandText)
         self.commandLineEntry.bind('<Key>', self.keyPressed)
+        #   Shift+Enter runs the command even if its output is in the ResultCache.
+        self.commandLineEntry.bind('<Shift-Return>', lambda event: self.runLinuxTool(useCache=False))
+        self.streamingCommand = None
+        self.cacheToken = None
+        self.cancelButton   = Button(self, text='Cancel Command', border=2, relief=RAISED, state=DISABLED,
+                                     command=self.cancelLinuxTool)
 
         self.outputFrame    = OutputFrame(self, border=3, relief=SUNKEN, padx=5, pady=5)
 
@@ -1043,8 +1078,14 @@ class ConsoleView(Toplevel):
 
         self.commandLineLabel.pack(padx=2, pady=2, anchor=W)
         self.commandLineEntry.pack(fill=X, expand=True, padx=10)
+        self.cancelButton.pack(padx=10, pady=2, anchor=E)
         self.outputFrame.pack(fill=BOTH, expand=True, padx=2, pady=2)
         self.messageLabel.pack(fill=X, expand=True, padx=3, pady=3)
+        #   keyWordArguments['pipeline']:  saved Tools to run as a pipe chain instead of the default command.
+        if 'pipeline' in keyWordArguments and keyWordArguments['pipeline']:
+            self.runPipeline(keyWordArguments['pipeline'])
+        else:
+            self.runLinuxTool()
 
     def messageReceiver(self, message: dict):
         print("messageReceiver:\t" + str(message))
@@ -1272,20 +1313,101 @@ class ConsoleView(Toplevel):
         return ch in ConsoleView.NON_ALPHANUMS or ch.isalpha() or ch.isdigit()
 
 
-    def runLinuxTool(self):
+    def runLinuxTool(self, useCache: bool=True):
+        #   The command runs in the background, its output streaming into the OutputFrame through
+        #   commandOutputReceiver(), so the console stays responsive and the command can be cancelled.
+        #   The output of read only commands, e.g. dpkg -l or man, is taken from the ResultCache if it is current.
+        if self.streamingCommand is not None and self.streamingCommand.isRunning():
+            self.messageLabel.configure(text="Cancel or wait for the running command:  " +
+                                             ' '.join(self.streamingCommand.commandList))
+            return
         commandList     = self.commandText.get().split(' ')
         print('commandList:\t' + str(commandList))
+        if '|' in commandList:
+            stages = [[]]
+            for arg in commandList:
+                if arg == '|':
+                    stages.append([])
+                elif arg != '':
+                    stages[-1].append(arg)
+            self.runPipeline(stages)
+            return
+        if useCache:
+            cached = ResultCache.get(commandList)
+            if cached is not None:
+                self.lastCommandRunTime = cached.runTime
+                self.outputFrame.setContent(cached.text, commandList)
+                self.messageLabel.configure(text="From cache, run at " + cached.runTime.strftime('%H:%M:%S') +
+                                                 " (Shift+Enter to run again):  " + ' '.join(commandList))
+                return
+        self.cacheToken = ResultCache.begin(commandList)
+        self.outputFrame.beginContent(commandList)
         try:
-            sub     = Popen(commandList, stdout=PIPE, stderr=STDOUT )
-            self.lastCommandRunTime = datetime.now()
-            output, error_message = sub.communicate()
-            outputText  = output.decode('utf-8')
+            self.streamingCommand = StreamingCommand(self, commandList, self.commandOutputReceiver)
+            self.lastCommandRunTime = self.streamingCommand.start()
         except Exception:
+            self.streamingCommand = None
             outputText = ''
             for line in exc_info():
                 outputText += str(line) + '\n'
-
-        self.outputFrame.setContent(outputText, commandList)
+            self.outputFrame.setContent(outputText, commandList)
+            return
+        self.cancelButton.configure(state=NORMAL)
+        self.messageLabel.configure(text="Running:  " + ' '.join(commandList))
+
+    def runPipeline(self, stages):
+        #   stages:  saved Tools or argv lists, run as an OS pipe chain, only the last stage's output arriving here.
+        #   Pipelines are not cached.
+        if self.streamingCommand is not None and self.streamingCommand.isRunning():
+            self.messageLabel.configure(text="Cancel or wait for the running command:  " +
+                                             ' '.join(self.streamingCommand.commandList))
+            return
+        self.cacheToken = None
+        try:
+            self.streamingCommand = StreamingPipeline(self, stages, self.commandOutputReceiver)
+            self.commandText.set(' '.join(self.streamingCommand.commandList))
+            self.outputFrame.beginContent(self.streamingCommand.commandList)
+            self.lastCommandRunTime = self.streamingCommand.start()
+        except Exception:
+            self.streamingCommand = None
+            outputText = ''
+            for line in exc_info():
+                outputText += str(line) + '\n'
+            self.outputFrame.setContent(outputText, [])
+            return
+        self.cancelButton.configure(state=NORMAL)
+        self.messageLabel.configure(text="Running:  " + ' '.join(self.streamingCommand.commandList))
+
+    def cancelLinuxTool(self):
+        if self.streamingCommand is not None:
+            self.streamingCommand.cancel()
+            self.messageLabel.configure(text="Cancelling:  " + ' '.join(self.streamingCommand.commandList))
+
+    def commandOutputReceiver(self, message: dict):
+        if message['action'] == 'output':
+            self.outputFrame.appendContent(message['text'])
+        elif message['action'] == 'finished':
+            self.cancelButton.configure(state=DISABLED)
+            commandText = ' '.join(self.streamingCommand.commandList)
+            if 'stages' in message:
+                #   Only the last stage's output is read here.
+                for process in self.streamingCommand.processes[:-1]:
+                    RunMetrics.record('Console pipeline', process)
+                RunMetrics.record('Console pipeline', self.streamingCommand.processes[-1], message['outputBytes'])
+            else:
+                RunMetrics.record('Console', self.streamingCommand.process, message['outputBytes'])
+            if message['cancelled']:
+                self.messageLabel.configure(text="Cancelled:  " + commandText)
+            else:
+                self.messageLabel.configure(text="Exit status " + str(message['returnCode']) + ":  " + commandText)
+                if 'stages' in message:
+                    #   Per stage exit status and seconds from the start of the pipeline to the stage's exit.
+                    self.messageLabel.configure(text="Exit status " + str(message['returnCode']) + ":  " +
+                        '  |  '.join(stage['commandLine'][0] + ' (' + str(stage['returnCode']) + ', ' +
+                                     str(round(stage['wallTime'], 3)) + ' s)' for stage in message['stages']))
+                ResultCache.put(self.cacheToken, self.lastCommandRunTime, message['text'], message['returnCode'])
+            self.cacheToken = None
+            self.outputFrame.endContent(message['text'], list(self.streamingCommand.commandList))
 
 
 def ExitProgram():
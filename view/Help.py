@@ -350,8 +350,11 @@ class HelpDialog(LabelFrame):
                     matchesAdapter.append(StrMatch(span))
                 matches = tuple(matchesAdapter)
             else:       #   ordinary string search
-                matches = matchManager.findAllInText(searchText, self.helpContent.contentMap[self.topicSelected],
-                                                     caseSensitive=caseSensitive, wordsOnly=wordsOnly)
+                matches = self.matchManager.findAllInText(searchText,
+                                                          self.helpContent.contentMap[self.topicSelected],
+                                                          caseSensitive=caseSensitive, wordsOnly=wordsOnly,
+                                                          docId=self.topicSelected,
+                                                          docVersion=self.helpContent.getVersion(self.topicSelected))
             #   matches is ordered, so:
             lastMatchIdx = [1, 0, 0, 0]  # line index, start character index, end character index
             matchCount = 0
@@ -121,6 +121,7 @@ from view.UtilityArgumentConfig import ConfigSettings
 from view.FrameScroller import FrameScroller
 from view.Console import ConsoleView
 from view.ToolManager import ToolManagerTabs, SynopsisPanel
+from service.Execution import ResultCache
 
 PROGRAM_TITLE           = "Linux Tool Manager"
 CLI_ACTIVE              = False
@@ -831,9 +832,8 @@ class ToolDesigner(LabelFrame):
             #   must run man on the file having isolated the name, all before first dot, instead, to get
             #   the correctly formatted output text.
             runnableName = fileName.split('.')[0]
-            sub = Popen(['man', runnableName], stdout=PIPE, stderr=STDOUT)
-            output, error_message = sub.communicate()
-            text = output.decode('utf-8')
+            #   Cached, so reopening the list for a folder does not run man for every page again.
+            text, cachedResult = ResultCache.run(('man', runnableName))
             manPageContent[fileName] = text
 
         geometryString = "900x500+350+50"
@@ -191,7 +191,6 @@ class ToolsTree(LabelFrame):
 
     def __init__(self, container, toolMap, toolSetIndex, **keyWordArguments):
         LabelFrame.__init__(self, container, keyWordArguments)
-        toolMap, toolSetIndex = ToolManDB.readDB()
 
         self.jsonTreeViewFrame = JsonTreeViewFrame(self, toolMap, {"listener": self.messageReceiver,
                                                                    "mode": JsonTreeView.MODE_STRICT}, width=700)
@@ -316,6 +315,56 @@ class ToolManagerTabs(Notebook):
         print("ToolManager.messageReceiver:\t" + str(message))
 
 
+class PipelineBuilder(LabelFrame):
+    """
+    Choose saved tools, in order, to run as a pipe chain, e.g. journalctl -o json | jq | sort.  Run sends
+        {'source': 'PipelineBuilder', 'action': 'run', 'stages': <tuple of Tool>}
+    to listener.
+    """
+    def __init__(self, container, listener, **keyWordArguments):
+        LabelFrame.__init__(self, container, keyWordArguments)
+        if listener is None or not callable(listener):
+            raise Exception("PipelineBuilder constructor - Invalid listener argument:  " + str(listener))
+        self.listener = listener
+        self.toolMap, toolSetIndex = ToolManDB.readDB()
+        self.stages = []
+
+        self.toolNameListbox    = Listbox(self, relief=SUNKEN, border=3, selectmode=SINGLE, width=30)
+        self.toolNameListbox.insert(END, *self.toolMap.keys())
+        self.toolNameListbox.bind('<Double-Button-1>', self.addStage)
+        self.stageListbox       = Listbox(self, relief=SUNKEN, border=3, selectmode=SINGLE, width=50)
+        self.addButton          = Button(self, text='Add >>', border=2, relief=RAISED, command=self.addStage)
+        self.removeButton       = Button(self, text='<< Remove', border=2, relief=RAISED, command=self.removeStage)
+        self.runButton          = Button(self, text='Run Pipeline', border=2, relief=RAISED, state=DISABLED,
+                                         command=self.runPipeline)
+
+        self.toolNameListbox.grid(row=0, column=0, rowspan=3, padx=10, pady=5, sticky="nsew")
+        self.addButton.grid(row=0, column=1, padx=5, pady=5)
+        self.removeButton.grid(row=1, column=1, padx=5, pady=5)
+        self.stageListbox.grid(row=0, column=2, rowspan=3, padx=10, pady=5, sticky="nsew")
+        self.runButton.grid(row=3, column=2, padx=10, pady=5, sticky="e")
+
+    def addStage(self, *args):
+        selection = self.toolNameListbox.curselection()
+        if len(selection) > 0:
+            tool = self.toolMap[self.toolNameListbox.get(selection[0])]
+            self.stages.append(tool)
+            self.stageListbox.insert(END, ' '.join(tool.getCommandLine()))
+            self.runButton.configure(state=NORMAL)
+
+    def removeStage(self, *args):
+        selection = self.stageListbox.curselection()
+        if len(selection) > 0:
+            del self.stages[selection[0]]
+            self.stageListbox.delete(selection[0])
+            if len(self.stages) == 0:
+                self.runButton.configure(state=DISABLED)
+
+    def runPipeline(self):
+        if len(self.stages) > 0:
+            self.listener({'source': 'PipelineBuilder', 'action': 'run', 'stages': tuple(self.stages)})
+
+
 class ToolManager(LabelFrame):
     """
     This is the master frame with the controls whic are applied to the various pages of the notebook which
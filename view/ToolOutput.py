@@ -19,26 +19,42 @@
 #       dialog for this purpose, so that the user had the data in front of them rather than needeing to be an
 #       expert in the use of these extraction and structuring tools using the pipe feature (which will be)
 #       in the tool designer (utility configurator) of this application.
+#       2026-10-19: The command is split into an argv list and run by service.Execution.ExecService, without a shell,
+#           on a worker thread, its output added to the Text as it arrives instead of after it has all been read.
+#           Shell syntax in the command text, pipes, redirection, $VARIABLES, is therefore not interpreted.
+#           The output is decoded with one incremental decoder across all of its pieces, as StreamingCommand does,
+#           so that a multi-byte character split between two pieces is not shown as two replacement characters.
+#           Destroying the ToolOutput kills its command, which would otherwise run on, e.g. journalctl -f, holding
+#           one of ExecService's helpers.
 #
 
 import os
+from shlex import split
+from codecs import getincrementaldecoder
+from threading import Thread
+from queue import SimpleQueue, Empty
 from tkinter import Tk, Toplevel, LabelFrame, Text, Button, Label, Scrollbar, \
                         SUNKEN, GROOVE, END, VERTICAL, HORIZONTAL, BOTH, BOTTOM, X, RIGHT, Y, E, W, N, S
 from tkinter.scrolledtext import ScrolledText
 
 from view import ProgrammableMenu
+from service.Execution import ExecService, ExecCancel
+
+OUTPUT_INTERVAL     = 50        #   milliseconds between additions of output to the Text
 
 class ToolOutput(LabelFrame):
     def __init__(self, container, name, **keyWordArguments):
         LabelFrame.__init__(self, container, name=name)
         if "frameConfig" in keyWordArguments and isinstance(keyWordArguments["frameConfig"], dict):
             self.config(keyWordArguments["frameConfig"])
-        outputChars = ''
+        self.commandText = None
+        self.outputQueue = SimpleQueue()
+        self.execCancel = ExecCancel()
+        self.afterId = None
+        #   A character split between two pieces of output is decoded once both have arrived.
+        self.decoder = getincrementaldecoder('utf-8')(errors='replace')
         if 'commandText' in keyWordArguments and isinstance(keyWordArguments['commandText'], str):
             self.commandText    = keyWordArguments['commandText']
-            outputStream    = os.popen(keyWordArguments['commandText'])
-            outputChars     = outputStream.read().strip()
-            outputStream.close()
 
         """
         Pack layout:
@@ -74,8 +90,50 @@ class ToolOutput(LabelFrame):
         horizontalScroller.config(command=outputText.xview)
         verticalScroller.config(command=outputText.yview)
 
-        outputText.insert(END, outputChars)
         outputText.config(state = 'disabled')
+        self.outputText = outputText
+
+        if self.commandText is not None and len(self.commandText.strip()) > 0:
+            Thread(target=self.runCommand, name="ToolOutput " + self.commandText, daemon=True).start()
+            self.afterId = self.after(OUTPUT_INTERVAL, self.showOutput)
+
+    def destroy(self):
+        #   The command, e.g. journalctl -f, would otherwise run on after its output has nowhere to go.
+        self.execCancel.cancel()
+        if self.afterId is not None:
+            self.after_cancel(self.afterId)
+            self.afterId = None
+        LabelFrame.destroy(self)
+
+    def runCommand(self):
+        #   Worker thread: only queues the output, since Tk widgets may only be used from the Tk thread.
+        try:
+            ExecService.execute(split(self.commandText), self.outputQueue.put, self.execCancel)
+        except Exception as error:
+            self.outputQueue.put(str(error).encode())
+        self.outputQueue.put(None)
+
+    def showOutput(self):
+        pieces = []
+        finished = False
+        while True:
+            try:
+                piece = self.outputQueue.get_nowait()
+            except Empty:
+                break
+            if piece is None:
+                finished = True
+                break
+            pieces.append(piece)
+        text = self.decoder.decode(b''.join(pieces), final=finished)
+        if len(text) > 0:
+            self.outputText.config(state='normal')
+            self.outputText.insert(END, text)
+            self.outputText.config(state='disabled')
+        if finished:
+            self.afterId = None
+        else:
+            self.afterId = self.after(OUTPUT_INTERVAL, self.showOutput)
 
 
 if __name__ == "__main__":
@@ -32,7 +32,8 @@ from view.ProgrammableMenu import ProgrammablePopup
 from view.ToolOutput import ToolOutput
 from view.FrameScroller import FrameScroller
 from model.ManPage import ManSection
-from view.ToolManager import ToolManagerTabs
+from view.ToolManager import ToolManagerTabs, PipelineBuilder
+from view.Console import ConsoleView
 from model.ToolDB import ToolManager, Tool
 
 
@@ -76,6 +77,7 @@ class ConfirmCommandLine(Toplevel):
         self.entryToolName = Entry(self, border=3, relief=SUNKEN, width=25, textvariable=self.toolNameVar)
         self.entryToolName.insert(END, "tool name")
         self.entryToolName.bind('<FocusIn>', self.entryNameFocused)
+        self.toolNameVar.trace_add("write", self.toolNameChanged)
 
         #   NEED: Tool Description Label and Entry
 
@@ -114,6 +116,7 @@ class ConfirmCommandLine(Toplevel):
         self.buttonSave.grid(row=3, column=0, columnspan=1, padx=10, pady=5)
         self.buttonCancel.grid(row=3, column=1, columnspan=1, padx=10, pady=5)
         self.checkboxViewSynopsis.grid(row=3, column=2, columnspan=2, padx=10, pady=10)
+        self.toolNameChanged()
 
     def setModel(self, optionsList: tuple):
         self.optionsIncluded = optionsList
@@ -133,9 +136,22 @@ class ConfirmCommandLine(Toplevel):
     def mouseLeave(self, event):
         event.widget.configure( fg='black')
 
+    def toolNameChanged(self, *args):
+        #   Runs on every keystroke: ToolManager.toolExists is a single probe of the unique tool name index.
+        toolName = self.toolNameVar.get().strip()
+        if len(toolName) == 0:
+            self.labelToolName.configure(text=" Tool Name: ")
+            self.buttonSave.configure(state=DISABLED)
+        elif ToolManager.toolExists(toolName):
+            self.labelToolName.configure(text=" Name in Use: ")
+            self.buttonSave.configure(state=DISABLED)
+        else:
+            self.labelToolName.configure(text=" Tool Name: ")
+            self.buttonSave.configure(state=NORMAL)
+
     def saveTool(self):
         print("saveTool")
-        toolName = self.entryToolName.get()
+        toolName = self.entryToolName.get().strip()
         if ToolManager.toolExists(toolName):
             messagebox.showwarning("Tool Name Exists", "There is a tool with the same name\n"
                                                        "in the database already:  " + toolName)
@@ -475,6 +491,8 @@ class ConfigSettings(LabelFrame):
         self.toolManagerToplevel = None
         self.toolManager = None
         self.confirmCommandLine = None
+        self.pipelineToplevel = None
+        self.pipelineConsole = None
 
         self.commandSettings = OrderedDict()
 
@@ -522,8 +540,8 @@ class ConfigSettings(LabelFrame):
                                         "call": lambda: self.menuItemHandler(featureName="Tool Manager")
                                     },
 
-                                    #   'Pipe': {'type': 'item', "call": lambda: self.menuItemHandler(featureName="Pipe",
-                                    #                                                              variable=None) },
+                                    'Pipe': {'type': 'item', "call": lambda: self.menuItemHandler(featureName="Pipe",
+                                                                                                  variable=None) },
                                     #   'Batch': {"type": 'item', "call": lambda: self.menuItemHandler(featureName="Batch") },
                                     #   'Edit': {"type": 'item', "call": lambda: self.menuItemHandler(featureName="Edit") },
                                     #   'Run': {"type": "item", "call": self.runCurrentConfiguration}
@@ -738,6 +756,14 @@ class ConfigSettings(LabelFrame):
                 if 'action' in message:
                     if message['action'] == 'cancelSaveTool':
                         self.exitCommandConfirm()
+            #   {'source': 'PipelineBuilder', 'action': 'run', 'stages': <tuple of Tool>}
+            elif message['source'] == "PipelineBuilder":
+                if 'action' in message and message['action'] == 'run':
+                    if self.pipelineConsole is not None and self.pipelineConsole.winfo_exists():
+                        self.pipelineConsole.runPipeline(message['stages'])
+                    else:
+                        self.pipelineConsole = ConsoleView(self.container, '1000x550+50+50', 'Pipeline Console',
+                                                           pipeline=message['stages'])
 
     def layoutRoffParse(self, roffOptionMap: OrderedDict):
         self.switchSectionFrames = OrderedDict()
@@ -788,6 +814,14 @@ class ConfigSettings(LabelFrame):
             else:
                 self.confirmCommandLine.setModel(optionsSelected)
             self.confirmCommandLine.mainloop()
+        elif featureName == "Pipe":
+            if self.pipelineToplevel is None:
+                self.pipelineToplevel = Toplevel(self)
+                self.pipelineToplevel.title("Pipe Tools")
+                self.pipelineToplevel.geometry("700x300+600+200")
+                self.pipelineToplevel.protocol('WM_DELETE_WINDOW', self.exitPipeline)
+                PipelineBuilder(self.pipelineToplevel, self.messageReceiver, text="Pipeline Stages",
+                                border=5, relief=RAISED).pack(expand=True, fill=BOTH)
         else:
             messagebox.showinfo(str(featureName), "Not Implemented Yet")
 
@@ -795,6 +829,10 @@ class ConfigSettings(LabelFrame):
         self.confirmCommandLine.destroy()
         self.confirmCommandLine = None
 
+    def exitPipeline(self):
+        self.pipelineToplevel.destroy()
+        self.pipelineToplevel = None
+
     def exitToolManager(self):
         self.toolManagerToplevel.destroy()
         self.toolManagerToplevel = None